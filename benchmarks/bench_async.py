@@ -0,0 +1,89 @@
+"""Chunk downloads per second of Bee and AsyncBee against a local mock Bee server.
+
+The server answers `GET /chunks/{address}` after a fixed delay standing in for the network
+and the node.
+
+Usage: python benchmarks/bench_async.py [number_of_chunks] [latency_ms]
+"""
+
+import asyncio
+import functools
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bee_py.async_bee import AsyncBee, _make_async_method
+from bee_py.bee import Bee
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.utils.hex import bytes_to_hex
+
+CHUNK = make_content_addressed_chunk(b"hello swarm" * 300)
+REFERENCE = bytes_to_hex(CHUNK.address)
+
+
+def serve(latency: float) -> ThreadingHTTPServer:
+    class MockBeeHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):  # noqa: N802
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(CHUNK.data)))
+            self.end_headers()
+            self.wfile.write(CHUNK.data)
+
+        def log_message(self, *args):
+            pass
+
+    class MockBeeServer(ThreadingHTTPServer):
+        # * the default backlog of 5 drops the connections opened at once by the concurrent clients
+        request_queue_size = 256
+
+    server = MockBeeServer(("127.0.0.1", 0), MockBeeHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"  {name:<36} {number / seconds:>10.0f} chunks/sec {seconds:>8.3f} s")  # noqa: T201
+
+
+# * `Bee.download_chunk` run on the thread pool of AsyncBee, how it was sent before the aiohttp transport
+threaded_download_chunk = _make_async_method(Bee.download_chunk)
+
+
+async def download_async(url: str, number: int, max_concurrency: int, threaded: bool) -> None:  # noqa: FBT001
+    async with AsyncBee(url, max_concurrency=max_concurrency) as bee:
+        download = functools.partial(threaded_download_chunk, bee) if threaded else bee.download_chunk
+        await asyncio.gather(*(download(REFERENCE) for _ in range(number)))
+
+
+def main(number: int = 500, latency_ms: int = 20) -> None:
+    server = serve(latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{number} chunk downloads with {latency_ms} ms latency")  # noqa: T201
+
+    bee = Bee(url)
+    start = time.perf_counter()
+    for _ in range(number):
+        bee.download_chunk(REFERENCE)
+    report("Bee, sequential", number, time.perf_counter() - start)
+
+    for max_concurrency in (8, 64):
+        for threaded in (True, False):
+            start = time.perf_counter()
+            asyncio.run(download_async(url, number, max_concurrency, threaded))
+            transport = "threads" if threaded else "aiohttp"
+            report(f"AsyncBee, {max_concurrency} concurrent, {transport}", number, time.perf_counter() - start)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,42 @@
+"""Chunks per second of the BMT engines.
+
+The engines created by `make_bmt_engine` use the keccak256 of `safe-pysha3` when it is installed
+(the `sha3` extra). Both engines are also measured with `eth_utils.keccak`, so the gain of the
+buffered engine can be told apart from the gain of the hasher.
+
+Usage: python benchmarks/bench_bmt.py [number_of_chunks]
+"""
+
+import os
+import sys
+import timeit
+
+from bee_py.chunk.bmt import MAX_CHUNK_PAYLOAD_SIZE, BufferedBMTEngine, PythonBMTEngine, keccak_256, make_bmt_engine
+
+PAYLOAD_SIZES = (40, 1024, MAX_CHUNK_PAYLOAD_SIZE)
+
+
+def chunks_per_second(engine, payload: bytes, number: int) -> float:
+    return number / timeit.timeit(lambda: engine.root_hash(payload), number=number)
+
+
+def main(number: int = 1000) -> None:
+    engines = {
+        # * the implementation before pluggable engines: eth_utils.keccak with a new buffer per level
+        "before (python + eth_utils)": PythonBMTEngine(),
+        "buffered + eth_utils": BufferedBMTEngine(),
+        "python": make_bmt_engine("python"),
+        "buffered": make_bmt_engine("buffered"),
+    }
+
+    print(f"keccak256 of make_bmt_engine: {'safe-pysha3' if keccak_256 is not None else 'eth_utils'}")  # noqa: T201
+
+    for size in PAYLOAD_SIZES:
+        payload = os.urandom(size)
+        print(f"payload {size} bytes")  # noqa: T201
+        for name, engine in engines.items():
+            print(f"  {name:<30} {chunks_per_second(engine, payload, number):>10.0f} chunks/sec")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
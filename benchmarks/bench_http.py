@@ -0,0 +1,48 @@
+"""Per-request overhead of building the request config, measured against a no-op transport.
+
+Usage: python benchmarks/bench_http.py [number_of_requests]
+"""
+
+import sys
+import timeit
+
+import requests
+
+from bee_py.modules import chunk as chunk_api
+from bee_py.types.type import BeeRequestOptions
+from bee_py.utils.http import RequestTemplate
+
+BEE_URL = "http://localhost:1633"
+REFERENCE = "ca6357a08e317d15ec560fef34e4c45f8f19f01c372aa70f1da72bfa7f1a4338"
+
+
+class NoopSession:
+    """Stands in for `requests.Session`, answering every request without any transport."""
+
+    def __init__(self):
+        self.response = requests.Response()
+        self.response.status_code = 200
+        self.response._content = b""
+
+    def request(self, **kwargs):  # noqa: ARG002
+        return self.response
+
+
+def main(number: int = 100_000) -> None:
+    options = BeeRequestOptions.model_validate({"baseURL": BEE_URL, "session": NoopSession()})
+    variants = {
+        # * what Bee passed before: the options model, dumped and deep merged on every call
+        "before (BeeRequestOptions)": options,
+        "before (dict)": options.model_dump(),
+        "RequestTemplate": RequestTemplate(options),
+        "RequestTemplate (coalesce=False)": RequestTemplate({**options.model_dump(), "coalesce": False}),
+    }
+
+    print(f"chunk download overhead with a no-op transport, {number} requests")  # noqa: T201
+    for name, request_options in variants.items():
+        seconds = timeit.timeit(lambda o=request_options: chunk_api.download(o, REFERENCE), number=number)
+        print(f"  {name:<34} {seconds / number * 1e6:>8.1f} us/request")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,76 @@
+"""Owner recoveries per second of single owner chunk signatures, by backend and through the cache.
+
+`recover_public_key` uses `coincurve` when it is installed (the `coincurve` extra) and `eth_keys`
+otherwise. `eth_keys` itself uses `coincurve` as its backend when it can, so its numbers depend on
+it as well. The backends used are printed before the results.
+
+Usage: python benchmarks/bench_recover.py [number_of_signatures]
+"""
+
+import os
+import sys
+import timeit
+from hashlib import sha3_256
+
+from ecdsa import SECP256k1, VerifyingKey  # type: ignore
+from eth_keys import KeyAPI, keys
+
+from bee_py.chunk import signer as signer_module
+from bee_py.chunk.signer import hash_with_ethereum_prefix, make_private_key_signer, recover_address, recover_public_key
+
+
+def ecdsa_recover_public_key(signature: bytes, digest: bytes) -> bytes:
+    # * the implementation before `recover_public_key`, picking the key of the recovery id
+    keys = VerifyingKey.from_public_key_recovery_with_digest(
+        signature[:64], hash_with_ethereum_prefix(digest), SECP256k1, sha3_256
+    )
+    return keys[signature[64] - 27].to_string()
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"  {name:<30} {number / seconds:>12.0f} recoveries/sec {seconds:>8.3f} s")  # noqa: T201
+
+
+def main(number: int = 500) -> None:
+    signer = make_private_key_signer(os.urandom(32))
+    signatures = [(signer.sign_digest(digest), digest) for digest in (os.urandom(32) for _ in range(number))]
+
+    def backend_recover(backend):
+        # * what `recover_public_key` does with the backend, without the validation
+        return lambda signature, digest: backend(
+            signature[:64] + bytes((signature[64] - 27,)), hash_with_ethereum_prefix(digest)
+        )
+
+    native_keys = KeyAPI("eth_keys.backends.NativeECCBackend")
+
+    def native_recover_public_key(signature: bytes, message_hash: bytes) -> bytes:
+        # * what the eth_keys fallback does without coincurve installed
+        return native_keys.ecdsa_recover(message_hash, keys.Signature(signature)).to_bytes()
+
+    variants = {
+        "ecdsa": ecdsa_recover_public_key,
+        "eth_keys (native backend)": backend_recover(native_recover_public_key),
+        "eth_keys": backend_recover(signer_module._eth_keys_recover_public_key),
+        "recover_public_key": recover_public_key,
+    }
+    if signer_module.coincurve is not None:
+        variants["coincurve"] = backend_recover(signer_module._coincurve_recover_public_key)
+
+    expected = signer.public_key.to_bytes()
+    print(f"recovering {number} signers")  # noqa: T201
+    print(f"  recover_public_key backend: {signer_module._recover_public_key.__name__}")  # noqa: T201
+    print(f"  eth_keys backend: {type(keys.backend).__name__}")  # noqa: T201
+    for name, recover in variants.items():
+        if any(recover(signature, digest) != expected for signature, digest in signatures[:10]):
+            msg = f"{name} recovers another public key"
+            raise AssertionError(msg)
+        seconds = timeit.timeit(lambda f=recover: [f(*pair) for pair in signatures], number=1)
+        report(name, number, seconds)
+
+    [recover_address(*pair) for pair in signatures]
+    seconds = timeit.timeit(lambda: [recover_address(*pair) for pair in signatures], number=1)
+    report("recover_address (cached)", number, seconds)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
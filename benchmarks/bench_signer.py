@@ -0,0 +1,46 @@
+"""Signatures per second of single owner chunk digests, through ape and with the raw private key.
+
+Usage: python benchmarks/bench_signer.py [number_of_signatures]
+"""
+
+import os
+import sys
+import timeit
+
+from ape import accounts
+
+from bee_py.chunk.signer import make_private_key_signer, sign
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"  {name:<30} {number / seconds:>12.0f} signatures/sec {seconds:>8.3f} s")  # noqa: T201
+
+
+def main(number: int = 2_000) -> None:
+    account = accounts.test_accounts[0]
+    signer = make_private_key_signer(account.private_key)
+    digests = [os.urandom(32) for _ in range(number)]
+
+    fallback_signer = make_private_key_signer(account.private_key)
+    # * what the signer does without coincurve installed
+    fallback_signer._signing_key = None
+
+    variants = {
+        "ape account (sign)": lambda digest: sign(data=digest, account=account).encode_rsv(),  # type: ignore
+        "PrivateKeySigner (eth_keys)": fallback_signer.sign_digest,
+    }
+    if signer._signing_key is not None:
+        variants["PrivateKeySigner (coincurve)"] = signer.sign_digest
+
+    expected = [variants["ape account (sign)"](digest) for digest in digests[:10]]
+    print(f"signing {number} digests")  # noqa: T201
+    for name, sign_digest in variants.items():
+        if [sign_digest(digest) for digest in digests[:10]] != expected:
+            msg = f"{name} signs differently from the ape account"
+            raise AssertionError(msg)
+        seconds = timeit.timeit(lambda f=sign_digest: [f(digest) for digest in digests], number=1)
+        report(name, number, seconds)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,53 @@
+"""Chunk address verification over many chunks.
+
+Usage: python benchmarks/bench_verify.py [number_of_chunks] [payload_size]
+"""
+
+import os
+import sys
+import timeit
+
+from bee_py.chunk.bmt import bmt_hash
+from bee_py.chunk.cac import is_valid_chunk_data, make_content_addressed_chunks
+from bee_py.utils.bytes import bytes_equal
+
+
+def generator_bytes_equal(a: bytes, b: bytes) -> bool:
+    # * the implementation before `hmac.compare_digest`
+    if len(a) != len(b):
+        return False
+
+    return all(a[i] == b[i] for i in range(len(a)))
+
+
+def generator_is_valid_chunk_data(data: bytes, chunk_address: bytes) -> bool:
+    # * the implementation before `bmt_address`
+    if not isinstance(data, bytes):
+        return False
+
+    return generator_bytes_equal(bmt_hash(data), chunk_address)
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"  {name:<30} {number / seconds:>12.0f} chunks/sec {seconds:>8.3f} s")  # noqa: T201
+
+
+def main(number: int = 100_000, payload_size: int = 64) -> None:
+    chunks = [
+        (chunk.data, bytes(chunk.address))
+        for chunk in make_content_addressed_chunks((os.urandom(payload_size) for _ in range(number)), max_workers=1)
+    ]
+
+    print(f"bytes_equal of {number} addresses")  # noqa: T201
+    for name, equal in (("before (generator)", generator_bytes_equal), ("compare_digest", bytes_equal)):
+        seconds = timeit.timeit(lambda f=equal: [f(address, address) for _, address in chunks], number=1)
+        report(name, number, seconds)
+
+    print(f"is_valid_chunk_data of {number} chunks with {payload_size} bytes payload")  # noqa: T201
+    for name, is_valid in (("before", generator_is_valid_chunk_data), ("after", is_valid_chunk_data)):
+        seconds = timeit.timeit(lambda f=is_valid: all(f(data, address) for data, address in chunks), number=1)
+        report(name, number, seconds)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,210 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Optional, Union
+
+import aiohttp
+
+from bee_py.bee import Bee
+from bee_py.bee_debug import BeeDebug
+from bee_py.modules import bytes as bytes_api
+from bee_py.modules import chunk as chunk_api
+from bee_py.types.type import (
+    BatchId,
+    BeeOptions,
+    BeeRequestOptions,
+    Data,
+    Reference,
+    ReferenceOrENS,
+    ReferenceResponse,
+    UploadOptions,
+)
+from bee_py.utils.http import RequestTemplate
+from bee_py.utils.type import assert_chunk_data, assert_reference_or_ens, assert_request_options, assert_upload_options
+
+# * number of calls running at the same time, also the number of pooled connections by default
+DEFAULT_ASYNC_CONCURRENCY = 64
+
+
+def _make_async_method(method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def coroutine_method(self, *args, **kwargs):
+            return await method(self._client, *args, **kwargs)
+
+        return coroutine_method
+
+    @functools.wraps(method)
+    async def async_method(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, self._client, *args, **kwargs))
+
+    return async_method
+
+
+def _native(sync_method: Callable) -> Callable:
+    """Marks a coroutine sending its requests with aiohttp as the counterpart of a synchronous method."""
+
+    def decorator(method: Callable) -> Callable:
+        method.__doc__ = sync_method.__doc__
+        return method
+
+    return decorator
+
+
+class AsyncClient:
+    """
+    Base class of the asyncio clients, thread pool wrappers of the synchronous clients.
+
+    A subclass gets an `async` counterpart of every public method of its `sync_class`. By
+    default the counterpart runs the blocking synchronous method, sharing all its validation
+    and parsing, on a pool of `max_concurrency` threads which send their requests over the
+    pooled `requests` session of the client. The event loop is not blocked, but every call
+    in flight holds a thread. Methods which are already coroutines are awaited directly.
+
+    Only the methods defined by the subclass itself send their requests natively with an
+    `aiohttp.ClientSession` through `async_http`, building the requests and parsing the
+    responses with the same module code as the synchronous client. They are retried like it,
+    but not hedged or coalesced.
+
+    Attributes which are not methods, e.g. `url` or `session`, are read from the synchronous
+    client.
+    """
+
+    sync_class: ClassVar[type]
+
+    def __init_subclass__(cls, sync_class: type, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.sync_class = sync_class
+
+        for name, member in vars(sync_class).items():
+            if name.startswith("_") or name in vars(cls) or not inspect.isfunction(member):
+                continue
+            setattr(cls, name, _make_async_method(member))
+
+    def __init__(
+        self,
+        url: str,
+        options: Optional[Union[BeeOptions, dict]] = None,
+        max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    ):
+        """
+        Constructs a new asyncio client.
+
+        Args:
+            url: URL on which is the API of Bee node exposed.
+            options: Additional options for the client, like for the synchronous one. Unless set,
+                `pool_size` defaults to `max_concurrency`.
+            max_concurrency: Maximum number of calls running at the same time.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency has to be a positive integer, got {max_concurrency}"
+            raise ValueError(msg)
+        if isinstance(options, BeeOptions):
+            options = options.model_dump(by_alias=True, exclude_unset=True)
+
+        options = {"pool_size": max_concurrency, **(options or {})}
+
+        self._client = self.sync_class(url, options)
+        # * a session passed in the options belongs to the caller, who closes it
+        self._owns_session = not options.get("session")
+        self._executor = ThreadPoolExecutor(max_concurrency, thread_name_prefix=type(self).__name__)
+        self._max_concurrency = max_concurrency
+        # * created by the first native call, an aiohttp session has to be made in the event loop
+        self._request_template: Optional[RequestTemplate] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    def _get_request_options_for_call(
+        self, options: Optional[Union[BeeRequestOptions, dict]] = None
+    ) -> RequestTemplate:
+        """Returns the request template of a native call, sending its requests with the aiohttp session."""
+        if self._request_template is None:
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._max_concurrency))
+            self._request_template = self._client.request_template.with_overrides({"session": session})
+        if not options:
+            return self._request_template
+        if isinstance(options, BeeRequestOptions):
+            options = options.model_dump()
+
+        return self._request_template.with_overrides({**options, "session": self._request_template.session})
+
+    async def aclose(self) -> None:
+        """Waits for the running calls and closes the connections of the client."""
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+        if self._request_template is not None:
+            await self._request_template.session.close()
+        if self._owns_session:
+            self._client.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class AsyncBee(AsyncClient, sync_class=Bee):
+    """
+    The asyncio counterpart of `Bee`.
+
+    Every public method of `Bee` is available as a coroutine with the same arguments, e.g.
+    `await bee.download_chunk(reference)`, so thousands of operations can be awaited together
+    with `asyncio.gather` while at most `max_concurrency` requests are sent at once.
+
+    Only `upload_chunk`, `download_chunk` and `download_data` are sent natively with aiohttp.
+    Every other method, including the feed, single owner chunk and file methods, runs `Bee`
+    on the thread pool.
+    """
+
+    @_native(Bee.upload_chunk)
+    async def upload_chunk(
+        self,
+        postage_batch_id: Union[BatchId, str],
+        data: Union[bytes, bytearray, memoryview],
+        options: Optional[UploadOptions] = None,
+        request_options: Optional[BeeRequestOptions] = None,
+    ) -> Reference:
+        assert_chunk_data(data)
+        if options:
+            assert_upload_options(options)
+
+        return await chunk_api.upload_async(
+            self._get_request_options_for_call(request_options), data, postage_batch_id, options  # type: ignore
+        )
+
+    @_native(Bee.download_chunk)
+    async def download_chunk(self, reference: ReferenceOrENS, options: Optional[BeeRequestOptions] = None) -> Data:
+        assert_request_options(options)
+        assert_reference_or_ens(reference)
+
+        return await chunk_api.download_async(
+            self._get_request_options_for_call(options), reference, self._client.content_cache
+        )
+
+    @_native(Bee.download_data)
+    async def download_data(self, reference: ReferenceOrENS, options: Optional[BeeRequestOptions] = None) -> Data:
+        assert_request_options(options)
+        assert_reference_or_ens(reference)
+        if isinstance(reference, dict):
+            reference = reference.get("reference", None)
+        if isinstance(reference, (ReferenceResponse, Reference)):
+            reference = str(reference)
+
+        return await bytes_api.download_async(
+            self._get_request_options_for_call(options), reference, self._client.content_cache
+        )
+
+
+class AsyncBeeDebug(AsyncClient, sync_class=BeeDebug):
+    """
+    The asyncio counterpart of `BeeDebug`.
+
+    Every public method of `BeeDebug` is available as a coroutine with the same arguments. None
+    of them is native, they all run `BeeDebug` on the thread pool.
+    """
@@ -1,16 +1,33 @@
 import os
+from collections.abc import Iterable
 from time import sleep
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
+import requests
 import websockets
 from ape.managers.accounts import AccountAPI
 from ape.types import AddressType
 from eth_pydantic_types import HexBytes
-from requests import HTTPError, Response
+from requests import HTTPError
 from swarm_cid import ReferenceType
 
+from bee_py.chunk.joiner import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    ChunkCache,
+    JoinerSink,
+    download_data_parallel,
+    read_range,
+)
 from bee_py.chunk.soc import Identifier, download_single_owner_chunk, upload_single_owner_chunk_data
+from bee_py.chunk.uploader import (
+    DEFAULT_CHUNK_UPLOAD_RETRIES,
+    DEFAULT_UPLOAD_CONCURRENCY,
+    ChunkUploadCallback,
+    PipelinedSOCWriter,
+    upload_data_parallel,
+)
 from bee_py.feed import json as json_api
+from bee_py.feed.cursor import FeedIndexCursor
 from bee_py.feed.feed import make_feed_reader as _make_feed_reader
 from bee_py.feed.feed import make_feed_writer as _make_feed_writer
 from bee_py.feed.retrievable import are_all_sequential_feeds_update_retrievable
@@ -27,8 +44,6 @@ from bee_py.modules import tag as tag_api
 from bee_py.modules.debug import stamps
 from bee_py.modules.feed import create_feed_manifest as _create_feed_manifest
 from bee_py.types.type import (
-    CHUNK_SIZE,
-    SPAN_SIZE,
     STAMPS_DEPTH_MAX,
     STAMPS_DEPTH_MIN,
     AddressPrefix,
@@ -54,6 +69,7 @@ from bee_py.types.type import (
     PostageBatchOptions,
     PssMessageHandler,
     PssSubscription,
+    ReadableFileData,
     Reference,
     ReferenceCidOrENS,
     ReferenceOrENS,
@@ -68,15 +84,18 @@ from bee_py.types.type import (
     UploadResultWithCid,
 )
 from bee_py.utils.bytes import wrap_bytes_with_helpers
+from bee_py.utils.cache import ContentCache, make_content_cache_from_options
 from bee_py.utils.collection import assert_collection, make_collection_from_file_list
-from bee_py.utils.data import prepare_websocket_data
+from bee_py.utils.data import DEFAULT_READ_SIZE, ReadableStream, UploadData, prepare_websocket_data
 from bee_py.utils.error import BeeArgumentError, BeeError
 from bee_py.utils.eth import make_eth_address, make_hex_eth_address
+from bee_py.utils.http import RequestTemplate, make_session_from_options
 from bee_py.utils.type import (
     add_cid_conversion_function,
     assert_address_prefix,
     assert_all_tags_options,
     assert_batch_id,
+    assert_chunk_data,
     assert_collection_upload_options,
     assert_data,
     assert_directory,
@@ -90,6 +109,7 @@ from bee_py.utils.type import (
     assert_reference,
     assert_reference_or_ens,
     assert_request_options,
+    assert_upload_data,
     assert_upload_options,
     make_reference_or_ens,
     make_tag_uid,
@@ -116,6 +136,16 @@ class Bee:
     signer: Optional[Signer]
     # Ky instance that defines connection to Bee node
     request_options: BeeRequestOptions
+    # Pooled session shared by all the calls of the instance, safe to use from several threads
+    session: requests.Session
+    # Request options compiled once from `request_options` for the calls of the instance
+    request_template: RequestTemplate
+    # Intermediate chunks kept between range reads
+    chunk_cache: ChunkCache
+    # Cache of the immutable downloads, when enabled with the `cache_size` or `cache_dir` options
+    content_cache: Optional[ContentCache]
+    # Next indexes of the feeds written by the instance, stored in the `feed_index_path` file when set
+    feed_index_cursor: FeedIndexCursor
 
     def __init__(self, url: str, options: Optional[Union[BeeOptions, dict]] = None):
         """
@@ -141,20 +171,31 @@ class Bee:
         if options and "signer" in options:
             self.signer = options["signer"]
 
+        self.chunk_cache = ChunkCache()
+        self.content_cache = make_content_cache_from_options(options)
+        self.feed_index_cursor = FeedIndexCursor((options or {}).get("feed_index_path"))
+        self.session = make_session_from_options(options)
         self.request_options = BeeRequestOptions.model_validate(
             {
                 "baseURL": self.url,
+                "session": self.session,
                 **(
                     {
                         "timeout": options.get("timeout", 300),
                         "headers": options.get("headers", {}),
                         "onRequest": options.get("onRequest", True),
+                        # * invalid counts are reported by the calls given them
+                        "retry": options["retry"] if isinstance(options.get("retry"), int) else 0,
+                        "retry_policy": options.get("retry_policy"),
+                        "hedge": options.get("hedge"),
+                        "coalesce": options.get("coalesce", True),
                     }
                     if options
                     else {}
                 ),
             }
         )
+        self.request_template = RequestTemplate(self.request_options)
 
     def __get_request_options_for_call(
         self,
@@ -172,14 +213,12 @@ class Bee:
         if options:
             if isinstance(options, (JsonFeedOptions, BeeRequestOptions, AllTagsOptions)):
                 options = options.model_dump()  # type: ignore
-            if isinstance(
-                self.request_options,
-                (JsonFeedOptions, BeeRequestOptions, AllTagsOptions),
-            ):
-                self.request_options = self.request_options.model_dump()  # type: ignore
-            return {**self.request_options, **options}  # type: ignore
+            # * calls with their own options still go through the pooled session
+            return self.request_template.with_overrides(
+                {**options, "session": options.get("session") or self.session}  # type: ignore
+            )
         else:
-            return self.request_options
+            return self.request_template
 
     def __make_feed_reader(
         self,
@@ -262,16 +301,19 @@ class Bee:
     def upload_data(
         self,
         postage_batch_id: Union[str, BatchId],
-        data: Union[str, bytes],
+        data: UploadData,
         options: Optional[UploadOptions] = None,
         request_options: Optional[BeeRequestOptions] = None,
     ) -> UploadResult:
         """
         Upload data to a Bee node.
 
+        Paths (`os.PathLike`), file-like objects and iterators of bytes are streamed to the node,
+        so the memory used does not depend on the size of the data.
+
         Args:
             postage_batch_id (str): Postage BatchId to be used to upload the data with.
-            data (Any): Data to be uploaded.
+            data (str | bytes | PathLike | IO | Iterator[bytes]): Data to be uploaded.
             options (dictHTTP error): Additional options like tag, encryption, pinning,
             content-type and request options. Defaults to None.
 
@@ -286,13 +328,66 @@ class Bee:
             Bee API reference - `POST /bytes`: https://docs.ethswarm.org/api/#tag/Bytes/paths/~1bytes/post
         """
         assert_batch_id(postage_batch_id)
-        assert_data(data)
+        assert_upload_data(data)
         if options:
             assert_upload_options(options)
         if request_options:
             assert_request_options(request_options)
         return bytes_api.upload(self.__get_request_options_for_call(request_options), data, postage_batch_id, options)
 
+    def upload_data_parallel(
+        self,
+        postage_batch_id: Union[str, BatchId],
+        data: Union[str, bytes, IO, Iterable[bytes]],
+        options: Optional[UploadOptions] = None,
+        request_options: Optional[BeeRequestOptions] = None,
+        max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+        on_chunk_uploaded: Optional[ChunkUploadCallback] = None,
+    ) -> UploadResult:
+        """
+        Upload data to a Bee node chunk by chunk over several connections.
+
+        The data is split into its chunk tree locally and every chunk is uploaded to `/chunks`,
+        so the reference is the same as the one returned by `upload_data`. Failed chunks are
+        retried individually and every returned chunk reference is verified.
+
+        Args:
+            postage_batch_id (str): Postage BatchId to be used to upload the data with.
+            data (str | bytes | IO | Iterable[bytes]): Data to be uploaded, file objects and iterables are streamed.
+            options (UploadOptions): Additional options like tag, encryption and pinning.
+            request_options (BeeRequestOptions): Options that affect the request behavior.
+            max_concurrency (int): Maximum number of chunks uploaded at the same time.
+            retries (int): How many times a failed chunk upload is retried.
+            on_chunk_uploaded (Callable): Called with every chunk and its reference once it is uploaded.
+
+        Returns:
+            UploadResult: reference is a content hash of the data.
+
+        Raises:
+            TypeError: If the postage_batch_id or options are not of the correct types.
+            BeeError: If the node returned an unexpected reference for a chunk.
+
+        See Also:
+            Bee API reference - `POST /chunks`: https://docs.ethswarm.org/api/#tag/Chunk/paths/~1chunks/post
+        """
+        assert_batch_id(postage_batch_id)
+        if options:
+            assert_upload_options(options)
+        if request_options:
+            assert_request_options(request_options)
+        assert_positive_integer(max_concurrency, "max_concurrency")
+
+        return upload_data_parallel(
+            self.__get_request_options_for_call(request_options),
+            data,
+            postage_batch_id,
+            options,
+            max_concurrency,
+            retries,
+            on_chunk_uploaded,
+        )
+
     def download_data(self, reference: ReferenceOrENS, options: Optional[BeeRequestOptions] = None) -> Data:
         """
         Download data as a byte array.
@@ -320,32 +415,125 @@ class Bee:
         if isinstance(reference, (ReferenceResponse, Reference)):
             reference = str(reference)
 
-        return bytes_api.download(self.__get_request_options_for_call(options), reference)
+        return bytes_api.download(self.__get_request_options_for_call(options), reference, self.content_cache)
+
+    def download_data_parallel(
+        self,
+        reference: Union[str, bytes, Reference],
+        sink: JoinerSink,
+        options: Optional[BeeRequestOptions] = None,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    ) -> int:
+        """
+        Download data chunk by chunk over several connections, writing it to the sink in order.
+
+        The chunk tree of the data is walked locally, the chunks are fetched from `/chunks`
+        concurrently and every chunk is verified against its address before it is written.
+
+        Args:
+            reference (str, bytes, Reference): Bee data reference of non-encrypted data.
+            sink (IO | Callable): Binary file-like object or callable receiving the content.
+            options (BeeRequestOptions): Options that affect the request behavior.
+            max_concurrency (int): Maximum number of chunks downloaded at the same time.
+
+        Returns:
+            int: The number of bytes written to the sink.
+
+        Raises:
+            TypeError: If some of the input parameters is not of the expected type.
+            BeeError: If a chunk does not match its address or the chunk tree is malformed.
+
+        See Also:
+            Bee API reference - `GET /chunks`: https://docs.ethswarm.org/api/#tag/Chunk/paths/~1chunks~1{address}/get
+        """
+        assert_request_options(options)
+        assert_positive_integer(max_concurrency, "max_concurrency")
+
+        return download_data_parallel(self.__get_request_options_for_call(options), reference, sink, max_concurrency)
+
+    def read_range(
+        self,
+        reference: Union[str, bytes, Reference],
+        offset: int,
+        length: int,
+        options: Optional[BeeRequestOptions] = None,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    ) -> Data:
+        """
+        Read a byte range of the data without downloading all of it.
+
+        Only the chunks covering the range are fetched from `/chunks`, using the spans of the
+        chunk tree to find them. Intermediate chunks are kept in `chunk_cache`, so repeated
+        reads of the same data need fewer requests. A range reaching past the end of the data
+        is cut at the end of the data.
+
+        Args:
+            reference (str, bytes, Reference): Bee data reference of non-encrypted data.
+            offset (int): Offset of the first byte to read.
+            length (int): Number of bytes to read.
+            options (BeeRequestOptions): Options that affect the request behavior.
+            max_concurrency (int): Maximum number of chunks downloaded at the same time.
+
+        Returns:
+            Data: The bytes of the range.
+
+        Raises:
+            TypeError: If some of the input parameters is not of the expected type.
+            BeeArgumentError: If the offset or length is negative.
+            BeeError: If a chunk does not match its address or the chunk tree is malformed.
+
+        See Also:
+            Bee API reference - `GET /chunks`: https://docs.ethswarm.org/api/#tag/Chunk/paths/~1chunks~1{address}/get
+        """
+        assert_request_options(options)
+        assert_positive_integer(max_concurrency, "max_concurrency")
+
+        data = read_range(
+            self.__get_request_options_for_call(options),
+            reference,
+            offset,
+            length,
+            max_concurrency,
+            self.chunk_cache,
+        )
+
+        return wrap_bytes_with_helpers(data)
 
     def download_readable_data(
-        self, reference: ReferenceOrENS, options: Optional[BeeRequestOptions] = None
-    ) -> Response:
+        self,
+        reference: ReferenceOrENS,
+        options: Optional[BeeRequestOptions] = None,
+        read_size: int = DEFAULT_READ_SIZE,
+    ) -> ReadableStream:
         """
         Downloads data as a Readable stream.
 
+        The data is read from the connection as the stream is consumed, so iterating the stream
+        or saving it with `save(path_or_fd)` takes constant memory whatever the size of the data.
+
         Args:
             reference (ReferenceOrENS): Bee data reference in hex string (either 64 or 128 chars long) or ENS domain.
             options (BeeRequestOptions): Options that affect the request behavior.
+            read_size (int): Size of the pieces the stream is iterated and saved in.
 
         Raises:
             TypeError: If some of the input parameters are not the expected type.
             BeeArgumentError: If an ENS domain with invalid unicode characters is passed.
+
+        Returns:
+            ReadableStream: Binary file-like object of the data, close it when it is not read to the end.
         """
 
         assert_request_options(options)
         assert_reference_or_ens(reference)
+        assert_positive_integer(read_size, "read_size")
 
-        return bytes_api.download_readable(self.__get_request_options_for_call(options), reference)
+        return bytes_api.download_readable(self.__get_request_options_for_call(options), reference, read_size)
 
     def upload_chunk(
         self,
         postage_batch_id: Union[BatchId, str],
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview],
         options: Optional[UploadOptions] = None,
         request_options: Optional[BeeRequestOptions] = None,
     ) -> Reference:
@@ -354,7 +542,8 @@ class Bee:
 
         Args:
             postage_batch_id (BatchId): The Postage Batch ID to use for uploading the chunk.
-            data (bytes): The raw chunk data to be uploaded.
+            data (bytes | bytearray | memoryview): The raw chunk data to be uploaded, e.g. the
+            `data` of a `RawChunk`, which is sent without being copied.
             options (UploadOptions): Additional options for the upload, such as tag, encryption,
             pinning, content-type, and request options.
             request_options (BeeRequestOptions): Options that affect the request behavior.
@@ -363,18 +552,7 @@ class Bee:
             Reference: The content hash of the uploaded data.
         """
 
-        if not isinstance(data, bytes):
-            msg = "Data must be a bytes object!"
-            raise TypeError(msg)
-
-        if len(data) < SPAN_SIZE:
-            msg = f"Chunk must have a minimum size of {SPAN_SIZE} bytes. Received chunk size: {len(data)}"
-            raise BeeArgumentError(msg, data)
-
-        if len(data) > CHUNK_SIZE + SPAN_SIZE:
-            msg = f"Chunk must have a maximum size of {CHUNK_SIZE} bytes. Received chunk size: {len(data)}"
-            raise BeeArgumentError(msg, data)
-
+        assert_chunk_data(data)
         if options:
             assert_upload_options(options)
 
@@ -404,12 +582,12 @@ class Bee:
         assert_request_options(options)
         assert_reference_or_ens(reference)
 
-        return chunk_api.download(self.__get_request_options_for_call(options), reference)
+        return chunk_api.download(self.__get_request_options_for_call(options), reference, self.content_cache)
 
     def upload_file(
         self,
         postage_batch_id: Union[BatchId, str],
-        data: Union[bytes, str],
+        data: UploadData,
         name: Optional[str] = None,
         options: Optional[FileUploadOptions] = None,
         request_options: Optional[BeeRequestOptions] = None,
@@ -417,10 +595,14 @@ class Bee:
         """
         Uploads a single file to a Bee node.
 
+        Paths (`os.PathLike`), file-like objects and iterators of bytes are streamed to the node,
+        so the memory used does not depend on the size of the file.
+
         Args:
             postage_batch_id (str): The Postage Batch ID to use for uploading the data.
-            data (bytes, str): The data or file to be uploaded.
-            name (strHTTP error): The optional name of the uploaded file.
+            data (bytes, str, PathLike, IO, Iterator[bytes]): The data or file to be uploaded.
+            name (strHTTP error): The optional name of the uploaded file, defaults to the name of
+            the path or file.
             options (FileUploadOptionsHTTP error): Additional options for the upload, such as tag,
             encryption, pinning, content-type, and request options.
             request_options (BeeRequestOptions): Options that affect the request behavior.
@@ -444,6 +626,10 @@ class Bee:
         if name and not isinstance(name, str):
             msg = "name must be a string or None"
             raise TypeError(msg)
+        if name is None:
+            file_name = data if isinstance(data, os.PathLike) else getattr(data, "name", None)
+            if isinstance(file_name, (str, os.PathLike)):
+                name = os.path.basename(file_name)
 
         return add_cid_conversion_function(
             bzz_api.upload_file(
@@ -484,35 +670,45 @@ class Bee:
         # assert_reference_or_ens(reference)
         reference = make_reference_or_ens(reference, ReferenceType.MANIFEST)
 
-        return bzz_api.download_file(self.__get_request_options_for_call(options), reference, path)
+        return bzz_api.download_file(
+            self.__get_request_options_for_call(options), reference, path, self.content_cache  # type: ignore
+        )
 
     def download_readable_file(
         self,
         reference: ReferenceCidOrENS,
         path: str = "",
         options: Optional[Union[BeeRequestOptions, dict]] = None,
-    ) -> FileData:
+        read_size: int = DEFAULT_READ_SIZE,
+    ) -> ReadableFileData:
         """
         Downloads a single file as a readable stream.
 
+        The file is read from the connection as `data` is consumed, so iterating it or saving it
+        with `data.save(path_or_fd)` takes constant memory whatever the size of the file.
+
         Args:
             reference (ReferenceCidOrENS): Bee file reference in hex string (either 64 or 128 chars
             long), ENS domain, or Swarm CID.
             path (str): The path to the file within the manifest, if the reference points to a manifest.
             options (BeeRequestOptions): Options that affect the request behavior.
+            read_size (int): Size of the pieces the stream is iterated and saved in.
 
         Raises:
             TypeError: If some of the input parameters are not the expected type.
             BeeArgumentError: If an ENS domain with invalid unicode characters is passed.
 
         Returns:
-            FileData
+            ReadableFileData
         """
 
         assert_reference_or_ens(reference)
+        assert_positive_integer(read_size, "read_size")
         reference = make_reference_or_ens(reference, ReferenceType.MANIFEST)
 
-        return bzz_api.download_file_readable(self.__get_request_options_for_call(options), reference, path)  # type: ignore # noqa: 501
+        return bzz_api.download_file_readable(
+            self.__get_request_options_for_call(options), reference, path, read_size  # type: ignore
+        )
 
     def upload_files(
         self,
@@ -582,7 +778,7 @@ class Bee:
         if options:
             assert_collection_upload_options(options)
 
-        upload_result = bzz_api.upload_collection(self.request_options, collection, postage_batch_id, options)
+        upload_result = bzz_api.upload_collection(self.request_template, collection, postage_batch_id, options)
 
         return add_cid_conversion_function(upload_result, ReferenceType.MANIFEST)
 
@@ -1292,6 +1488,9 @@ class Bee:
         """
         Creates a new feed writer for updating feeds.
 
+        The writers share the `feed_index_cursor` of the instance, so only the first update of
+        a feed looks its latest update up on the node.
+
         Args:
             postage_batch_id: The postage batch ID to be used for the feed writer.
             type: The type of the feed, either `epoch` or `sequence`.
@@ -1320,6 +1519,7 @@ class Bee:
             feed_type,
             canonical_topic,
             canonical_signer,
+            self.feed_index_cursor,
         )
 
     def set_json_feed(
@@ -1502,6 +1702,53 @@ class Bee:
 
         return SOCWriter(owner=reader.owner, download=reader.download, upload=__upload)
 
+    def make_pipelined_soc_writer(
+        self,
+        postage_batch_id: Union[str, BatchId],
+        signer: Optional[Union[Signer, bytes, str]] = None,
+        options: Optional[UploadOptions] = None,
+        request_options: Optional[BeeRequestOptions] = None,
+        window: int = DEFAULT_UPLOAD_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+    ) -> PipelinedSOCWriter:
+        """
+        Returns a writer uploading single owner chunks while it signs the next ones.
+
+        Unlike the `upload` of `make_soc_writer`, a write does not wait for the upload of its
+        chunk: it returns the future of its reference, and at most `window` uploads share the
+        connections of one session. Close the writer, or use it as a context manager, to wait
+        for the uploads in flight.
+
+        Args:
+            postage_batch_id (str): Postage BatchId to be used to upload the chunks with.
+            signer (str): The signer's private key or a Signer instance that can sign data.
+            options (UploadOptions): Additional options like tag and pinning.
+            request_options (BeeRequestOptions): Options that affect the request behavior.
+            window (int): Maximum number of chunks uploaded at the same time.
+            retries (int): How many times a failed chunk upload is retried.
+
+        Returns:
+            PipelinedSOCWriter: The writer.
+
+        See Also:
+            Bee docs - Chunk Types: https://docs.ethswarm.org/docs/dapps-on-swarm/chunk-types#single-owner-chunks
+        """
+        assert_batch_id(postage_batch_id)
+        if options:
+            assert_upload_options(options)
+        if request_options:
+            assert_request_options(request_options)
+        assert_positive_integer(window, "window")
+
+        return PipelinedSOCWriter(
+            self.__get_request_options_for_call(request_options),
+            self.__resolve_signer(signer),
+            postage_batch_id,
+            options,
+            window,
+            retries,
+        )
+
     def check_connection(self, options: Optional[BeeRequestOptions] = None) -> None:
         """
         Pings the Bee node to see if there's a live Bee node on the URL provided.
@@ -1,6 +1,7 @@
 from time import sleep
 from typing import Optional, Union
 
+import requests
 from ape.types import AddressType
 
 from bee_py.modules.debug import (
@@ -54,6 +55,7 @@ from bee_py.types.type import (
     WalletBalance,
 )
 from bee_py.utils.error import BeeArgumentError, BeeError
+from bee_py.utils.http import RequestTemplate, make_session_from_options
 from bee_py.utils.type import (
     assert_address,
     assert_batch_id,
@@ -75,10 +77,14 @@ class BeeDebug:
     Attributes:
         url: URL on which is the Debug API of Bee node exposed.
         request_options: Ky instance that defines connection to Bee node.
+        session: Pooled session shared by all the calls of the instance, safe to use from several threads.
+        request_template: Request options compiled once from `request_options` for the calls of the instance.
     """
 
     url: str
     request_options: BeeRequestOptions
+    session: requests.Session
+    request_template: RequestTemplate
 
     def __init__(self, url: str, options: Optional[Union[BeeOptions, dict]] = None):
         """
@@ -104,20 +110,28 @@ class BeeDebug:
         if options and "signer" in options:
             self.signer = options["signer"]
 
+        self.session = make_session_from_options(options)
         self.request_options = BeeRequestOptions.model_validate(
             {
                 "baseURL": self.url,
+                "session": self.session,
                 **(
                     {
                         "timeout": options.get("timeout", 300),
                         "headers": options.get("headers", {}),
                         "onRequest": options.get("onRequest", True),
+                        # * invalid counts are reported by the calls given them
+                        "retry": options["retry"] if isinstance(options.get("retry"), int) else 0,
+                        "retry_policy": options.get("retry_policy"),
+                        "hedge": options.get("hedge"),
+                        "coalesce": options.get("coalesce", True),
                     }
                     if options
                     else {}
                 ),
             }
         )
+        self.request_template = RequestTemplate(self.request_options)
 
     def __get_request_options_for_call(
         self,
@@ -135,14 +149,12 @@ class BeeDebug:
         if options:
             if isinstance(options, (JsonFeedOptions, BeeRequestOptions, AllTagsOptions)):
                 options = options.model_dump()  # type: ignore
-            if isinstance(
-                self.request_options,
-                (JsonFeedOptions, BeeRequestOptions, AllTagsOptions),
-            ):
-                self.request_options = self.request_options.model_dump()  # type: ignore
-            return {**self.request_options, **options}  # type: ignore
+            # * calls with their own options still go through the pooled session
+            return self.request_template.with_overrides(
+                {**options, "session": options.get("session") or self.session}  # type: ignore
+            )
         else:
-            return self.request_options
+            return self.request_template
 
     def get_node_address(self, options: Optional[Union[BeeRequestOptions, dict]] = None) -> NodeAddresses:
         """
@@ -0,0 +1,377 @@
+import functools
+import inspect
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Union
+
+import requests
+
+from bee_py.bee import Bee
+from bee_py.bee_debug import BeeDebug
+from bee_py.types.type import REFERENCE_BYTES_LENGTH, BatchId, BeeOptions, Tag, UploadResult
+from bee_py.utils.proximity import Address, ProximityRouter
+from bee_py.utils.reference import make_bytes_reference
+
+# * strategies choosing the node of a call
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+STRATEGIES = (LEAST_OUTSTANDING, EWMA)
+# * consecutive failed calls after which a node is ejected
+DEFAULT_MAX_FAILURES = 3
+# * seconds an ejected node is left out before it gets calls again
+DEFAULT_EJECTION_TIME = 30.0
+# * weight of the latest latency in the moving average of a node
+EWMA_WEIGHT = 0.3
+# * calls retrieving a chunk, sent to the node closest to its address when the overlays are known
+ROUTED_METHODS = ("download_chunk",)
+
+StickyKey = tuple[str, Union[int, str]]
+
+
+def is_node_failure(error: BaseException) -> bool:
+    """Checks whether an error of a call is a failure of the node rather than of the call."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500  # noqa: PLR2004
+
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def get_sticky_keys(arguments: dict) -> list[StickyKey]:
+    """Returns the tags and postage batches the arguments of a call refer to, tags first."""
+    tags: list[StickyKey] = []
+    batches: list[StickyKey] = []
+
+    for name, value in arguments.items():
+        if isinstance(value, Tag):
+            tags.append(("tag", value.uid))
+        elif name == "tag_uid" and isinstance(value, int):
+            tags.append(("tag", value))
+        elif name in ("postage_batch_id", "batch_id") and isinstance(value, str):
+            batches.append(("batch", value.lower()))
+        elif name == "options":
+            tag = value.get("tag") if isinstance(value, dict) else getattr(value, "tag", None)
+            if isinstance(tag, int):
+                tags.append(("tag", tag))
+
+    return tags + batches
+
+
+def get_routed_address(name: str, arguments: dict) -> Optional[bytes]:
+    """Returns the address of the chunk a call retrieves, `None` if it is not routed by address."""
+    if name not in ROUTED_METHODS:
+        return None
+
+    try:
+        address = make_bytes_reference(arguments.get("reference"))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        # * ENS names and invalid references are sent like the other calls
+        return None
+
+    return address if len(address) == REFERENCE_BYTES_LENGTH else None
+
+
+def get_issued_keys(name: str, result: Any) -> list[StickyKey]:
+    """Returns the tags and postage batches issued by a node in the result of a call."""
+    if isinstance(result, Tag):
+        return [("tag", result.uid)]
+    if isinstance(result, UploadResult) and result.tag_uid is not None:
+        return [("tag", result.tag_uid)]
+    if isinstance(result, list):
+        return [("tag", tag.uid) for tag in result if isinstance(tag, Tag)]
+    if name == "create_postage_batch" and isinstance(result, str):
+        return [("batch", result.lower())]
+
+    return []
+
+
+class PoolNode:
+    """
+    A Bee node of a `BeePool`, with its clients and the load and health the pool tracks.
+
+    Attributes:
+        bee: The client of the API of the node.
+        debug: The client of the debug API of the node, if it was given.
+        outstanding: Number of calls in progress.
+        latency: Moving average of the call latencies in seconds, `None` before the first call.
+        failures: Number of consecutive failed calls.
+        ejected_until: `time.monotonic()` until which the node gets no calls.
+        overlay: The overlay address of the node, if the pool knows it.
+    """
+
+    def __init__(self, bee: Bee, debug: Optional[BeeDebug] = None):
+        self.bee = bee
+        self.debug = debug
+        self.outstanding = 0
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.overlay: Optional[bytes] = None
+
+    def __repr__(self) -> str:
+        return f"PoolNode({self.url!r}, outstanding={self.outstanding}, latency={self.latency})"
+
+    @property
+    def url(self) -> str:
+        return self.bee.url
+
+    def is_ejected(self, now: Optional[float] = None) -> bool:
+        return self.ejected_until > (time.monotonic() if now is None else now)
+
+    def score(self, strategy: str) -> float:
+        if strategy == LEAST_OUTSTANDING:
+            return self.outstanding
+        # * nodes without a latency yet score like the fastest ones, so they get calls to measure
+        return (self.latency or 0.0) * (self.outstanding + 1)
+
+
+def _make_pool_method(method: Callable) -> Callable:
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def pool_method(self, *args, **kwargs):
+        try:
+            arguments = signature.bind(None, *args, **kwargs).arguments
+        except TypeError:
+            # * the call reports its invalid arguments itself
+            arguments = {}
+
+        node = self._acquire(get_sticky_keys(arguments), get_routed_address(method.__name__, arguments))
+        result = self._call(node, method, args, kwargs)
+        self._remember(node, get_issued_keys(method.__name__, result))
+
+        return result
+
+    return pool_method
+
+
+class BeePool:
+    """
+    Client spreading its calls over several Bee nodes.
+
+    Every public method of `Bee` is available with the same arguments. A call goes to the
+    available node with the fewest calls in progress, or with the `ewma` strategy to the one with
+    the lowest moving average latency weighted by its calls in progress. Ties go round-robin.
+
+    A node is ejected for `ejection_time` seconds after `max_failures` consecutive calls failed
+    with a connection error, a timeout or a 5xx status, and after failing `check_health`. After
+    that it gets calls again, and its next failure ejects it again. When every node is ejected,
+    the calls are spread over all of them.
+
+    Tags and postage batches only exist on the node which issued them, so the calls referring to
+    a tag or a batch, e.g. `retrieve_tag` or an upload with `postage_batch_id`, stick to the node
+    which returned it from `create_tag`, an upload or `create_postage_batch`, even when it is
+    ejected. Those bought elsewhere are bound to their node with `stick_tag` and `stick_batch`.
+
+    With the overlay addresses of the nodes, given or fetched with `discover_overlays`, chunk
+    retrievals go to the available node closest to the chunk by XOR distance. That node is in or
+    near the neighbourhood storing the chunk, so the request needs fewer forwarding hops.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        options: Optional[Union[BeeOptions, dict]] = None,
+        debug_urls: Optional[Sequence[str]] = None,
+        strategy: str = LEAST_OUTSTANDING,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        ejection_time: float = DEFAULT_EJECTION_TIME,
+        overlays: Optional[Sequence[Address]] = None,
+    ):
+        """
+        Constructs a new pool.
+
+        Args:
+            urls: URLs on which the APIs of the Bee nodes are exposed.
+            options: Additional options for the clients of every node, like for `Bee`.
+            debug_urls: URLs of the debug APIs of the nodes, in the order of `urls`, used by
+                `check_health`.
+            strategy: `least_outstanding` or `ewma`.
+            max_failures: Number of consecutive failed calls after which a node is ejected.
+            ejection_time: Seconds an ejected node is left out.
+            overlays: Overlay addresses of the nodes, in the order of `urls`, e.g. from
+                `eth_to_swarm_address`, to route chunk retrievals by.
+        """
+        if not urls:
+            msg = "BeePool needs at least one URL"
+            raise ValueError(msg)
+        if debug_urls is not None and len(debug_urls) != len(urls):
+            msg = f"Expected a debug URL for each of the {len(urls)} URLs, got {len(debug_urls)}"
+            raise ValueError(msg)
+        if overlays is not None and len(overlays) != len(urls):
+            msg = f"Expected an overlay for each of the {len(urls)} URLs, got {len(overlays)}"
+            raise ValueError(msg)
+        if strategy not in STRATEGIES:
+            msg = f"strategy has to be one of {', '.join(STRATEGIES)}, got {strategy}"
+            raise ValueError(msg)
+        if max_failures < 1:
+            msg = f"max_failures has to be a positive integer, got {max_failures}"
+            raise ValueError(msg)
+
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self.nodes = [
+            PoolNode(Bee(url, options), BeeDebug(debug_urls[index], options) if debug_urls else None)
+            for index, url in enumerate(urls)
+        ]
+        # * a feed is written through any node, the next indexes are tracked once for all of them
+        for node in self.nodes[1:]:
+            node.bee.feed_index_cursor = self.nodes[0].bee.feed_index_cursor
+        self.router: Optional[ProximityRouter] = None
+        self._sticky: dict[StickyKey, PoolNode] = {}
+        self._turn = 0
+        self._lock = threading.Lock()
+
+        if overlays is not None:
+            self.set_overlays(overlays)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connections of the clients of every node."""
+        for node in self.nodes:
+            node.bee.session.close()
+            if node.debug is not None:
+                node.debug.session.close()
+
+    @property
+    def available_nodes(self) -> list[PoolNode]:
+        """The nodes which are not ejected."""
+        now = time.monotonic()
+        return [node for node in self.nodes if not node.is_ejected(now)]
+
+    def get_node(self, url: str) -> PoolNode:
+        """Returns the node with the given API URL."""
+        url = url.rstrip("/")
+        for node in self.nodes:
+            if node.url == url:
+                return node
+
+        msg = f"No node with the URL {url} in the pool"
+        raise ValueError(msg)
+
+    def stick_tag(self, tag_uid: Union[int, Tag], url: str) -> None:
+        """Sends the calls referring to the tag to the node with the given API URL."""
+        uid = tag_uid.uid if isinstance(tag_uid, Tag) else tag_uid
+        self._remember(self.get_node(url), [("tag", uid)])
+
+    def stick_batch(self, batch_id: Union[BatchId, str], url: str) -> None:
+        """Sends the calls referring to the postage batch to the node with the given API URL."""
+        self._remember(self.get_node(url), [("batch", batch_id.lower())])
+
+    def set_overlays(self, overlays: Sequence[Address]) -> None:
+        """Sets the overlay addresses of the nodes, in their order, to route chunk retrievals by."""
+        router = ProximityRouter(overlays)
+        with self._lock:
+            for node, overlay in zip(self.nodes, router.overlays):
+                node.overlay = overlay
+            self.router = router
+
+    def discover_overlays(self) -> list[str]:
+        """
+        Fetches the overlay addresses of the nodes from their debug APIs and routes by them.
+
+        Returns:
+            The overlay addresses, in the order of the nodes.
+        """
+        if any(node.debug is None for node in self.nodes):
+            msg = "Discovering the overlays needs the debug URLs of the nodes"
+            raise ValueError(msg)
+
+        with ThreadPoolExecutor(len(self.nodes)) as executor:
+            overlays = list(executor.map(lambda node: node.debug.get_node_address().overlay, self.nodes))
+
+        self.set_overlays(overlays)
+        return overlays
+
+    def check_health(self) -> dict[str, bool]:
+        """
+        Checks the connection to every node and, with the debug URLs, its health.
+
+        The unhealthy nodes are ejected and the healthy ones are brought back.
+
+        Returns:
+            Whether each node is healthy, by its API URL.
+        """
+        with ThreadPoolExecutor(len(self.nodes)) as executor:
+            healthy = list(executor.map(self._check_node, self.nodes))
+
+        with self._lock:
+            for node, is_healthy in zip(self.nodes, healthy):
+                if is_healthy:
+                    node.failures = 0
+                    node.ejected_until = 0.0
+                else:
+                    node.failures = self.max_failures
+                    node.ejected_until = time.monotonic() + self.ejection_time
+
+        return {node.url: is_healthy for node, is_healthy in zip(self.nodes, healthy)}
+
+    def _check_node(self, node: PoolNode) -> bool:
+        try:
+            node.bee.check_connection()
+            return node.debug is None or node.debug.get_health().status == "ok"
+        except (requests.RequestException, ValueError):
+            return False
+
+    def _acquire(self, keys: list[StickyKey], address: Optional[bytes] = None) -> PoolNode:
+        with self._lock:
+            node = next((self._sticky[key] for key in keys if key in self._sticky), None)
+
+            if node is None and address is not None and self.router is not None:
+                now = time.monotonic()
+                ranked = (self.nodes[index] for index in self.router.rank(address))
+                node = next((ranked_node for ranked_node in ranked if not ranked_node.is_ejected(now)), None)
+
+            if node is None:
+                candidates = self.available_nodes or self.nodes
+                self._turn = (self._turn + 1) % len(candidates)
+                node = min(candidates[self._turn :] + candidates[: self._turn], key=lambda n: n.score(self.strategy))
+
+            node.outstanding += 1
+            return node
+
+    def _call(self, node: PoolNode, method: Callable, args: tuple, kwargs: dict) -> Any:
+        start = time.perf_counter()
+        try:
+            result = method(node.bee, *args, **kwargs)
+        except BaseException as e:
+            self._release(node, None if is_node_failure(e) else time.perf_counter() - start)
+            raise
+
+        self._release(node, time.perf_counter() - start)
+        return result
+
+    def _release(self, node: PoolNode, latency: Optional[float]) -> None:
+        """Records the end of a call of the node, with its latency unless the node failed it."""
+        with self._lock:
+            node.outstanding -= 1
+
+            if latency is None:
+                node.failures += 1
+                if node.failures >= self.max_failures:
+                    node.ejected_until = time.monotonic() + self.ejection_time
+                return
+
+            node.failures = 0
+            node.latency = latency if node.latency is None else node.latency + EWMA_WEIGHT * (latency - node.latency)
+
+    def _remember(self, node: PoolNode, keys: list[StickyKey]) -> None:
+        with self._lock:
+            for key in keys:
+                self._sticky[key] = node
+
+
+def _add_bee_methods() -> None:
+    for name, member in vars(Bee).items():
+        if not name.startswith("_") and name not in vars(BeePool) and inspect.isfunction(member):
+            setattr(BeePool, name, _make_pool_method(member))
+
+
+_add_bee_methods()
@@ -1,9 +1,11 @@
-from typing import Union
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Optional, Union
 
 from eth_pydantic_types import HexBytes
 from pydantic import BaseModel, Field
 
-from bee_py.chunk.bmt import bmt_hash
+from bee_py.chunk.bmt import DEFAULT_BMT_BATCH_SIZE, bmt_address, bmt_hash, bmt_hash_many
 from bee_py.chunk.serialize import serialize_bytes
 from bee_py.chunk.span import SPAN_SIZE, make_span
 from bee_py.utils.bytes import bytes_equal, flex_bytes_at_offset
@@ -32,6 +34,47 @@ class Chunk(BaseModel):
     address: Union[HexBytes, bytes] = Field(..., description="The address of the chunk")
 
 
+class RawChunk:
+    """
+    Compact content addressed chunk backed by its serialized data only.
+
+    `span` and `payload` are memoryviews sharing the buffer of `data`, and the address is
+    calculated on first access unless it is passed in. The splitter, the batch hashing and the
+    uploader pass chunks around in this form, `to_chunk` converts it into the `Chunk` model
+    returned by the public API.
+    """
+
+    __slots__ = ("data", "_address")
+
+    def __init__(self, data: bytes, address: Optional[bytes] = None):
+        self.data = data
+        self._address = address
+
+    @property
+    def span(self) -> memoryview:
+        return memoryview(self.data)[CAC_SPAN_OFFSET:CAC_PAYLOAD_OFFSET]
+
+    @property
+    def payload(self) -> memoryview:
+        return memoryview(self.data)[CAC_PAYLOAD_OFFSET:]
+
+    @property
+    def address(self) -> bytes:
+        if self._address is None:
+            self._address = bmt_hash(self.data)
+        return self._address
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"RawChunk(size={len(self.data)}, address={self._address!r})"
+
+    def to_chunk(self) -> Chunk:
+        """Copies the chunk into the `Chunk` model."""
+        return Chunk(data=self.data, span=bytes(self.span), payload=bytes(self.payload), address=self.address)
+
+
 def is_valid_chunk_data(data: bytes, chunk_address: bytes) -> bool:
     """
     Checks if the provided data represents a valid content-addressed chunk with the given address.
@@ -43,11 +86,12 @@ def is_valid_chunk_data(data: bytes, chunk_address: bytes) -> bool:
     Returns:
         bool: True if the data represents a valid content-addressed chunk with the given address; False otherwise.
     """
-    if not isinstance(data, bytes):
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        return False
+    if not CAC_PAYLOAD_OFFSET <= len(data) <= CAC_PAYLOAD_OFFSET + MAX_PAYLOAD_SIZE:
         return False
 
-    calculated_address = bmt_hash(data)
-    return bytes_equal(calculated_address, chunk_address)
+    return bytes_equal(bmt_address(data), chunk_address)
 
 
 def assert_valid_chunk_data(data: bytes, chunk_address: bytes) -> None:
@@ -74,3 +118,38 @@ def make_content_addressed_chunk(payload_bytes: bytes) -> Chunk:
     address = bmt_hash(data)
 
     return Chunk(data=data, span=span, payload=payload, address=address)
+
+
+def make_content_addressed_chunks(
+    payloads: Iterable[bytes],
+    batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[RawChunk]:
+    """
+    Creates content addressed chunks for many payloads, yielding them in the order of the input.
+
+    The addresses are calculated with `bmt_hash_many`, so large inputs are hashed by a process pool
+    while the payloads are still read lazily.
+
+    Args:
+        payloads (Iterable[bytes]): The payloads of the chunks, each between 1 and 4096 bytes.
+        batch_size (int): Number of chunks sent to a worker at once.
+        max_workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+
+    Yields:
+        RawChunk: The content addressed chunk of every payload.
+    """
+    # * serialized chunks waiting for their address, bounded by the batches in flight
+    pending: deque[bytes] = deque()
+
+    def serialized_chunks() -> Iterator[bytes]:
+        for payload_bytes in payloads:
+            if len(payload_bytes) > MAX_PAYLOAD_SIZE:
+                msg = f"Payload size must be at most {MAX_PAYLOAD_SIZE}, but found {len(payload_bytes)}"
+                raise ValueError(msg)
+            data = serialize_bytes(make_span(len(payload_bytes)), payload_bytes)
+            pending.append(data)
+            yield data
+
+    for address in bmt_hash_many(serialized_chunks(), batch_size, max_workers):
+        yield RawChunk(pending.popleft(), address)
@@ -0,0 +1,287 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, Any, Callable, Optional, Union
+
+from bee_py.chunk.cac import is_valid_chunk_data
+from bee_py.chunk.span import SPAN_SIZE, get_span_value
+from bee_py.modules import chunk as chunk_api
+from bee_py.types.type import BRANCHES, CHUNK_SIZE, REFERENCE_BYTES_LENGTH, BeeRequestOptions, Reference
+from bee_py.utils.error import BeeArgumentError, BeeError
+from bee_py.utils.hex import bytes_to_hex
+from bee_py.utils.http import session_for_call, with_session
+from bee_py.utils.reference import make_bytes_reference
+
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+# * 1024 intermediate chunks take about 4 MiB and address 512 MiB of data each level
+DEFAULT_CHUNK_CACHE_SIZE = 1024
+
+JoinerSink = Union[IO, Callable[[bytes], Any]]
+ChunkFetcher = Callable[[bytes], Future]
+
+
+class ChunkCache:
+    """Thread-safe LRU cache of verified chunk data keyed by chunk address.
+
+    The joiner stores intermediate chunks in it, so repeated reads of the same content skip
+    the requests for the upper levels of its chunk tree.
+    """
+
+    def __init__(self, max_chunks: int = DEFAULT_CHUNK_CACHE_SIZE):
+        if max_chunks < 1:
+            msg = f"max_chunks has to be a positive integer, got {max_chunks}"
+            raise ValueError(msg)
+
+        self.max_chunks = max_chunks
+        self._chunks: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def get(self, address: bytes) -> Optional[bytes]:
+        with self._lock:
+            data = self._chunks.get(address)
+            if data is not None:
+                self._chunks.move_to_end(address)
+            return data
+
+    def put(self, address: bytes, data: bytes) -> None:
+        with self._lock:
+            self._chunks[address] = data
+            self._chunks.move_to_end(address)
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+
+
+def download_verified_chunk(request_options: Union[BeeRequestOptions, dict], address: bytes) -> bytes:
+    """
+    Downloads a content addressed chunk from `/chunks` and checks it against its address.
+
+    Args:
+        request_options: Options for making requests.
+        address: The address of the chunk.
+
+    Returns:
+        bytes: The chunk data, span and payload.
+
+    Raises:
+        BeeError: If the downloaded data does not hash to the address.
+    """
+    data = chunk_api.download(request_options, bytes_to_hex(address)).data
+
+    if not is_valid_chunk_data(data, address):
+        msg = f"Downloaded chunk does not match its address {bytes_to_hex(address)}"
+        raise BeeError(msg)
+
+    return data
+
+
+def child_span_capacity(span_length: int) -> int:
+    """
+    Returns the length of the data under every child of an intermediate chunk.
+
+    Every child but the last one spans a full subtree, `CHUNK_SIZE * BRANCHES ** n` bytes for
+    the smallest `n` with `BRANCHES` such subtrees covering `span_length`.
+    """
+    capacity = CHUNK_SIZE
+    while capacity * BRANCHES < span_length:
+        capacity *= BRANCHES
+
+    return capacity
+
+
+def join_chunks(
+    fetch: ChunkFetcher,
+    data: bytes,
+    expected_length: Optional[int] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Walks the chunk tree under a chunk, yielding the content between `start` and `end` in order.
+
+    Only the children covering the range are requested. They are all requested with `fetch`
+    before the first one is descended into, so they are downloaded while the previous ones are
+    consumed.
+
+    Args:
+        fetch: Returns a future of the verified chunk data for an address.
+        data: The chunk data, span and payload.
+        expected_length: The length of the data the chunk has to span, as stated by its parent.
+        start: Offset of the first byte to yield, relative to the data under the chunk.
+        end: Offset after the last byte to yield, defaults to the end of the data.
+
+    Yields:
+        bytes: The payloads of the data chunks, sliced to the range.
+
+    Raises:
+        BeeError: If the chunk tree is malformed.
+    """
+    span_length = get_span_value(data[:SPAN_SIZE])
+    payload = data[SPAN_SIZE:]
+
+    if expected_length is not None and span_length != expected_length:
+        msg = f"Invalid chunk tree: expected span of {expected_length} bytes, got {span_length}"
+        raise BeeError(msg)
+
+    end = span_length if end is None else min(end, span_length)
+
+    if span_length <= CHUNK_SIZE:
+        if len(payload) != span_length:
+            msg = f"Invalid data chunk: span of {span_length} bytes with {len(payload)} bytes of payload"
+            raise BeeError(msg)
+        if start < end:
+            yield payload if start == 0 and end == span_length else payload[start:end]
+        return
+
+    capacity = child_span_capacity(span_length)
+    children_count = -(-span_length // capacity)
+
+    if len(payload) != children_count * REFERENCE_BYTES_LENGTH:
+        msg = f"Invalid intermediate chunk: expected {children_count} references for a span of {span_length} bytes"
+        raise BeeError(msg)
+
+    if start >= end:
+        return
+
+    first, last = start // capacity, -(-end // capacity)
+    futures = [
+        fetch(payload[index * REFERENCE_BYTES_LENGTH : (index + 1) * REFERENCE_BYTES_LENGTH])
+        for index in range(first, last)
+    ]
+    try:
+        for index, future in enumerate(futures, first):
+            child_offset = index * capacity
+            child_length = min(capacity, span_length - child_offset)
+            yield from join_chunks(
+                fetch, future.result(), child_length, max(start - child_offset, 0), end - child_offset
+            )
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def iter_data_parallel(
+    request_options: Union[BeeRequestOptions, dict],
+    reference: Union[Reference, bytes, str],
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    offset: int = 0,
+    length: Optional[int] = None,
+    cache: Optional[ChunkCache] = None,
+) -> Iterator[bytes]:
+    """
+    Downloads data uploaded with `/bytes` chunk by chunk, yielding its content in order.
+
+    Every chunk is verified against its address before it is used. With `offset` and `length`
+    only the chunks covering that range are downloaded.
+
+    Args:
+        request_options: Options for making requests.
+        reference: The reference of the root chunk.
+        max_concurrency: Maximum number of chunks downloaded at the same time.
+        offset: Offset of the first byte to download.
+        length: Number of bytes to download, defaults to everything after `offset`.
+        cache: Cache looked up for intermediate chunks and filled with the downloaded ones.
+
+    Yields:
+        bytes: The content of the data chunks.
+    """
+    if max_concurrency < 1:
+        msg = f"max_concurrency has to be a positive integer, got {max_concurrency}"
+        raise ValueError(msg)
+    if offset < 0:
+        msg = "offset has to be a non-negative integer"
+        raise BeeArgumentError(msg, offset)
+    if length is not None and length < 0:
+        msg = "length has to be a non-negative integer"
+        raise BeeArgumentError(msg, length)
+    if isinstance(request_options, BeeRequestOptions):
+        request_options = request_options.model_dump(by_alias=True)
+
+    address = make_bytes_reference(reference)
+    if len(address) != REFERENCE_BYTES_LENGTH:
+        msg = "Encrypted references are not supported by the joiner"
+        raise BeeArgumentError(msg, reference)
+
+    end = None if length is None else offset + length
+
+    with session_for_call(request_options, max_concurrency) as session, ThreadPoolExecutor(max_concurrency) as executor:
+        session_options = with_session(request_options, session)
+
+        def download(chunk_address: bytes) -> bytes:
+            data = download_verified_chunk(session_options, chunk_address)
+            if cache is not None and get_span_value(data[:SPAN_SIZE]) > CHUNK_SIZE:
+                cache.put(chunk_address, data)
+            return data
+
+        def fetch(chunk_address: bytes) -> Future:
+            data = cache.get(chunk_address) if cache is not None else None
+            if data is None:
+                return executor.submit(download, chunk_address)
+
+            future: Future = Future()
+            future.set_result(data)
+            return future
+
+        yield from join_chunks(fetch, fetch(address).result(), start=offset, end=end)
+
+
+def read_range(
+    request_options: Union[BeeRequestOptions, dict],
+    reference: Union[Reference, bytes, str],
+    offset: int,
+    length: int,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    cache: Optional[ChunkCache] = None,
+) -> bytes:
+    """
+    Reads a byte range of data uploaded with `/bytes`, downloading only the chunks covering it.
+
+    A range reaching past the end of the data is cut at the end of the data.
+
+    Args:
+        request_options: Options for making requests.
+        reference: The reference of the root chunk.
+        offset: Offset of the first byte to read.
+        length: Number of bytes to read.
+        max_concurrency: Maximum number of chunks downloaded at the same time.
+        cache: Cache looked up for intermediate chunks and filled with the downloaded ones.
+
+    Returns:
+        bytes: The content of the range.
+    """
+    return b"".join(iter_data_parallel(request_options, reference, max_concurrency, offset, length, cache))
+
+
+def download_data_parallel(
+    request_options: Union[BeeRequestOptions, dict],
+    reference: Union[Reference, bytes, str],
+    sink: JoinerSink,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> int:
+    """
+    Downloads data uploaded with `/bytes` chunk by chunk and writes it to the sink in order.
+
+    Args:
+        request_options: Options for making requests.
+        reference: The reference of the root chunk.
+        sink: A binary file-like object or a callable receiving every piece of the content.
+        max_concurrency: Maximum number of chunks downloaded at the same time.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    write = sink.write if hasattr(sink, "write") else sink
+    written = 0
+
+    for payload in iter_data_parallel(request_options, reference, max_concurrency):
+        write(payload)
+        written += len(payload)
+
+    return written
@@ -1,14 +1,21 @@
-from hashlib import sha3_256
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Any, Optional, Union
 
 import eth_keys  # type: ignore
 from ape.managers.accounts import AccountAPI
 from ape.types import AddressType
 from ape.types.signatures import MessageSignature
-from ecdsa import SECP256k1, VerifyingKey  # type: ignore
 from eth_account.messages import SignableMessage, encode_defunct
 from eth_keys import keys
 from eth_pydantic_types import HexBytes
+from pydantic import PrivateAttr
+
+try:
+    # * bindings of libsecp256k1 (the `coincurve` extra), signing and recovering with them skips the pure
+    # * Python curve arithmetic of eth_keys
+    import coincurve  # type: ignore
+except ImportError:  # pragma: no cover
+    coincurve = None
 
 # bee_py imports
 from bee_py.utils.hash import keccak256_hash
@@ -16,6 +23,10 @@ from bee_py.utils.hex import hex_to_bytes
 
 # Variables
 UNCOMPRESSED_RECOVERY_ID = 27
+PRIVATE_KEY_SIZE = 32
+SIGNATURE_SIZE = 65
+# * number of (signature, digest) pairs whose recovered address `recover_address` keeps
+RECOVERY_CACHE_SIZE = 4096
 
 
 def hash_with_ethereum_prefix(data: Union[bytes, bytearray]) -> bytes:
@@ -100,23 +111,185 @@ def public_key_to_address(pub_key: Union[str, bytes, eth_keys.datatypes.PublicKe
     return HexBytes(address)
 
 
-def recover_address(signature: bytes, digest: bytes) -> Union[AddressType, str]:
+def _coincurve_recover_public_key(signature: bytes, message_hash: bytes) -> bytes:
+    public_key = coincurve.PublicKey.from_signature_and_message(signature, message_hash, hasher=None)
+    return public_key.format(compressed=False)[1:]
+
+
+def _eth_keys_recover_public_key(signature: bytes, message_hash: bytes) -> bytes:
+    return keys.Signature(signature).recover_public_key_from_msg_hash(message_hash).to_bytes()
+
+
+# * eth_keys is the fallback, it uses coincurve itself when it is installed
+_recover_public_key = _coincurve_recover_public_key if coincurve is not None else _eth_keys_recover_public_key
+
+
+def recover_public_key(signature: Union[bytes, bytearray, memoryview], digest: bytes) -> bytes:
+    """
+    Recovers the public key which signed a digest, like `PrivateKeySigner.sign_digest` does.
+
+    It uses `coincurve` when it is installed, with the `coincurve` extra, and `eth_keys` otherwise,
+    which recovers the same key through its own backend.
+
+    Args:
+        signature: The 65 bytes signature `r || s || v`, with `v` 27 or 28, or 0 or 1.
+        digest: The signed data, e.g. the digest of a single owner chunk.
+
+    Returns:
+        bytes: The 64 bytes uncompressed public key, without its `04` prefix.
+
+    Raises:
+        ValueError: If the signature is malformed or no public key can be recovered from it.
+    """
+    if len(signature) != SIGNATURE_SIZE:
+        msg = f"Expected a signature of {SIGNATURE_SIZE} bytes, got {len(signature)} bytes"
+        raise ValueError(msg)
+
+    recovery_id = (
+        signature[64] - UNCOMPRESSED_RECOVERY_ID if signature[64] >= UNCOMPRESSED_RECOVERY_ID else signature[64]
+    )
+    if recovery_id not in (0, 1):
+        msg = f"Invalid recovery id of the signature: {signature[64]}"
+        raise ValueError(msg)
+
+    message_hash = hash_with_ethereum_prefix(digest)
+    try:
+        return _recover_public_key(bytes(signature[:64]) + bytes((recovery_id,)), message_hash)
+    except (eth_keys.exceptions.BadSignature, eth_keys.exceptions.ValidationError) as e:
+        raise ValueError(str(e)) from e
+
+
+@lru_cache(maxsize=RECOVERY_CACHE_SIZE)
+def _recover_address(signature: bytes, digest: bytes) -> AddressType:
+    return keys.PublicKey(recover_public_key(signature, digest)).to_checksum_address()
+
+
+def recover_address(signature: Union[bytes, bytearray, memoryview], digest: bytes) -> AddressType:
     """
     Recovers the Ethereum address from a given signature and message digest.
 
     This function can be used to verify the authenticity of a message by comparing
     the recovered address with the actual address of the signer.
 
+    The addresses of the last `RECOVERY_CACHE_SIZE` signature and digest pairs are cached, so
+    reading the same feed update again does not recover its signer again.
+
     Args:
         signature (bytes): The signature generated by the signer.
         digest (bytes): The message digest of the data to be verified.
 
     Returns:
-        AddressType: The recovered Ethereum address.
+        AddressType: The recovered checksummed Ethereum address.
+
+    Raises:
+        ValueError: If no address can be recovered from the signature.
+    """
+    return _recover_address(bytes(signature), bytes(digest))
+
+
+class PrivateKeySigner(AccountAPI):
+    """
+    Account signing with a raw secp256k1 private key instead of through ape's account machinery.
+
+    Its signatures are byte-identical to the ones of an ape account with the same key. It signs
+    with `coincurve` when it is installed, with `pip install swarm-bee-py[coincurve]`, and falls
+    back to `eth_keys` otherwise, which gives the same signatures more slowly.
+
+    It signs messages and chunk digests only, not transactions.
+
+    It is an `AccountAPI`, so it is accepted wherever an ape account is, e.g. by
+    `make_single_owner_chunk` and the feed writers, which sign with `sign_digest` directly.
+
+    It is pickled as its private key, so the worker processes of `make_single_owner_chunks`
+    can sign with it.
     """
-    curve = SECP256k1
-    hash_value = hash_with_ethereum_prefix(digest)
 
-    vk = VerifyingKey.from_public_key_recovery_with_digest(signature[:64], hash_value, curve, sha3_256)
+    _private_key: keys.PrivateKey = PrivateAttr()
+    _signing_key: Any = PrivateAttr(default=None)
+    _address: AddressType = PrivateAttr()
+
+    def __init__(self, private_key: Union[str, bytes, HexBytes], **kwargs):
+        super().__init__(**kwargs)
+
+        key_bytes = hex_to_bytes(private_key) if isinstance(private_key, str) else bytes(private_key)
+        if len(key_bytes) != PRIVATE_KEY_SIZE:
+            msg = f"Expected a private key of {PRIVATE_KEY_SIZE} bytes, got {len(key_bytes)} bytes"
+            raise ValueError(msg)
+
+        self._private_key = keys.PrivateKey(key_bytes)
+        self._signing_key = coincurve.PrivateKey(key_bytes) if coincurve is not None else None
+        self._address = self._private_key.public_key.to_checksum_address()
+
+    def __reduce__(self):
+        return PrivateKeySigner, (self._private_key.to_bytes(),)
+
+    @property
+    def address(self) -> AddressType:
+        return self._address
+
+    @property
+    def public_key(self) -> eth_keys.datatypes.PublicKey:
+        return self._private_key.public_key
+
+    def sign_hash(self, message_hash: bytes) -> bytes:
+        """
+        Signs a 32 bytes hash.
+
+        Args:
+            message_hash: The hash to sign.
+
+        Returns:
+            bytes: The 65 bytes signature `r || s || v`, with `v` 27 or 28.
+        """
+        if self._signing_key is not None:
+            signature = self._signing_key.sign_recoverable(message_hash, hasher=None)
+            return signature[:64] + bytes((signature[64] + UNCOMPRESSED_RECOVERY_ID,))
+
+        signature = self._private_key.sign_msg_hash(message_hash)
+        return signature.to_bytes()[:64] + bytes((signature.v + UNCOMPRESSED_RECOVERY_ID,))
+
+    def sign_digest(self, data: Union[bytes, bytearray]) -> bytes:
+        """
+        Signs data prefixed with the Ethereum signed message prefix, like `sign`.
 
-    return public_key_to_address(vk[0].to_string()).hex()
+        Args:
+            data: The data to sign, e.g. the digest of a single owner chunk.
+
+        Returns:
+            bytes: The 65 bytes signature `r || s || v`, the `encode_rsv()` of `sign(data, account)`.
+        """
+        return self.sign_hash(hash_with_ethereum_prefix(data))
+
+    def sign_raw_msghash(self, msghash: HexBytes) -> Optional[MessageSignature]:
+        return MessageSignature.from_rsv(self.sign_hash(bytes(msghash)))
+
+    def sign_message(self, msg: Any, **signer_options) -> Optional[MessageSignature]:  # noqa: ARG002
+        if not isinstance(msg, SignableMessage):
+            msg = encode_defunct(text=msg) if isinstance(msg, str) else encode_defunct(msg)
+
+        # * the EIP-191 hash of the message, the one `eth_account` signs
+        message_hash = keccak256_hash(b"\x19", msg.version, msg.header, msg.body)
+        return MessageSignature.from_rsv(self.sign_hash(message_hash))
+
+    def sign_transaction(self, txn: Any, **signer_options) -> Any:  # noqa: ARG002
+        """
+        Not supported, transactions are signed with an ape account.
+
+        Raises:
+            TypeError: Always, `PrivateKeySigner` does not sign transactions.
+        """
+        msg = "PrivateKeySigner does not sign transactions, only messages and chunk digests. Use an ape account."
+        raise TypeError(msg)
+
+
+def make_private_key_signer(private_key: Union[str, bytes, HexBytes]) -> PrivateKeySigner:
+    """
+    Creates a signer from a raw secp256k1 private key.
+
+    Args:
+        private_key: The private key as bytes or hex string.
+
+    Returns:
+        PrivateKeySigner: The signer, usable wherever an ape account is.
+    """
+    return PrivateKeySigner(private_key)
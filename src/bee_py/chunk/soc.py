@@ -1,3 +1,5 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
 from typing import NewType, Optional, Union
 
 from ape.managers.accounts import AccountAPI
@@ -5,7 +7,7 @@ from eth_pydantic_types import HexBytes
 from eth_typing import ChecksumAddress as AddressType
 from pydantic import BaseModel, Field
 
-from bee_py.chunk.bmt import bmt_hash
+from bee_py.chunk.bmt import DEFAULT_BMT_BATCH_SIZE, bmt_address, bmt_hash, bmt_hash_many, map_batches
 from bee_py.chunk.cac import (
     MAX_PAYLOAD_SIZE,
     MIN_PAYLOAD_SIZE,
@@ -14,8 +16,8 @@ from bee_py.chunk.cac import (
     make_content_addressed_chunk,
 )
 from bee_py.chunk.serialize import serialize_bytes
-from bee_py.chunk.signer import recover_address, sign
-from bee_py.chunk.span import SPAN_SIZE
+from bee_py.chunk.signer import PrivateKeySigner, recover_address, sign
+from bee_py.chunk.span import SPAN_SIZE, make_span
 from bee_py.modules.chunk import download
 from bee_py.modules.soc import upload
 from bee_py.types.type import (
@@ -83,14 +85,70 @@ class SingleOwnerChunk(Chunk, SingleOwnerChunkBase):
     pass
 
 
-def recover_chunk_owner(data: bytes) -> Union[AddressType, str]:
+class RawSingleOwnerChunk:
+    """
+    Compact single owner chunk backed by its serialized data only.
+
+    `identifier`, `signature`, `span` and `payload` are memoryviews sharing the buffer of
+    `data`, and `content` is the content addressed chunk, span and payload, which is uploaded
+    with `bee_py.modules.soc.upload`. `make_single_owner_chunks` returns chunks in this form,
+    `to_chunk` converts it into the `SingleOwnerChunk` model.
+    """
+
+    __slots__ = ("data", "address", "owner")
+
+    def __init__(self, data: bytes, address: bytes, owner: str):
+        self.data = data
+        self.address = address
+        self.owner = owner
+
+    @property
+    def identifier(self) -> memoryview:
+        return memoryview(self.data)[SOC_IDENTIFIER_OFFSET:SOC_SIGNATURE_OFFSET]
+
+    @property
+    def signature(self) -> memoryview:
+        return memoryview(self.data)[SOC_SIGNATURE_OFFSET:SOC_SPAN_OFFSET]
+
+    @property
+    def span(self) -> memoryview:
+        return memoryview(self.data)[SOC_SPAN_OFFSET:SOC_PAYLOAD_OFFSET]
+
+    @property
+    def payload(self) -> memoryview:
+        return memoryview(self.data)[SOC_PAYLOAD_OFFSET:]
+
+    @property
+    def content(self) -> memoryview:
+        return memoryview(self.data)[SOC_SPAN_OFFSET:]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"RawSingleOwnerChunk(size={len(self.data)}, address={self.address!r}, owner={self.owner!r})"
+
+    def to_chunk(self) -> SingleOwnerChunk:
+        """Copies the chunk into the `SingleOwnerChunk` model."""
+        return SingleOwnerChunk(
+            data=self.data,
+            identifier=bytes(self.identifier),
+            signature=bytes(self.signature),
+            span=bytes(self.span),
+            payload=bytes(self.payload),
+            address=self.address,
+            owner=self.owner,
+        )
+
+
+def recover_chunk_owner(data: bytes) -> AddressType:
     """Recovers the owner's Ethereum address from a single owner chunk (SOC).
 
     Args:
         data: The byte array representing the SOC data.
 
     Returns:
-        The Ethereum address of the SOC's owner.
+        The checksummed Ethereum address of the SOC's owner.
     """
     cac_data = data[SOC_SPAN_OFFSET:]
     chunk_address = bmt_hash(cac_data)
@@ -102,6 +160,22 @@ def recover_chunk_owner(data: bytes) -> Union[AddressType, str]:
     return owner_address
 
 
+def _verify_single_owner_chunk(data: bytes, address: bytes) -> Optional[AddressType]:
+    # * returns the owner of a valid SOC with the given address, None for anything else
+    if not SOC_PAYLOAD_OFFSET + MIN_PAYLOAD_SIZE <= len(data) <= SOC_PAYLOAD_OFFSET + MAX_PAYLOAD_SIZE:
+        return None
+
+    view = memoryview(data)
+    identifier = bytes(view[SOC_IDENTIFIER_OFFSET:SOC_SIGNATURE_OFFSET])
+    digest = keccak256_hash(identifier, bmt_address(view[SOC_SPAN_OFFSET:]))
+    try:
+        owner_address = recover_address(view[SOC_SIGNATURE_OFFSET:SOC_SPAN_OFFSET], digest)
+    except ValueError:
+        return None
+
+    return owner_address if bytes_equal(make_soc_address(identifier, owner_address), address) else None
+
+
 def make_single_owner_chunk_from_data(
     data: Union[Data, bytes], address: Union[AddressType, bytes, str]
 ) -> SingleOwnerChunk:
@@ -113,18 +187,22 @@ def make_single_owner_chunk_from_data(
         address: The address of the single owner chunk.
 
     Returns:
-        dict: A dictionary representing a single owner chunk.
+        SingleOwnerChunk: The verified single owner chunk.
+
+    Raises:
+        BeeError: If the data is not a single owner chunk with the given address.
     """
     if isinstance(data, Data):
         data = data.data
-    owner_address = recover_chunk_owner(data)
-    identifier = bytes_at_offset(data, SOC_IDENTIFIER_OFFSET, IDENTIFIER_SIZE)
-    soc_address = keccak256_hash(identifier, hex_to_bytes(owner_address[2:]))
+    soc_address = hex_to_bytes(address) if isinstance(address, str) else bytes(address)
 
-    if bytes_equal(address, soc_address):  # type: ignore
+    owner_address = _verify_single_owner_chunk(data, soc_address)
+    if owner_address is None:
         msg = "SOC Data does not match given address!"
         raise BeeError(msg)
 
+    identifier = bytes_at_offset(data, SOC_IDENTIFIER_OFFSET, IDENTIFIER_SIZE)
+
     def signature() -> bytes:
         return bytes_at_offset(data, SOC_SIGNATURE_OFFSET, SIGNATURE_SIZE)
 
@@ -145,12 +223,66 @@ def make_single_owner_chunk_from_data(
     )
 
 
+def _verify_single_owner_chunk_batch(batch: list[tuple[bytes, bytes]]) -> list[Optional[AddressType]]:
+    return [_verify_single_owner_chunk(data, address) for data, address in batch]
+
+
+def verify_single_owner_chunks(
+    chunks: Iterable[tuple[Union[Data, bytes], Union[AddressType, bytes, str]]],
+    batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[Optional[RawSingleOwnerChunk]]:
+    """
+    Verifies many single owner chunks, yielding the results in the order of the input.
+
+    A chunk is valid when the owner recovered from its signature and its identifier give the
+    expected address. The chunks are read lazily and their batches are verified by a process pool
+    when the input holds more than one batch, see `bee_py.chunk.bmt.map_batches`. The owners are
+    recovered with `recover_public_key`, which needs the `coincurve` extra to be fast.
+
+    Args:
+        chunks: Pairs of the data of a chunk, e.g. downloaded with `download_chunk`, and its address.
+        batch_size (int): Number of chunks sent to a worker at once.
+        max_workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+            `1` verifies everything in the calling process.
+
+    Yields:
+        Optional[RawSingleOwnerChunk]: The chunk with its recovered owner when it is valid, `None` otherwise.
+    """
+    # * chunks waiting for their owner, bounded by the batches in flight
+    pending: deque[tuple[bytes, bytes]] = deque()
+
+    def normalized_chunks() -> Iterator[tuple[bytes, bytes]]:
+        for data, address in chunks:
+            chunk = (
+                bytes(data.data if isinstance(data, Data) else data),
+                hex_to_bytes(address) if isinstance(address, str) else bytes(address),
+            )
+            pending.append(chunk)
+            yield chunk
+
+    for owner_address in map_batches(_verify_single_owner_chunk_batch, normalized_chunks(), batch_size, max_workers):
+        data, address = pending.popleft()
+        yield RawSingleOwnerChunk(data, address, owner_address) if owner_address is not None else None
+
+
 def make_soc_address(identifier: Union[Identifier, bytes], address: Union[AddressType, bytes, HexBytes, str]) -> bytes:
-    if not isinstance(address, bytes):
-        address_bytes = hex_to_bytes(address)
+    address_bytes = address if isinstance(address, bytes) else hex_to_bytes(address)
     return keccak256_hash(identifier, address_bytes)
 
 
+def _sign_digest(signer: Union[AccountAPI, PrivateKeySigner], digest: bytes) -> bytes:
+    if isinstance(signer, PrivateKeySigner):
+        # * signs the digest directly, without encoding it into a message and a `MessageSignature`
+        return signer.sign_digest(digest)
+
+    signature = sign(data=digest, account=signer)
+    if isinstance(signer, AccountAPI):
+        return signature.encode_rsv()  # type: ignore
+
+    return hex_to_bytes(signature.signature.hex())
+
+
 def make_single_owner_chunk(
     chunk: Chunk,
     identifier: Union[Identifier, bytes],
@@ -180,15 +312,8 @@ def make_single_owner_chunk(
     if isinstance(signer, Signer):
         signer = signer.signer
 
-    signature = sign(data=digest, account=signer)
-
-    if isinstance(signer, AccountAPI):
-        encoded_signature = signature.encode_rsv()  # type: ignore
-        data = serialize_bytes(identifier, encoded_signature, chunk.span, chunk.payload)
-    else:
-        encoded_signature = signature.signature.hex()
-        encoded_signature_bytes = hex_to_bytes(encoded_signature)
-        data = serialize_bytes(identifier, encoded_signature_bytes, chunk.span, chunk.payload)
+    encoded_signature = _sign_digest(signer, digest)
+    data = serialize_bytes(identifier, encoded_signature, chunk.span, chunk.payload)
 
     address = make_soc_address(identifier, signer.address)
 
@@ -203,9 +328,80 @@ def make_single_owner_chunk(
     )
 
 
+def _make_single_owner_chunk_batch(
+    batch: list[tuple[bytes, bytes]], signer: PrivateKeySigner
+) -> list[RawSingleOwnerChunk]:
+    owner = hex_to_bytes(signer.address)
+    chunks = []
+    for identifier, content in batch:
+        digest = keccak256_hash(identifier, bmt_address(content))
+        data = serialize_bytes(identifier, signer.sign_digest(digest), content)
+        chunks.append(RawSingleOwnerChunk(data, keccak256_hash(identifier, owner), signer.address))
+
+    return chunks
+
+
+def make_single_owner_chunks(
+    items: Iterable[tuple[Union[Identifier, bytes], bytes]],
+    signer: Union[AccountAPI, Signer],
+    batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[RawSingleOwnerChunk]:
+    """
+    Creates and signs single owner chunks for many payloads, yielding them in the order of the input.
+
+    The items are read lazily and their batches are processed by a process pool when the input
+    holds more than one batch, see `bee_py.chunk.bmt.map_batches`. With a `PrivateKeySigner` the
+    workers calculate the chunk addresses and sign them. Other accounts can not be sent to another
+    process, the workers only calculate the chunk addresses and the digests are signed in the
+    calling process.
+
+    Args:
+        items: Pairs of the 32 bytes identifier and the payload, between 1 and 4096 bytes, of every chunk.
+        signer: The signer of the chunks, an ape account, a `PrivateKeySigner` or a `Signer`.
+        batch_size (int): Number of chunks sent to a worker at once.
+        max_workers (Optional[int]): Number of worker processes, defaults to the number of CPUs.
+            `1` creates everything in the calling process.
+
+    Yields:
+        RawSingleOwnerChunk: The single owner chunk of every item.
+    """
+    if isinstance(signer, Signer):
+        signer = signer.signer
+
+    def serialized_items() -> Iterator[tuple[bytes, bytes]]:
+        for identifier, payload_bytes in items:
+            if len(identifier) != IDENTIFIER_SIZE:
+                msg = f"Identifier size must be {IDENTIFIER_SIZE}, but found {len(identifier)}"
+                raise ValueError(msg)
+            if not MIN_PAYLOAD_SIZE <= len(payload_bytes) <= MAX_PAYLOAD_SIZE:
+                msg = f"Payload size must be between 1 and {MAX_PAYLOAD_SIZE}, but found {len(payload_bytes)}"
+                raise ValueError(msg)
+            yield bytes(identifier), serialize_bytes(make_span(len(payload_bytes)), payload_bytes)
+
+    if isinstance(signer, PrivateKeySigner):
+        yield from map_batches(_make_single_owner_chunk_batch, serialized_items(), batch_size, max_workers, signer)
+        return
+
+    # * items waiting for the address of their chunk, bounded by the batches in flight
+    pending: deque[tuple[bytes, bytes]] = deque()
+
+    def chunk_contents() -> Iterator[bytes]:
+        for identifier, content in serialized_items():
+            pending.append((identifier, content))
+            yield content
+
+    owner = hex_to_bytes(signer.address)
+    for chunk_address in bmt_hash_many(chunk_contents(), batch_size, max_workers):
+        identifier, content = pending.popleft()
+        encoded_signature = _sign_digest(signer, keccak256_hash(identifier, chunk_address))
+        data = serialize_bytes(identifier, encoded_signature, content)
+        yield RawSingleOwnerChunk(data, keccak256_hash(identifier, owner), signer.address)
+
+
 def upload_single_owner_chunk(
     request_options: BeeRequestOptions,
-    chunk: SingleOwnerChunk,
+    chunk: Union[SingleOwnerChunk, RawSingleOwnerChunk],
     postage_batch_id: BatchId,
     options: Optional[UploadOptions] = None,
 ) -> Reference:
@@ -213,13 +409,19 @@ def upload_single_owner_chunk(
 
     Args:
         request_options: BeeRequestOptions for making requests.
-        chunk: The SOC object to be uploaded.
+        chunk: The SOC object to be uploaded, or one created by `make_single_owner_chunks`.
         postage_batch_id: The Postage BatchId to be assigned to the uploaded data.
         options: Upload options for controlling the upload process.
 
     Returns:
         A Reference object representing the uploaded chunk.
     """
+    if isinstance(chunk, RawSingleOwnerChunk):
+        identifier, signature = chunk.identifier.hex(), chunk.signature.hex()
+        return upload(
+            request_options, chunk.owner, identifier, signature, bytes(chunk.content), postage_batch_id, options
+        )
+
     # * Convert the owner, identifier, and signature to hexadecimal strings
     if isinstance(chunk.owner, bytes):
         owner = bytes_to_hex(chunk.owner)
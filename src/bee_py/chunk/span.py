@@ -31,3 +31,20 @@ def make_span(length: int) -> bytes:
     span = struct.pack("<Q", length)
 
     return span
+
+
+def get_span_value(span: bytes) -> int:
+    """
+    Reads the length of the data under a chunk from its span.
+
+    Args:
+        span (bytes): The 8 bytes span, 64-bit little endian.
+
+    Returns:
+        int: The length of the data.
+    """
+    if len(span) != SPAN_SIZE:
+        msg = f"Invalid span size: {len(span)}"
+        raise BeeArgumentError(msg, span)
+
+    return struct.unpack("<Q", span)[0]
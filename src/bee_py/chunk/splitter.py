@@ -0,0 +1,171 @@
+import struct
+from collections.abc import Iterable, Iterator
+from typing import IO, Optional, Union
+
+from bee_py.chunk.bmt import DEFAULT_BMT_BATCH_SIZE, bmt_hash
+from bee_py.chunk.cac import RawChunk, make_content_addressed_chunks
+from bee_py.chunk.serialize import serialize_bytes
+from bee_py.types.type import BRANCHES, CHUNK_SIZE, Reference, UploadResult
+from bee_py.utils.data import read_in_chunks
+from bee_py.utils.error import BeeError
+from bee_py.utils.hex import bytes_to_hex
+
+SplitterInput = Union[str, bytes, bytearray, memoryview, IO, Iterable[bytes]]
+
+
+def make_span_for_length(length: int) -> bytes:
+    """
+    Encodes the length of the data under a chunk as 64-bit little endian span.
+
+    Unlike `make_span` this is not limited to 32 bits, as intermediate chunks of big files
+    span more than 4 GiB.
+    """
+    return struct.pack("<Q", length)
+
+
+def make_intermediate_chunk(children: list[tuple[bytes, int]]) -> tuple[RawChunk, int]:
+    """
+    Creates an intermediate chunk of the chunk tree.
+
+    Its payload is the concatenation of the children addresses and its span is the length of
+    all the data under it, see The Book of Swarm, "2.2.2 Files".
+
+    Args:
+        children: The address and span length of every child, at most `BRANCHES`.
+
+    Returns:
+        The intermediate chunk and the length of the data it spans.
+    """
+    length = sum(child_length for _, child_length in children)
+    data = serialize_bytes(make_span_for_length(length), *(address for address, _ in children))
+
+    return RawChunk(data, bmt_hash(data)), length
+
+
+def split_data(
+    data: SplitterInput,
+    batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+    max_workers: Optional[int] = 1,
+) -> Iterator[RawChunk]:
+    """
+    Splits the data into the chunk tree used by Bee for `/bytes` and `/bzz` uploads.
+
+    The data is read as a stream. The data chunks are hashed with `make_content_addressed_chunks`,
+    so they can be hashed by a pool of `max_workers` processes, and the intermediate chunks are
+    yielded as soon as all their children are known. Every chunk is yielded after its children and
+    the root chunk is yielded last, so the chunks can be uploaded in the order they come.
+
+    A level ending with a single orphan reference carries it up to the next level instead of
+    wrapping it in an intermediate chunk of its own, the same way Bee's hashtrie does.
+
+    Args:
+        data: The data as str, bytes-like object, binary file-like object or an iterable of bytes.
+        batch_size: Number of data chunks sent to a worker at once.
+        max_workers: Number of worker processes hashing the data chunks, `None` for the number of CPUs.
+
+    Yields:
+        RawChunk: The chunks of the tree, the last one being the root chunk.
+    """
+    # * pending (address, span length) references of every level of the tree, leaves first
+    levels: list[list[tuple[bytes, int]]] = [[]]
+
+    def push(level: int, address: bytes, length: int) -> Iterator[RawChunk]:
+        if level == len(levels):
+            levels.append([])
+        levels[level].append((address, length))
+
+        if len(levels[level]) == BRANCHES:
+            chunk, span_length = make_intermediate_chunk(levels[level])
+            levels[level] = []
+            yield chunk
+            yield from push(level + 1, chunk.address, span_length)
+
+    for chunk in make_content_addressed_chunks(read_in_chunks(data, CHUNK_SIZE), batch_size, max_workers):
+        yield chunk
+        yield from push(0, chunk.address, len(chunk.payload))
+
+    if not any(levels):
+        # * empty data is a single chunk with zero span and no payload
+        yield RawChunk(make_span_for_length(0))
+        return
+
+    level = 0
+    while not (level == len(levels) - 1 and len(levels[level]) == 1):
+        children = levels[level]
+        levels[level] = []
+
+        if len(children) == 1:
+            yield from push(level + 1, *children[0])
+        elif children:
+            chunk, span_length = make_intermediate_chunk(children)
+            yield chunk
+            yield from push(level + 1, chunk.address, span_length)
+
+        level += 1
+
+
+def unique_chunks(chunks: Iterable[RawChunk]) -> Iterator[RawChunk]:
+    """
+    Skips the chunks whose address was already yielded, e.g. repeated blocks of a file.
+
+    Args:
+        chunks: The chunks, usually coming from `split_data`.
+
+    Yields:
+        RawChunk: Every chunk with a not yet seen address.
+    """
+    seen: set[bytes] = set()
+
+    for chunk in chunks:
+        address = bytes(chunk.address)
+        if address not in seen:
+            seen.add(address)
+            yield chunk
+
+
+def compute_reference(
+    data: SplitterInput,
+    batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+    max_workers: Optional[int] = 1,
+) -> Reference:
+    """
+    Computes the reference Bee returns for uploading the data to `/bytes`, without any network call.
+
+    Args:
+        data: The data as str, bytes-like object, binary file-like object or an iterable of bytes.
+        batch_size: Number of data chunks sent to a worker at once.
+        max_workers: Number of worker processes hashing the data chunks, `None` for the number of CPUs.
+
+    Returns:
+        Reference: The address of the root chunk.
+    """
+    root = None
+    for root in split_data(data, batch_size, max_workers):  # noqa: B007
+        pass
+
+    return Reference(value=bytes_to_hex(root.address))  # type: ignore
+
+
+def assert_expected_reference(
+    expected: Union[Reference, str, bytes], actual: Union[UploadResult, Reference, str, bytes]
+) -> None:
+    """
+    Checks that the reference returned by the Bee node is the one computed locally.
+
+    Args:
+        expected: The locally computed reference.
+        actual: The reference or upload result returned by the node.
+
+    Raises:
+        BeeError: If the references differ.
+    """
+    if isinstance(actual, UploadResult):
+        actual = actual.reference
+
+    expected_hex, actual_hex = (
+        bytes_to_hex(reference) if isinstance(reference, bytes) else str(reference) for reference in (expected, actual)
+    )
+
+    if expected_hex.lower() != actual_hex.lower():
+        msg = f"Bee node returned reference {actual_hex}, expected {expected_hex}"
+        raise BeeError(msg)
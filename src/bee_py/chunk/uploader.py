@@ -0,0 +1,354 @@
+import threading
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from time import sleep
+from typing import Callable, Optional, Union
+
+import requests
+from ape.managers.accounts import AccountAPI
+
+from bee_py.chunk.bmt import DEFAULT_BMT_BATCH_SIZE
+from bee_py.chunk.cac import RawChunk
+from bee_py.chunk.soc import Identifier, RawSingleOwnerChunk, make_single_owner_chunks, upload_single_owner_chunk
+from bee_py.chunk.splitter import SplitterInput, assert_expected_reference, split_data, unique_chunks
+from bee_py.modules import chunk as chunk_api
+from bee_py.types.type import BatchId, BeeRequestOptions, Reference, Signer, UploadOptions, UploadResult
+from bee_py.utils.hex import bytes_to_hex
+from bee_py.utils.http import make_session, session_for_call, with_session
+from bee_py.utils.logging import logger
+
+DEFAULT_UPLOAD_CONCURRENCY = 8
+DEFAULT_CHUNK_UPLOAD_RETRIES = 3
+# * seconds to wait before the first retry of a chunk, doubled after every failed attempt
+CHUNK_RETRY_BACKOFF = 0.1
+
+ChunkUploadCallback = Callable[[RawChunk, Reference], None]
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Returns True for connection errors, timeouts and 5xx responses of the Bee node."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500  # noqa: PLR2004
+
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def upload_chunk_with_retries(
+    request_options: Union[BeeRequestOptions, dict],
+    chunk: RawChunk,
+    postage_batch_id: BatchId,
+    options: Optional[UploadOptions] = None,
+    retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+) -> Reference:
+    """
+    Uploads one chunk to `/chunks`, retrying it on transient errors.
+
+    Args:
+        request_options: Options for making requests.
+        chunk: The content addressed chunk.
+        postage_batch_id: Postage BatchId that will be assigned to the uploaded chunk.
+        options: Upload options like tag or pinning.
+        retries: How many times a failed upload is retried.
+
+    Returns:
+        Reference: The reference returned by the node.
+
+    Raises:
+        BeeError: If the node returned another reference than the address of the chunk.
+    """
+    return _upload_with_retries(
+        lambda: chunk_api.upload(request_options, chunk.data, postage_batch_id, options), chunk.address, retries
+    )
+
+
+def upload_single_owner_chunk_with_retries(
+    request_options: Union[BeeRequestOptions, dict],
+    chunk: RawSingleOwnerChunk,
+    postage_batch_id: BatchId,
+    options: Optional[UploadOptions] = None,
+    retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+) -> Reference:
+    """
+    Uploads one single owner chunk to `/soc`, retrying it on transient errors.
+
+    Args:
+        request_options: Options for making requests.
+        chunk: The signed single owner chunk.
+        postage_batch_id: Postage BatchId that will be assigned to the uploaded chunk.
+        options: Upload options like tag or pinning.
+        retries: How many times a failed upload is retried.
+
+    Returns:
+        Reference: The reference returned by the node.
+
+    Raises:
+        BeeError: If the node returned another reference than the address of the chunk.
+    """
+    return _upload_with_retries(
+        lambda: upload_single_owner_chunk(request_options, chunk, postage_batch_id, options),  # type: ignore[arg-type]
+        chunk.address,
+        retries,
+    )
+
+
+def _upload_with_retries(upload: Callable[[], Reference], address: bytes, retries: int) -> Reference:
+    for attempt in range(retries + 1):
+        try:
+            reference = upload()
+            break
+        except requests.RequestException as e:
+            if attempt == retries or not is_retryable_error(e):
+                raise
+            logger.info(f"Retrying upload of chunk {bytes_to_hex(address)}: {e}")
+            sleep(CHUNK_RETRY_BACKOFF * 2**attempt)
+
+    assert_expected_reference(address, reference)
+
+    return reference
+
+
+def upload_chunks(
+    request_options: Union[BeeRequestOptions, dict],
+    chunks: Iterable[RawChunk],
+    postage_batch_id: BatchId,
+    options: Optional[UploadOptions] = None,
+    max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+    on_chunk_uploaded: Optional[ChunkUploadCallback] = None,
+) -> int:
+    """
+    Uploads chunks to `/chunks` with a bounded pool of worker threads.
+
+    At most `2 * max_concurrency` chunks are read from `chunks` ahead of the finished uploads.
+
+    Args:
+        request_options: Options for making requests.
+        chunks: The content addressed chunks.
+        postage_batch_id: Postage BatchId that will be assigned to the uploaded chunks.
+        options: Upload options like tag or pinning.
+        max_concurrency: Maximum number of chunks uploaded at the same time.
+        retries: How many times a failed chunk upload is retried.
+        on_chunk_uploaded: Called with every chunk and its reference once it is uploaded.
+
+    Returns:
+        int: The number of uploaded chunks.
+    """
+    if max_concurrency < 1:
+        msg = f"max_concurrency has to be a positive integer, got {max_concurrency}"
+        raise ValueError(msg)
+
+    uploaded = 0
+    in_flight: deque[tuple[RawChunk, Future]] = deque()
+
+    def wait_for_oldest() -> None:
+        nonlocal uploaded
+        chunk, future = in_flight.popleft()
+        reference = future.result()
+        uploaded += 1
+        if on_chunk_uploaded:
+            on_chunk_uploaded(chunk, reference)
+
+    with ThreadPoolExecutor(max_concurrency) as executor:
+        try:
+            for chunk in chunks:
+                future = executor.submit(
+                    upload_chunk_with_retries, request_options, chunk, postage_batch_id, options, retries
+                )
+                in_flight.append((chunk, future))
+                if len(in_flight) >= 2 * max_concurrency:
+                    wait_for_oldest()
+
+            while in_flight:
+                wait_for_oldest()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    return uploaded
+
+
+def upload_data_parallel(
+    request_options: Union[BeeRequestOptions, dict],
+    data: SplitterInput,
+    postage_batch_id: BatchId,
+    options: Optional[UploadOptions] = None,
+    max_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+    on_chunk_uploaded: Optional[ChunkUploadCallback] = None,
+) -> UploadResult:
+    """
+    Splits the data locally and uploads its chunk tree chunk by chunk.
+
+    The resulting reference is the same one `/bytes` would return for the data. Repeated chunks
+    are uploaded only once.
+
+    Args:
+        request_options: Options for making requests.
+        data: The data as str, bytes-like object, binary file-like object or an iterable of bytes.
+        postage_batch_id: Postage BatchId that will be assigned to the uploaded chunks.
+        options: Upload options like tag or pinning.
+        max_concurrency: Maximum number of chunks uploaded at the same time.
+        retries: How many times a failed chunk upload is retried.
+        on_chunk_uploaded: Called with every chunk and its reference once it is uploaded.
+
+    Returns:
+        UploadResult: The reference of the root chunk and the tag used for the upload.
+    """
+    if isinstance(request_options, BeeRequestOptions):
+        request_options = request_options.model_dump(by_alias=True)
+    if isinstance(options, dict):
+        options = UploadOptions.model_validate(options)
+
+    root: Optional[RawChunk] = None
+
+    def chunks_keeping_root() -> Iterable[RawChunk]:
+        nonlocal root
+        for chunk in unique_chunks(split_data(data)):
+            root = chunk
+            yield chunk
+
+    with session_for_call(request_options, max_concurrency) as session:
+        upload_chunks(
+            with_session(request_options, session),
+            chunks_keeping_root(),
+            postage_batch_id,
+            options,
+            max_concurrency,
+            retries,
+            on_chunk_uploaded,
+        )
+
+    reference = Reference(value=bytes_to_hex(root.address))  # type: ignore[union-attr]
+    tag_uid = options.tag if options else None
+
+    return UploadResult(reference=reference, tagUid=tag_uid)
+
+
+class PipelinedSOCWriter:
+    """
+    Writer of single owner chunks signing the next chunk while the previous ones are uploaded.
+
+    `write` signs a chunk in the calling thread and hands its upload to a pool of `window`
+    threads sharing one session, so the uploads reuse its connections and signing chunk N + 1
+    overlaps with the upload of chunk N. When `window` uploads are in flight, `write` waits for
+    one of them to finish.
+
+    Every write returns the `Future` of the reference of its chunk. Failed uploads are retried
+    like in `upload_chunks`, a chunk failing for good sets the exception of its future and is
+    recorded in `errors`. `close` waits for the uploads in flight, it is called when the writer
+    is used as a context manager.
+    """
+
+    def __init__(
+        self,
+        request_options: Union[BeeRequestOptions, dict],
+        signer: Union[Signer, AccountAPI],
+        postage_batch_id: BatchId,
+        options: Optional[UploadOptions] = None,
+        window: int = DEFAULT_UPLOAD_CONCURRENCY,
+        retries: int = DEFAULT_CHUNK_UPLOAD_RETRIES,
+    ):
+        if window < 1:
+            msg = f"window has to be a positive integer, got {window}"
+            raise ValueError(msg)
+        if isinstance(request_options, BeeRequestOptions):
+            request_options = request_options.model_dump(by_alias=True)
+
+        self.signer = signer
+        self.postage_batch_id = postage_batch_id
+        self.options = options
+        self.window = window
+        self.retries = retries
+        self.errors: list[tuple[RawSingleOwnerChunk, Exception]] = []
+
+        # * a session passed in the request options is closed by its owner
+        self._session = None if request_options.get("session") else make_session(window)
+        self.request_options = with_session(request_options, request_options.get("session") or self._session)
+        self._executor = ThreadPoolExecutor(window)
+        self._slots = threading.BoundedSemaphore(window)
+        self._in_flight: set[Future] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "PipelinedSOCWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def write(self, identifier: Union[Identifier, bytes], data: bytes) -> Future:
+        """
+        Signs a single owner chunk and schedules its upload.
+
+        Args:
+            identifier: The 32 bytes identifier of the chunk.
+            data: The payload of the chunk, between 1 and 4096 bytes.
+
+        Returns:
+            Future: The future of the reference of the chunk.
+        """
+        chunk = next(make_single_owner_chunks([(identifier, data)], self.signer, max_workers=1))
+
+        return self.submit(chunk)
+
+    def write_many(
+        self,
+        items: Iterable[tuple[Union[Identifier, bytes], bytes]],
+        batch_size: int = DEFAULT_BMT_BATCH_SIZE,
+        max_workers: Optional[int] = 1,
+    ) -> list[Future]:
+        """
+        Signs many single owner chunks with `make_single_owner_chunks` and schedules their uploads.
+
+        Args:
+            items: Pairs of the identifier and the payload of every chunk.
+            batch_size (int): Number of chunks signed by a worker process at once.
+            max_workers (Optional[int]): Number of worker processes signing the chunks, `None`
+                for the number of CPUs. By default they are signed in the calling thread.
+
+        Returns:
+            list[Future]: The futures of the references of the chunks, in the order of the items.
+        """
+        return [self.submit(chunk) for chunk in make_single_owner_chunks(items, self.signer, batch_size, max_workers)]
+
+    def submit(self, chunk: RawSingleOwnerChunk) -> Future:
+        """Schedules the upload of a signed chunk, waiting while the window is full."""
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                upload_single_owner_chunk_with_retries,
+                self.request_options,
+                chunk,
+                self.postage_batch_id,
+                self.options,
+                self.retries,
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_flight.add(future)
+        future.add_done_callback(lambda done: self._land(chunk, done))
+
+        return future
+
+    def flush(self) -> None:
+        """Waits for the uploads in flight."""
+        with self._lock:
+            in_flight = list(self._in_flight)
+        wait(in_flight)
+
+    def close(self) -> None:
+        """Waits for the uploads in flight and releases the threads and the connections."""
+        self._executor.shutdown(wait=True)
+        if self._session is not None:
+            self._session.close()
+
+    def _land(self, chunk: RawSingleOwnerChunk, future: Future) -> None:
+        with self._lock:
+            self._in_flight.discard(future)
+            error = None if future.cancelled() else future.exception()
+            if error is not None:
+                self.errors.append((chunk, error))  # type: ignore[arg-type]
+        self._slots.release()
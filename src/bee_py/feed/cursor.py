@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from bee_py.types.type import Topic
+from bee_py.utils.cache import write_atomically
+from bee_py.utils.hex import remove_0x_prefix
+
+
+def get_feed_key(owner: str, topic: Union[Topic, str]) -> str:
+    """Returns the key of a feed in a `FeedIndexCursor`: its owner and topic in lower case hex."""
+    if isinstance(topic, Topic):
+        topic = topic.value
+
+    return f"{remove_0x_prefix(owner).lower()}/{remove_0x_prefix(topic).lower()}"
+
+
+class FeedIndexCursor:
+    """
+    Thread-safe record of the next index of the sequence feeds written by this client.
+
+    The feed writers take the index of their next update from it instead of looking the latest
+    update up on the node, which they only do for feeds the cursor does not know yet or after
+    another writer used the index. One cursor tracks any number of feeds, keyed by their owner
+    and topic.
+
+    With a `path` the indexes are also stored in that JSON file, so a restarted writer continues
+    where it stopped. A missing or unreadable file starts from scratch.
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None):
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._indexes: dict[str, int] = self._load()
+
+    def get(self, owner: str, topic: Union[Topic, str]) -> Optional[int]:
+        """Returns the next index of the feed, `None` when it is not known."""
+        return self._indexes.get(get_feed_key(owner, topic))
+
+    def take(self, owner: str, topic: Union[Topic, str], default: Optional[int] = None) -> Optional[int]:
+        """
+        Reserves the next index of the feed for an update, advancing it.
+
+        Args:
+            owner: The owner of the feed.
+            topic: The topic of the feed.
+            default: The index to reserve when the feed is not known, e.g. looked up on the node.
+
+        Returns:
+            The reserved index, `None` when the feed is not known and there is no default.
+        """
+        key = get_feed_key(owner, topic)
+        with self._lock:
+            index = self._indexes.get(key, default)
+            if index is not None:
+                self._indexes[key] = index + 1
+                self._save()
+
+        return index
+
+    def put(self, owner: str, topic: Union[Topic, str], next_index: int) -> None:
+        """Records the next index of the feed."""
+        with self._lock:
+            self._indexes[get_feed_key(owner, topic)] = next_index
+            self._save()
+
+    def reset(self, owner: str, topic: Union[Topic, str]) -> None:
+        """Forgets the next index of the feed, its next update looks it up on the node."""
+        with self._lock:
+            if self._indexes.pop(get_feed_key(owner, topic), None) is not None:
+                self._save()
+
+    def _load(self) -> dict[str, int]:
+        if self.path is None:
+            return {}
+        try:
+            indexes = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+        return {key: index for key, index in indexes.items() if isinstance(index, int)}
+
+    def _save(self) -> None:
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomically(self.path, json.dumps(self._indexes, sort_keys=True).encode())
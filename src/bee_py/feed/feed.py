@@ -8,6 +8,7 @@ from eth_typing import ChecksumAddress as AddressType
 
 from bee_py.chunk.serialize import serialize_bytes
 from bee_py.chunk.soc import make_single_owner_chunk_from_data, upload_single_owner_chunk_data
+from bee_py.feed.cursor import FeedIndexCursor
 from bee_py.feed.identifiers import make_feed_identifier
 from bee_py.feed.type import FeedType
 from bee_py.modules.bytes import read_big_endian, write_big_endian
@@ -36,6 +37,8 @@ from bee_py.utils.reference import make_bytes_reference
 TIMESTAMP_PAYLOAD_OFFSET = 0
 TIMESTAMP_PAYLOAD_SIZE = 8
 REFERENCE_PAYLOAD_OFFSET = TIMESTAMP_PAYLOAD_SIZE
+# * status of the upload of a feed update whose index is already used
+FEED_INDEX_CONFLICT_STATUS_CODE = 409
 
 
 def find_next_index(
@@ -72,12 +75,18 @@ def update_feed(
     topic: Union[Topic, str],
     reference: Union[Reference, str, bytes],
     postage_batch_id: BatchId,
-    options: Optional[FeedUpdateOptions] = None,
+    options: Optional[Union[FeedUpdateOptions, dict]] = None,
     index: str = "latest",
+    cursor: Optional[FeedIndexCursor] = None,
 ) -> Reference:
     """
     Updates a feed.
 
+    With the `latest` index and a cursor, the index of the update is reserved in the cursor, so
+    concurrent updates of the feed through the same cursor get distinct indexes. The latest
+    update is only looked up on the node when the cursor does not know the feed yet, or after an
+    upload failed. When the node rejects the index as already used the update is uploaded again.
+
     :param request_options: The request options.
     :type request_options: BeeRequestOptions
     :param signer: The signer.
@@ -92,6 +101,8 @@ def update_feed(
     :type options: FeedUploadOptions
     :param index: The index (default is 'latest').
     :type index: Index
+    :param cursor: The next indexes of the feeds written by this client (default is None).
+    :type cursor: FeedIndexCursor
     :return: The reference.
     :rtype: Reference
     """
@@ -100,9 +111,9 @@ def update_feed(
         owner_hex = owner_hex.hex()
     if isinstance(topic, Topic):
         topic = topic.value
-    next_index = index if index != "latest" else find_next_index(request_options, owner_hex, topic, options)
+    if isinstance(options, dict):
+        options = FeedUpdateOptions.model_validate(options)
 
-    identifier = make_feed_identifier(topic, next_index)  # type: ignore
     at = options.at if options and options.at else datetime.now(tz=timezone.utc).timestamp()
     timestamp = write_big_endian(int(at))
     if isinstance(reference, Reference):
@@ -111,7 +122,44 @@ def update_feed(
         reference = reference.encode()
     payload_bytes = serialize_bytes(timestamp, reference)
 
-    return upload_single_owner_chunk_data(request_options, signer, postage_batch_id, identifier, payload_bytes, options)  # type: ignore # noqa: 501
+    def upload(update_index: str) -> Reference:
+        identifier = make_feed_identifier(topic, update_index)  # type: ignore
+        return upload_single_owner_chunk_data(
+            request_options, signer, postage_batch_id, identifier, payload_bytes, options  # type: ignore
+        )
+
+    def lookup_next_index() -> int:
+        # * the lookup is sent with the options of the update, like before the cursor, but only
+        # * sequence feeds can be written
+        lookup_options = {**(options.model_dump(exclude_none=True) if options else {}), "type": FeedType.SEQUENCE.value}
+        return int(find_next_index(request_options, owner_hex, topic, lookup_options), 16)  # type: ignore
+
+    def upload_next() -> Reference:
+        next_index = cursor.take(owner_hex, topic) if cursor is not None else None
+        if next_index is None:
+            next_index = lookup_next_index()
+            if cursor is not None:
+                # * another writer of the feed may have reserved the looked up index meanwhile
+                next_index = cursor.take(owner_hex, topic, next_index)
+        try:
+            return upload(f"{next_index:0{FEED_INDEX_HEX_LENGTH}x}")
+        except requests.HTTPError:
+            if cursor is not None:
+                # * the reserved index is unused, the next update looks the index up on the node
+                cursor.reset(owner_hex, topic)
+            raise
+
+    if index != "latest":
+        return upload(index)
+
+    try:
+        return upload_next()
+    except requests.HTTPError as e:
+        if cursor is None or e.response is None or e.response.status_code != FEED_INDEX_CONFLICT_STATUS_CODE:
+            raise
+
+    # * another writer of the feed used the index, the node knows the next one
+    return upload_next()
 
 
 def get_feed_update_chunk_reference(
@@ -222,6 +270,7 @@ def make_feed_writer(
     _type: Union[FeedType, str],
     topic: Union[Topic, str],
     signer: Union[AccountAPI, Signer],
+    cursor: Union[FeedIndexCursor, bool] = True,  # noqa: FBT002
 ) -> FeedWriter:
     """
     Creates a new feed writer object.
@@ -231,17 +280,23 @@ def make_feed_writer(
         type (FeedType): The type of feed.
         topic (Topic): The topic of the feed.
         signer (AccountAPI): The account to sign.
+        cursor (FeedIndexCursor | bool): Where the writer keeps the index of its next update, so
+            it does not look up the latest update before every upload. `True` keeps it in
+            memory, `False` looks the latest update up every time.
 
     Returns:
         FeedWriter: The feed writer object.
     """
     if isinstance(signer, Signer):
         signer = signer.signer
+    if cursor is True:
+        cursor = FeedIndexCursor()
+    index_cursor = cursor if isinstance(cursor, FeedIndexCursor) else None
 
     def __upload(
         postage_batch_id: Union[BatchId, AddressType],
         reference: Union[Reference, str, bytes],
-        options: Optional[FeedUpdateOptions] = {},  # type: ignore  # noqa: B006
+        options: Optional[Union[FeedUpdateOptions, dict]] = None,
     ) -> Reference:
         canonical_reference = make_bytes_reference(reference)
         return update_feed(
@@ -250,7 +305,8 @@ def make_feed_writer(
             topic,
             canonical_reference,
             postage_batch_id,
-            {**options, type: _type},  # type: ignore
+            options,
+            cursor=index_cursor,
         )
 
     return FeedWriter(
@@ -1,10 +1,11 @@
 import struct
-from typing import Optional, Union
-
-from requests import Response
+from typing import Optional
 
 from bee_py.types.type import BatchId, BeeRequestOptions, Data, Reference, ReferenceOrENS, UploadOptions, UploadResult
+from bee_py.utils.async_http import async_http
 from bee_py.utils.bytes import wrap_bytes_with_helpers
+from bee_py.utils.cache import ContentCache, is_cacheable_reference
+from bee_py.utils.data import DEFAULT_READ_SIZE, ReadableStream, UploadData, open_upload_body
 from bee_py.utils.headers import extract_upload_headers
 from bee_py.utils.http import http
 from bee_py.utils.logging import logger
@@ -15,7 +16,7 @@ BYTES_ENDPOINT = "bytes"
 
 def upload(
     request_options: BeeRequestOptions,
-    data: Union[str, bytes],
+    data: UploadData,
     postage_batch_id: BatchId,
     options: Optional[UploadOptions] = None,
 ):
@@ -24,7 +25,8 @@ def upload(
 
     Args:
         request_options (BeeRequestOptions): Ky Options for making requests.
-        data (str | bytes): Data to be uploaded.
+        data (str | bytes | PathLike | IO | Iterator[bytes]): Data to be uploaded. Paths, files
+            and iterators are streamed.
         postage_batch_id (BatchId): Postage Batch ID to be used for the upload.
         options (Optional[UploadOptions]): Optional upload options, such as tag, encryption, and pinning.
 
@@ -38,8 +40,9 @@ def upload(
         **extract_upload_headers(postage_batch_id, options),
     }
 
-    config = {"url": BYTES_ENDPOINT, "method": "POST", "data": data, "headers": headers}
-    response = http(request_options, config)
+    with open_upload_body(data) as body:
+        config = {"url": BYTES_ENDPOINT, "method": "POST", "data": body, "headers": headers}
+        response = http(request_options, config)
 
     if response.status_code != 201:  # noqa: PLR2004
         logger.info(response.json())
@@ -56,45 +59,85 @@ def upload(
     return UploadResult(reference=reference, tag_uid=tag_uid)
 
 
-def download(request_options: BeeRequestOptions, _hash: ReferenceOrENS) -> Data:
+def download(request_options: BeeRequestOptions, _hash: ReferenceOrENS, cache: Optional[ContentCache] = None) -> Data:
     """
     Downloads data from the Bee node as a byte array.
 
     Args:
         request_options (BeeRequestOptions): Ky Options for making requests.
         hash (ReferenceOrEns): Bee content reference or ENS domain to be downloaded.
+        cache (ContentCache | None): Cache looked up for the data and filled with it.
 
     Returns:
         Data: Downloaded data as a byte array.
     """
+    _hash, data = lookup_cache(_hash, cache)
+    if data is not None:
+        return data
+
+    response = http(request_options, {"url": f"{BYTES_ENDPOINT}/{_hash}", "method": "GET"})
+
+    return read_download_response(response, _hash, cache)
+
+
+async def download_async(
+    request_options: BeeRequestOptions, _hash: ReferenceOrENS, cache: Optional[ContentCache] = None
+) -> Data:
+    """Downloads data like `download`, with the asyncio transport of `async_http`."""
+    _hash, data = lookup_cache(_hash, cache)
+    if data is not None:
+        return data
+
+    response = await async_http(request_options, {"url": f"{BYTES_ENDPOINT}/{_hash}", "method": "GET"})
+
+    return read_download_response(response, _hash, cache)
+
+
+def lookup_cache(_hash: ReferenceOrENS, cache: Optional[ContentCache]) -> tuple[ReferenceOrENS, Optional[Data]]:
+    """Returns the reference as it is cached, and the cached data, `None` when it is not cached."""
     if isinstance(_hash, Reference):
         _hash = str(_hash)
+    if cache is None or not is_cacheable_reference(_hash):
+        return _hash, None
+    _hash = _hash.lower()
+    data = cache.get_data(_hash)
+
+    return _hash, wrap_bytes_with_helpers(data) if data is not None else None
 
-    config = {"url": f"{BYTES_ENDPOINT}/{_hash}", "method": "GET"}
-    response = http(request_options, config)
 
+def read_download_response(response, _hash: ReferenceOrENS, cache: Optional[ContentCache]) -> Data:
     if response.status_code != 200:  # noqa: PLR2004
         logger.info(response.json())
         if response.raise_for_status():  # type: ignore
             logger.error(response.raise_for_status())  # type: ignore
             return None  # type: ignore
 
+    if cache is not None and is_cacheable_reference(_hash):
+        cache.put_data(_hash, response.content)  # type: ignore[arg-type]
+
     return wrap_bytes_with_helpers(response.content)
 
 
-def download_readable(request_options: BeeRequestOptions, _hash: ReferenceOrENS) -> Response:
+def download_readable(
+    request_options: BeeRequestOptions, _hash: ReferenceOrENS, read_size: int = DEFAULT_READ_SIZE
+) -> ReadableStream:
     """
     Downloads data from the Bee node as a readable stream.
 
+    The body is read from the connection as the stream is consumed, not buffered.
+
     Args:
         request_options (BeeRequestOptions): Ky Options for making requests.
         hash (ReferenceOrEns): Bee content reference or ENS domain to be downloaded.
+        read_size (int): Size of the pieces the stream is iterated and saved in.
 
     Returns:
-        bytes: Readable stream of the downloaded data.
+        ReadableStream: Readable stream of the downloaded data.
     """
+    if isinstance(_hash, Reference):
+        _hash = str(_hash)
 
-    config = {"url": f"{BYTES_ENDPOINT}/{_hash}", "method": "GET"}
+    config = {"url": f"{BYTES_ENDPOINT}/{_hash}", "method": "GET", "stream": True}
     response = http(request_options, config)
 
     if response.status_code != 200:  # noqa: PLR2004
@@ -103,7 +146,7 @@ def download_readable(request_options: BeeRequestOptions, _hash: ReferenceOrENS)
             logger.error(response.raise_for_status())  # type: ignore
             return None  # type: ignore
 
-    return response
+    return ReadableStream(response, read_size)
 
 
 def make_bytes(length: int) -> bytearray:
@@ -6,13 +6,17 @@ from bee_py.types.type import (  # Reference,; UploadHeaders,; Data,; Collection
     Collection,
     CollectionUploadOptions,
     FileData,
+    FileHeaders,
     FileUploadOptions,
+    ReadableFileData,
     Reference,
     ReferenceOrENS,
     UploadResult,
 )
 from bee_py.utils.bytes import wrap_bytes_with_helpers
+from bee_py.utils.cache import ContentCache, is_cacheable_reference
 from bee_py.utils.collection import assert_collection
+from bee_py.utils.data import DEFAULT_READ_SIZE, ReadableStream, UploadData, open_upload_body
 from bee_py.utils.headers import extract_upload_headers, read_file_headers
 from bee_py.utils.http import http
 from bee_py.utils.logging import logger
@@ -20,6 +24,8 @@ from bee_py.utils.tar import make_tar
 from bee_py.utils.type import make_tag_uid
 
 BZZ_ENDPOINT = "bzz"
+# * set on the responses of manifests resolving a feed
+FEED_INDEX_HEADER = "swarm-feed-index"
 
 
 def extract_file_upload_headers(postage_batch_id: BatchId, options: Optional[FileUploadOptions] = None) -> dict:
@@ -38,7 +44,7 @@ def extract_file_upload_headers(postage_batch_id: BatchId, options: Optional[Fil
 
 def upload_file(
     request_options: BeeRequestOptions,
-    data: Union[str, bytes],
+    data: UploadData,
     postage_batch_id: BatchId,
     name: Optional[str] = None,
     options: Optional[Union[FileUploadOptions, dict]] = None,
@@ -48,7 +54,8 @@ def upload_file(
 
     Args:
         request_options (BeeRequestOptions): Ky Options for making requests.
-        data (str | bytes | Readable | ArrayBuffer): File data.
+        data (str | bytes | PathLike | IO | Iterator[bytes]): File data. Paths, files and
+            iterators are streamed.
         postage_batch_id (BatchId): Postage Batch ID to be used for the upload.
         name (str | None): Optional name that will be attached to the uploaded file.
         options (FileUploadOptions | None): Optional file upload options, such as content length and content type.
@@ -67,14 +74,15 @@ def upload_file(
 
     headers = extract_file_upload_headers(postage_batch_id, options)
 
-    config = {
-        "url": BZZ_ENDPOINT,
-        "method": "POST",
-        "data": data,
-        "headers": headers,
-        "params": {"name": name},
-    }
-    response = http(request_options, config, False)
+    with open_upload_body(data, options.size) as body:
+        config = {
+            "url": BZZ_ENDPOINT,
+            "method": "POST",
+            "data": body,
+            "headers": headers,
+            "params": {"name": name},
+        }
+        response = http(request_options, config, False)
 
     if response.status_code != 201:  # noqa: PLR2004
         logger.info(response.json())
@@ -94,7 +102,12 @@ def upload_file(
     return UploadResult(reference=reference, tagUid=tag_uid)
 
 
-def download_file(request_options: BeeRequestOptions, _hash: ReferenceOrENS, path: str = "") -> FileData:
+def download_file(
+    request_options: BeeRequestOptions,
+    _hash: ReferenceOrENS,
+    path: str = "",
+    cache: Optional[ContentCache] = None,
+) -> FileData:
     """
     Downloads a single file from a Bee node as a buffer.
 
@@ -102,6 +115,8 @@ def download_file(request_options: BeeRequestOptions, _hash: ReferenceOrENS, pat
         request_options (BeeRequestOptions): Ky Options for making requests.
         _hash (ReferenceOrEns): Bee file or collection _hash.
         path (str): Optional path to a single file within a collection.
+        cache (ContentCache | None): Cache looked up for the file and filled with it, unless the
+            manifest resolves a feed.
 
     Returns:
         FileData: Downloaded file data.
@@ -110,6 +125,13 @@ def download_file(request_options: BeeRequestOptions, _hash: ReferenceOrENS, pat
     if isinstance(_hash, Reference):
         _hash = str(_hash)
 
+    cacheable = cache is not None and is_cacheable_reference(_hash)
+    if cacheable:
+        _hash = _hash.lower()
+        entry = cache.get_file(_hash, path)  # type: ignore[union-attr]
+        if entry is not None:
+            return FileData(headers=FileHeaders(**entry[1]), data=entry[0])
+
     config = {"url": f"{BZZ_ENDPOINT}/{_hash}/{path}", "method": "GET"}
     response = http(request_options, config)
 
@@ -121,25 +143,39 @@ def download_file(request_options: BeeRequestOptions, _hash: ReferenceOrENS, pat
     file_headers = read_file_headers(response.headers)  # type: ignore
     file_data = wrap_bytes_with_helpers(response.content)
 
+    # * a manifest of a feed resolves to its latest update, which changes
+    if cacheable and FEED_INDEX_HEADER not in response.headers:
+        cache.put_file(_hash, path, file_data.data, file_headers.model_dump())  # type: ignore[union-attr]
+
     # print(f"response.headers --->{response.headers}")
 
     return FileData(headers=file_headers, data=file_data.data)
 
 
-def download_file_readable(request_options: BeeRequestOptions, _hash: ReferenceOrENS, path: str = "") -> FileData:
+def download_file_readable(
+    request_options: BeeRequestOptions,
+    _hash: ReferenceOrENS,
+    path: str = "",
+    read_size: int = DEFAULT_READ_SIZE,
+) -> ReadableFileData:
     """
     Downloads a single file from a Bee node as a readable stream.
 
+    The file is read from the connection as the stream is consumed, not buffered.
+
     Args:
         request_options (BeeRequestOptions): Ky Options for making requests.
         _hash (ReferenceOrEns): Bee file or collection hash.
         path (str): Optional path to a single file within a collection.
+        read_size (int): Size of the pieces the stream is iterated and saved in.
 
     Returns:
-        FileData[ReadableStream[Uint8Array]]: Downloaded file data.
+        ReadableFileData: Downloaded file data.
     """
+    if isinstance(_hash, Reference):
+        _hash = str(_hash)
 
-    config = {"url": f"{BZZ_ENDPOINT}/{_hash}/{path}", "method": "GET"}
+    config = {"url": f"{BZZ_ENDPOINT}/{_hash}/{path}", "method": "GET", "stream": True}
     response = http(request_options, config)
 
     if response.status_code != 200:  # noqa: PLR2004
@@ -149,9 +185,8 @@ def download_file_readable(request_options: BeeRequestOptions, _hash: ReferenceO
             return None  # type: ignore
 
     file_headers = read_file_headers(response.headers)  # type: ignore
-    file_data = response.content
 
-    return FileData(headers=file_headers, data=file_data)
+    return ReadableFileData(headers=file_headers, data=ReadableStream(response, read_size))
 
 
 def extract_collection_upload_headers(
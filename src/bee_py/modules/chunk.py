@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import Optional, Union
 
 from bee_py.types.type import BatchId, BeeRequestOptions, Data, Reference, ReferenceOrENS, UploadOptions
+from bee_py.utils.async_http import async_http
 from bee_py.utils.bytes import wrap_bytes_with_helpers
+from bee_py.utils.cache import ContentCache, is_cacheable_reference
 from bee_py.utils.headers import extract_upload_headers
 from bee_py.utils.http import http
 from bee_py.utils.logging import logger
@@ -11,7 +13,7 @@ ENDPOINT = "chunks"
 
 def upload(
     request_options: BeeRequestOptions,
-    data: bytes,
+    data: Union[bytes, bytearray, memoryview],
     postage_batch_id: BatchId,
     options: Optional[UploadOptions] = None,
 ) -> Reference:
@@ -19,7 +21,7 @@ def upload(
 
     Args:
         request_options: BeeRequestOptions instance containing the Bee node connection details.
-        data: The chunk data to be uploaded.
+        data: The chunk data to be uploaded, sent without being copied.
         postage_batch_id: The postage batch ID to be assigned to the uploaded data.
         options: Optional UploadOptions instance containing additional upload options like tag, encryption, and pinning.
 
@@ -27,14 +29,35 @@ def upload(
         The reference of the uploaded data.
     """
 
-    config = {
+    response = http(request_options, make_upload_config(data, postage_batch_id, options), False)
+
+    return read_upload_response(response)
+
+
+async def upload_async(
+    request_options: BeeRequestOptions,
+    data: Union[bytes, bytearray, memoryview],
+    postage_batch_id: BatchId,
+    options: Optional[UploadOptions] = None,
+) -> Reference:
+    """Uploads a chunk like `upload`, with the asyncio transport of `async_http`."""
+    response = await async_http(request_options, make_upload_config(data, postage_batch_id, options), False)
+
+    return read_upload_response(response)
+
+
+def make_upload_config(
+    data: Union[bytes, bytearray, memoryview], postage_batch_id: BatchId, options: Optional[UploadOptions] = None
+) -> dict:
+    return {
         "url": f"/{ENDPOINT}",
         "method": "post",
         "data": data,
         "headers": {**extract_upload_headers(postage_batch_id, options)},
     }
-    response = http(request_options, config, False)
 
+
+def read_upload_response(response) -> Reference:
     if response.status_code != 200:  # noqa: PLR2004
         logger.info(response.json())
         if response.raise_for_status():  # type: ignore
@@ -44,17 +67,50 @@ def upload(
     return Reference(value=response.json()["reference"])
 
 
-def download(request_options: BeeRequestOptions, _hash: ReferenceOrENS) -> Data:
-    config = {
-        "url": f"/{ENDPOINT}/{_hash}",
-        "method": "GET",
-    }
+def download(request_options: BeeRequestOptions, _hash: ReferenceOrENS, cache: Optional[ContentCache] = None) -> Data:
+    """Downloads a chunk, looking it up in the cache first and caching it when it matches its address."""
+    _hash, data = lookup_cache(_hash, cache)
+    if data is not None:
+        return data
 
-    response = http(request_options, config, False)
+    response = http(request_options, {"url": f"/{ENDPOINT}/{_hash}", "method": "GET"}, False)
 
+    return read_download_response(response, _hash, cache)
+
+
+async def download_async(
+    request_options: BeeRequestOptions, _hash: ReferenceOrENS, cache: Optional[ContentCache] = None
+) -> Data:
+    """Downloads a chunk like `download`, with the asyncio transport of `async_http`."""
+    _hash, data = lookup_cache(_hash, cache)
+    if data is not None:
+        return data
+
+    response = await async_http(request_options, {"url": f"/{ENDPOINT}/{_hash}", "method": "GET"}, False)
+
+    return read_download_response(response, _hash, cache)
+
+
+def lookup_cache(_hash: ReferenceOrENS, cache: Optional[ContentCache]) -> tuple[ReferenceOrENS, Optional[Data]]:
+    """Returns the reference as it is cached, and the cached chunk, `None` when it is not cached."""
+    if isinstance(_hash, Reference):
+        _hash = str(_hash)
+    if cache is None or not is_cacheable_reference(_hash):
+        return _hash, None
+    _hash = _hash.lower()  # type: ignore[union-attr]
+    data = cache.get_chunk(_hash)  # type: ignore[arg-type]
+
+    return _hash, wrap_bytes_with_helpers(data) if data is not None else None
+
+
+def read_download_response(response, _hash: ReferenceOrENS, cache: Optional[ContentCache]) -> Data:
     if response.status_code != 200:  # noqa: PLR2004
         logger.info(response.json())
         if response.raise_for_status():  # type: ignore
             logger.error(response.raise_for_status())  # type: ignore
             return None  # type: ignore
+
+    if cache is not None and is_cacheable_reference(_hash):
+        cache.put_chunk(_hash, response.content)  # type: ignore[arg-type]
+
     return wrap_bytes_with_helpers(response.content)
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, validator
 from swarm_cid.swarm_cid import CIDv1
 from typing_extensions import TypeAlias
 
+from bee_py.utils.data import ReadableStream
 from bee_py.utils.error import BeeError
 
 Type = TypeVar("Type")
@@ -50,6 +51,9 @@ FEED_INDEX_HEX_LENGTH = 16
 TOPIC_BYTES_LENGTH = 32
 TOPIC_HEX_LENGTH = 64
 
+# Number of connections to the Bee node kept alive by the session of a Bee instance
+DEFAULT_POOL_SIZE = 10
+
 # Type aliases
 BatchId: TypeAlias = str
 AddressPrefix: TypeAlias = str
@@ -93,12 +97,63 @@ class BeeResponse(BaseModel):
     request: BeeRequest
 
 
+class RetryPolicy(BaseModel):
+    """
+    Retry policy of the idempotent requests, e.g. chunk downloads, never of stamp purchases.
+
+    Attributes:
+        retries: Maximum number of retries of a request.
+        backoff: Delay before the first retry in seconds, doubled for every further retry.
+        max_backoff: Upper bound of the delay between retries in seconds.
+        jitter: Whether the delay is drawn uniformly between zero and the backoff.
+        statuses: Response statuses which are retried, besides timeouts and connection errors.
+        budget_ratio: Retries earned by every request, bounding the retries to this share of
+            the requests while a node keeps failing.
+        budget_max: Retries which can be spent at once, also the initial budget.
+    """
+
+    retries: int = Field(default=3, ge=0)
+    backoff: float = Field(default=0.1, ge=0)
+    max_backoff: float = Field(default=10.0, ge=0)
+    jitter: bool = True
+    statuses: list[int] = [429, 500, 502, 503, 504]
+    budget_ratio: float = Field(default=0.1, ge=0)
+    budget_max: float = Field(default=10.0, ge=1)
+
+
+class HedgePolicy(BaseModel):
+    """
+    Hedging of the chunk and feed downloads, sending a second request when the first one is slow.
+
+    Attributes:
+        delay: Seconds to wait for the first response before sending the second request. When
+            unset it is the `percentile` of the latencies observed so far, and requests are not
+            hedged before `min_samples` latencies were observed.
+        percentile: Percentile of the observed latencies used as the delay.
+        min_delay: Lower bound of the observed delay in seconds.
+        min_samples: Number of observed latencies needed for hedging with the observed delay.
+    """
+
+    delay: Optional[float] = Field(default=None, gt=0)
+    percentile: float = Field(default=0.95, gt=0, lt=1)
+    min_delay: float = Field(default=0.01, ge=0)
+    min_samples: int = Field(default=20, ge=1)
+
+
 class BeeRequestOptions(BaseModel):
     base_url: Optional[str] = Field(default="", alias="baseURL")
     timeout: Optional[int] = 300
+    # * number of retries of the idempotent requests, with the defaults of `RetryPolicy`
     retry: int = 0
+    # * overrides `retry`
+    retry_policy: Optional[RetryPolicy] = None
+    hedge: Optional[HedgePolicy] = None
+    # * whether concurrent identical reads of chunks, data, feeds and postage batches share one request
+    coalesce: bool = True
     headers: dict = {}
     on_request: bool = Field(default=True, alias="onRequest")
+    # * `requests.Session` the requests are sent with, its connections are reused between calls
+    session: Optional[Any] = Field(default=None, repr=False)
 
 
 class PssSubscription(BaseModel):
@@ -129,6 +184,17 @@ class PssMessageHandler(BaseModel):
 
 class BeeOptions(BeeRequestOptions):
     signer: Optional[Union[str, bytes]] = None
+    # * connections kept alive per host by the session the instance creates when none is passed
+    pool_size: int = Field(default=DEFAULT_POOL_SIZE, gt=0)
+    # * when set, calls wait for a free connection instead of opening more than this many
+    max_connections_per_host: Optional[int] = Field(default=None, gt=0)
+    keep_alive: bool = True
+    # * opt-in cache of the immutable downloads, the bytes of them it keeps in memory
+    cache_size: Optional[int] = Field(default=None, ge=0)
+    # * directory the cache also stores the chunk and data downloads in, files stay in memory
+    cache_dir: Optional[str] = None
+    # * JSON file keeping the next indexes of the feeds written by the instance across restarts
+    feed_index_path: Optional[str] = None
 
 
 class BrandedType(Generic[Type, Name]):
@@ -873,6 +939,16 @@ class FileData(BaseModel):
     data: bytes
 
 
+class ReadableFileData(BaseModel):
+    """File data whose content is read from the node as it is consumed."""
+
+    headers: FileHeaders
+    data: ReadableStream
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
 class UploadHeaders(BaseModel):
     swarm_pin: Optional[str] = None
     swarm_encrypt: Optional[str] = None
@@ -0,0 +1,107 @@
+import asyncio
+import ssl
+from typing import Optional, Union
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from bee_py.utils.http import RequestTemplate
+
+# * keyword arguments of `requests.request` the asyncio transport sends with aiohttp
+ASYNC_REQUEST_ARGUMENTS = ("method", "url", "params", "headers", "data", "timeout", "allow_redirects", "verify")
+
+
+def make_client_timeout(timeout) -> Optional[aiohttp.ClientTimeout]:
+    """Converts the `timeout` of `requests`, seconds or a (connect, read) pair, to an aiohttp timeout."""
+    if timeout is None:
+        return None
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+def make_ssl(verify) -> Union[bool, ssl.SSLContext]:
+    """Converts the `verify` of `requests`, a flag or the path of a CA bundle, to the `ssl` of aiohttp."""
+    if isinstance(verify, bool):
+        return verify
+
+    return ssl.create_default_context(cafile=verify)
+
+
+async def make_response(response: aiohttp.ClientResponse) -> requests.Response:
+    """Reads an aiohttp response into a `requests.Response`, so it is parsed like the ones of `http()`."""
+    result = requests.Response()
+    result.status_code = response.status
+    result.reason = response.reason or ""
+    result.url = str(response.url)
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.encoding = response.get_encoding() if response.content_type.startswith("text/") else None
+    result._content = await response.read()
+    # * the body is read and the connection released, closing the response is a no-op
+    result._content_consumed = True
+
+    return result
+
+
+async def send_request_async(session: aiohttp.ClientSession, request_config: dict) -> requests.Response:
+    """
+    Sends a request built for `requests.request` with an aiohttp session.
+
+    Timeouts and connection errors are raised as the ones of `requests`, so the callers and the
+    retrier handle them like the errors of the synchronous transport.
+    """
+    unsupported = [key for key in request_config if key not in ASYNC_REQUEST_ARGUMENTS]
+    if unsupported:
+        msg = f"Request options not supported by the asyncio transport: {', '.join(sorted(unsupported))}"
+        raise TypeError(msg)
+
+    try:
+        async with session.request(
+            request_config.get("method", "GET").upper(),
+            request_config["url"],
+            params=request_config.get("params") or None,
+            headers=request_config.get("headers"),
+            data=request_config.get("data"),
+            timeout=make_client_timeout(request_config.get("timeout")),
+            allow_redirects=request_config.get("allow_redirects", True),
+            ssl=make_ssl(request_config.get("verify", True)),
+        ) as response:
+            return await make_response(response)
+    except asyncio.TimeoutError as e:
+        raise requests.Timeout(str(e) or "Request timed out") from e
+    except aiohttp.ClientConnectionError as e:
+        raise requests.ConnectionError(str(e)) from e
+
+
+async def async_http(
+    options: RequestTemplate, config: dict, sanitise: Optional[bool] = True  # noqa: FBT002
+) -> requests.Response:
+    """
+    Makes an HTTP request with the aiohttp session of the request options.
+
+    The request config is built by `RequestTemplate.build` like for `http()` and sent with the
+    retries of the template, the requests are neither hedged nor coalesced.
+
+    Args:
+      options: The request template of the call, its `session` an `aiohttp.ClientSession`.
+      config: Internal settings and/or Bee settings.
+      sanitise: remove signer & other unintended settings from config
+
+    Returns:
+      A requests.Response object with the body read.
+    """
+    if not isinstance(options, RequestTemplate) or not isinstance(options.session, aiohttp.ClientSession):
+        msg = "The asyncio transport needs a RequestTemplate with an aiohttp.ClientSession"
+        raise TypeError(msg)
+
+    request_config = options.build(config, sanitise)
+    if "http" not in request_config["url"]:
+        msg = f"Invalid URL: {request_config['url']}"
+        raise TypeError(msg)
+
+    session = options.session
+    if options.retrier:
+        return await options.retrier.send_async(lambda config: send_request_async(session, config), request_config)
+
+    return await send_request_async(session, request_config)
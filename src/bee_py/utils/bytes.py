@@ -1,4 +1,5 @@
-from typing import Any, Generic, TypeVar
+import hmac
+from typing import Any, Generic, TypeVar, Union
 
 from pydantic import BaseModel
 from typing_extensions import TypeGuard
@@ -114,9 +115,11 @@ def assert_bytes_length(b: bytes, length: int):
         raise TypeError(msg)
 
 
-def flex_bytes_at_offset(data: bytes, offset: int, min_size: int, max_size: int) -> bytes:
+def flex_bytes_at_offset(data: Union[bytes, memoryview], offset: int, min_size: int, max_size: int) -> bytes:
     """Returns a flex bytes object starting from the specified offset, ensuring the size is within the specified range.
 
+    A memoryview is sliced without copying, the result is a view of the same buffer.
+
     Args:
         data: The original byte data.
         offset: The offset to start extracting the flex bytes from.
@@ -143,6 +146,9 @@ def flex_bytes_at_offset(data: bytes, offset: int, min_size: int, max_size: int)
 def bytes_equal(a: bytes, b: bytes) -> bool:
     """Returns True if the two byte arrays are equal, False otherwise.
 
+    Bytes-like objects are compared with `hmac.compare_digest`, in constant time for a given
+    length. Other sequences are compared item by item.
+
     Args:
             a: The first byte array to compare.
             b: The second byte array to compare.
@@ -151,6 +157,12 @@ def bytes_equal(a: bytes, b: bytes) -> bool:
             True if the two byte arrays are equal, False otherwise.
     """
 
+    try:
+        return hmac.compare_digest(a, b)
+    except TypeError:
+        # * e.g. str against bytes or lists of ints
+        pass
+
     if len(a) != len(b):
         return False
 
@@ -186,10 +198,12 @@ def wrap_bytes_with_helpers(data: bytes) -> Data:
     return Data(data=data)
 
 
-def bytes_at_offset(data: bytes, offset: int, length: Length) -> bytes:
+def bytes_at_offset(data: Union[bytes, memoryview], offset: int, length: Length) -> bytes:
     """
     Returns `length` bytes starting from `offset`.
 
+    A memoryview is sliced without copying, the result is a view of the same buffer.
+
     Args:
         data: The original data.
         offset: The offset to start from.
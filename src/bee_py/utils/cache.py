@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from bee_py.chunk.cac import is_valid_chunk_data
+from bee_py.chunk.splitter import compute_reference
+from bee_py.types.type import REFERENCE_HEX_LENGTH
+from bee_py.utils.hex import hex_to_bytes, is_hex_string
+
+# * bytes of downloads kept in memory by default
+DEFAULT_CONTENT_CACHE_SIZE = 64 * 1024 * 1024
+
+CacheEntry = tuple[bytes, dict]
+
+
+def is_cacheable_reference(reference: object) -> bool:
+    """
+    Checks whether downloads of a reference can be cached.
+
+    Only plain references are immutable and verifiable: ENS names resolve to whatever their
+    record points to and encrypted references cannot be checked against their content.
+    """
+    return isinstance(reference, str) and is_hex_string(reference, REFERENCE_HEX_LENGTH)
+
+
+def _data_reference(data: bytes) -> str:
+    return str(compute_reference(data))
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    # * written under a temporary name first, so readers never see a partial file
+    temporary_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    temporary_path.write_bytes(data)
+    os.replace(temporary_path, path)
+
+
+class ContentCache:
+    """
+    Thread-safe cache of immutable downloads keyed by their reference.
+
+    It keeps up to `max_bytes` of downloads in memory, evicting the least recently used ones, and
+    when a `directory` is given also stores the chunks and data there, so they outlive the process
+    and the memory budget. The directory is not bounded, remove it to free the space.
+
+    Chunks and data are verified through BMT hashing before they are cached, chunks against their
+    address and data against its reference, and again when they are read back from the directory.
+    Downloads found in memory are returned without being verified again: they were verified when
+    they were cached and are kept as immutable `bytes`. Downloads which can not be stored, larger
+    than `max_bytes` without a directory, are not hashed.
+
+    Files downloaded from a manifest can not be verified without resolving the manifest, so they
+    are only kept in memory, as the node returned them, and never stored in the directory.
+
+    Only downloads by plain reference are cached, see `is_cacheable_reference`, and never the
+    mutable ones, like feed lookups.
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_CONTENT_CACHE_SIZE, directory: Optional[Union[str, os.PathLike]] = None
+    ):
+        if max_bytes < 0:
+            msg = f"max_bytes has to be a non-negative integer, got {max_bytes}"
+            raise ValueError(msg)
+
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory is not None else None
+        self.size = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_chunk(self, address: str) -> Optional[bytes]:
+        """Returns the cached data of the chunk, span and payload."""
+        entry = self._get(f"chunks/{address}", lambda data, _: is_valid_chunk_data(data, hex_to_bytes(address)))
+        return entry[0] if entry else None
+
+    def put_chunk(self, address: str, data: bytes) -> bool:
+        """Caches the data of the chunk, returning whether it was stored: it fits and matched its address."""
+        if not self.can_store(data) or not is_valid_chunk_data(data, hex_to_bytes(address)):
+            return False
+        self._put(f"chunks/{address}", data, {})
+        return True
+
+    def get_data(self, reference: str) -> Optional[bytes]:
+        """Returns the cached data uploaded with `/bytes`."""
+        entry = self._get(f"bytes/{reference}", lambda data, _: _data_reference(data) == reference)
+        return entry[0] if entry else None
+
+    def put_data(self, reference: str, data: bytes) -> bool:
+        """Caches data uploaded with `/bytes`, returning whether it was stored: it fits and matched its reference."""
+        if not self.can_store(data) or _data_reference(data) != reference:
+            return False
+        self._put(f"bytes/{reference}", data, {})
+        return True
+
+    def get_file(self, reference: str, path: str = "") -> Optional[CacheEntry]:
+        """Returns the content and headers of the file at the path of the manifest, kept in memory."""
+        entry = self._recall(f"bzz/{reference}/{path}")
+        return (entry[0], entry[1]["headers"]) if entry else None
+
+    def put_file(self, reference: str, path: str, data: bytes, headers: dict) -> None:
+        """Keeps the content and headers of the file at the path of the manifest in memory, unverified."""
+        self._remember(f"bzz/{reference}/{path}", (bytes(data), {"headers": headers}))
+
+    def can_store(self, data: bytes) -> bool:
+        """Returns whether the data fits in memory or can be stored in the directory."""
+        return self.directory is not None or len(data) <= self.max_bytes
+
+    def clear(self) -> None:
+        """Removes the downloads from memory, the directory is kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _get(self, key: str, verify: Callable[[bytes, dict], bool]) -> Optional[CacheEntry]:
+        # * verified when it was cached, the memory is trusted unlike the directory
+        entry = self._recall(key)
+        if entry is not None:
+            return entry
+
+        entry = self._read(key)
+        if entry is None:
+            return None
+        if not verify(*entry):
+            self._remove(key)
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def _recall(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: str, data: bytes, metadata: dict) -> None:
+        entry = (bytes(data), metadata)
+        self._remember(key, entry)
+        self._write(key, entry)
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        if len(entry[0]) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0])
+            self._entries[key] = entry
+            self.size += len(entry[0])
+            while self.size > self.max_bytes:
+                _, (data, _) = self._entries.popitem(last=False)
+                self.size -= len(data)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / f"{name}.bin", self.directory / f"{name}.json"  # type: ignore[operator]
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        if self.directory is None:
+            return None
+
+        data_path, metadata_path = self._paths(key)
+        try:
+            data = data_path.read_bytes()
+            metadata = json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+        except (OSError, ValueError):
+            return None
+
+        return data, metadata
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        if self.directory is None:
+            return
+
+        data, metadata = entry
+        data_path, metadata_path = self._paths(key)
+        if metadata:
+            write_atomically(metadata_path, json.dumps(metadata).encode())
+        write_atomically(data_path, data)
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key) if self.directory is not None else ():
+            path.unlink(missing_ok=True)
+
+
+def make_content_cache_from_options(options: Optional[dict]) -> Optional[ContentCache]:
+    """
+    Returns the cache configured by the `cache_size` and `cache_dir` Bee options, `None` unless
+    one of them is set.
+
+    Args:
+        options: The dumped `BeeOptions`.
+    """
+    options = options or {}
+    if options.get("cache_size") is None and options.get("cache_dir") is None:
+        return None
+
+    cache_size = options.get("cache_size")
+    return ContentCache(DEFAULT_CONTENT_CACHE_SIZE if cache_size is None else cache_size, options.get("cache_dir"))
@@ -1,5 +1,19 @@
 import io
-from typing import Union
+import os
+import stat
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import IO, Any, Callable, Optional, Union
+
+# * size of the reads of a file streamed with a length given by the caller
+UPLOAD_READ_SIZE = 64 * 1024
+# * size of the pieces a streamed download is read and written in
+DEFAULT_READ_SIZE = 64 * 1024
+
+UploadData = Union[str, bytes, bytearray, memoryview, IO, Iterator[bytes], os.PathLike]
+# * a path, a file descriptor or a binary file-like object
+DownloadSink = Union[str, os.PathLike, int, IO]
 
 
 def prepare_websocket_data(data: Union[str, bytes, bytearray, memoryview]) -> bytes:
@@ -15,3 +29,223 @@ def prepare_websocket_data(data: Union[str, bytes, bytearray, memoryview]) -> by
 
     msg = "Unknown websocket data type"
     raise TypeError(msg)
+
+
+def read_in_chunks(data: Union[str, bytes, bytearray, memoryview, IO, Iterable[bytes]], size: int) -> Iterator[bytes]:
+    """
+    Reads the data in pieces of exactly `size` bytes, only the last piece can be shorter.
+
+    Args:
+        data: The data as str, bytes-like object, binary file-like object or an iterable of bytes.
+        size: The size of the pieces.
+
+    Yields:
+        bytes: The consecutive pieces of the data.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for offset in range(0, len(view), size):
+            yield bytes(view[offset : offset + size])
+        return
+
+    if hasattr(data, "read"):
+        # * raw streams can return less than requested, so their reads are regrouped below as well
+        data = iter(partial(data.read, size), b"")
+
+    if not isinstance(data, Iterable):
+        msg = f"Expected str, bytes, file-like object or iterable of bytes, got {type(data)}"
+        raise TypeError(msg)
+
+    buffer = bytearray()
+    for piece in data:
+        buffer += piece
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+class SizedStream:
+    """
+    Iterable request body of a known length.
+
+    `requests` sends it with `Content-Length` instead of chunked transfer encoding.
+    """
+
+    def __init__(self, pieces: Iterable[bytes], length: int):
+        self.pieces = pieces
+        self.length = length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.pieces)
+
+    def __len__(self) -> int:
+        return self.length
+
+
+def is_upload_data(value: Any) -> bool:
+    """
+    Checks whether a value can be uploaded: str, bytes-like object, path, binary file-like object
+    or iterator of bytes.
+
+    Strings are uploaded as their content, paths have to be `os.PathLike`, e.g. `pathlib.Path`.
+    """
+    return isinstance(value, (str, bytes, bytearray, memoryview, os.PathLike, Iterator)) or hasattr(value, "read")
+
+
+def get_upload_size(data: Any) -> Optional[int]:
+    """
+    Returns the number of bytes of the upload data left to be sent, `None` if it is not known.
+
+    The size of a file-like object is known when it is a regular file.
+    """
+    if isinstance(data, str):
+        return len(data.encode())
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, memoryview):
+        return data.nbytes
+    if isinstance(data, os.PathLike):
+        return os.path.getsize(data)
+
+    try:
+        file_stat = os.fstat(data.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return max(file_stat.st_size - data.tell(), 0)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+@contextmanager
+def open_upload_body(data: UploadData, size: Optional[int] = None) -> Iterator[Any]:
+    """
+    Yields the request body streaming the upload data, closing the file it opened for a path.
+
+    Strings and bytes-like objects are sent as they are. Paths, files and iterators are streamed
+    in pieces, so the memory used does not depend on their size. They are sent with
+    `Content-Length` when their size is known or given, with chunked transfer encoding otherwise.
+
+    Args:
+        data: The upload data.
+        size: The number of bytes of the data, when the caller knows it.
+
+    Raises:
+        TypeError: If the data is not upload data.
+    """
+    if not is_upload_data(data):
+        msg = f"Expected str, bytes, path, file-like object or iterator of bytes, got {type(data)}"
+        raise TypeError(msg)
+
+    if isinstance(data, str):
+        yield data.encode()
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        yield data
+    elif isinstance(data, os.PathLike):
+        with open(data, "rb") as file:
+            yield file
+    elif hasattr(data, "read"):
+        # * `requests` finds the length of regular files and reads them in blocks itself
+        if size is None or get_upload_size(data) is not None:
+            yield data
+        else:
+            yield SizedStream(iter(partial(data.read, UPLOAD_READ_SIZE), b""), size)
+    else:
+        yield data if size is None else SizedStream(data, size)
+
+
+@contextmanager
+def open_download_sink(sink: DownloadSink) -> Iterator[Callable[[memoryview], Any]]:
+    """
+    Yields a function writing all the given bytes to the sink, closing the file it opened for a path.
+
+    Args:
+        sink: A path, an open file descriptor, which is not closed, or a binary file-like object.
+    """
+    if isinstance(sink, (str, os.PathLike)):
+        with open(sink, "wb") as file:
+            yield file.write
+    elif isinstance(sink, int) and not isinstance(sink, bool):
+
+        def write_all(data: memoryview) -> None:
+            while data:
+                data = data[os.write(sink, data) :]
+
+        yield write_all
+    elif hasattr(sink, "write"):
+        yield sink.write
+    else:
+        msg = f"Expected path, file descriptor or file-like object, got {type(sink)}"
+        raise TypeError(msg)
+
+
+class ReadableStream(io.RawIOBase):
+    """
+    Binary file-like object reading the body of a streamed response as it arrives.
+
+    Iterating it yields the body in pieces of `read_size` bytes and `save` writes it to a path,
+    file descriptor or file, so downloads of any size take constant memory. Closing it, or
+    reading it to the end, releases the connection.
+
+    The attributes of the response, e.g. `headers`, `status_code` or `content`, are available
+    on the stream as well.
+    """
+
+    def __init__(self, response: Any, read_size: int = DEFAULT_READ_SIZE):
+        super().__init__()
+        self.response = response
+        self.read_size = read_size
+
+        if read_size < 1:
+            msg = f"read_size has to be a positive integer, got {read_size}"
+            raise ValueError(msg)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name == "response":
+            raise AttributeError(name)
+        return getattr(self.response, name)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.response.raw.read(len(buffer), decode_content=True)
+        if not data:
+            self.close()
+            return 0
+
+        buffer[: len(data)] = data
+        return len(data)
+
+    def __iter__(self) -> Iterator[bytes]:  # type: ignore[override]
+        return iter(partial(self.read, self.read_size), b"")
+
+    def save(self, sink: DownloadSink) -> int:
+        """
+        Writes the rest of the body to the sink.
+
+        Args:
+            sink: A path, an open file descriptor, which is not closed, or a binary file-like object.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        buffer = bytearray(self.read_size)
+        view = memoryview(buffer)
+        written = 0
+
+        with open_download_sink(sink) as write:
+            while size := self.readinto(buffer):
+                write(view[:size])
+                written += size
+
+        return written
+
+    def close(self) -> None:
+        if not self.closed:
+            self.response.close()
+        super().close()
@@ -1,10 +1,15 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Optional, Union
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import requests
 from deepmerge import always_merger  # type: ignore
+from requests.adapters import HTTPAdapter
 
-from bee_py.types.type import BeeRequestOptions
+from bee_py.types.type import DEFAULT_POOL_SIZE, BeeRequestOptions
+from bee_py.utils.retry import Retrier, make_retrier
+from bee_py.utils.singleflight import SingleFlight, get_request_key
 
 DEFAULT_HTTP_CONFIG = {
     "headers": {
@@ -12,9 +17,197 @@ DEFAULT_HTTP_CONFIG = {
     },
 }
 
+# * Dictionary to map the python names of BeeRequestOptions to their aliases
+OPTIONS_KEY_MAPPING = {"base_url": "baseURL", "on_request": "onRequest"}
+# * top level keys removed by `sanitise_config`
+BAD_CONFIGS = ("address", "signer", "Type", "limit", "offset")
+# * options consumed by the onRequest hook instead of being passed to requests
+HOOK_OPTIONS = ("baseURL", "onRequest", "retry", "retry_policy", "hedge", "coalesce", "headers", "session")
+# * options configuring the retrier of the requests
+RETRY_OPTIONS = ("baseURL", "retry", "retry_policy", "hedge")
+
+
+def normalise_options(options: Union[BeeRequestOptions, dict, None]) -> dict:
+    """Converts request options into a dictionary keyed by the option aliases."""
+    if isinstance(options, BeeRequestOptions):
+        options = options.model_dump()
+    if not options:
+        return {}
+
+    return {OPTIONS_KEY_MAPPING.get(k, k): v for k, v in options.items()}
+
+
+class RequestTemplate(dict):
+    """
+    Request options compiled once for the calls of a Bee or BeeDebug instance.
+
+    It is the dictionary of the normalised options, so it can be passed wherever request options
+    are expected. `http()` builds the request config from its precomputed parts with one shallow
+    pass, instead of deep merging and copying the options for every call. Treat it as immutable
+    and derive per-call options with `with_overrides`.
+    """
+
+    def __init__(self, options: Union[BeeRequestOptions, dict, None] = None):
+        super().__init__(normalise_options(options))
+
+        self.base_url = self.get("baseURL", "")
+        self.on_request = bool(self.get("onRequest"))
+        # * a base URL without path lets plain relative URLs be joined without `urljoin`
+        base = urlsplit(self.base_url)
+        is_root = base.scheme and base.netloc and base.path in ("", "/") and not base.query and not base.fragment
+        self.url_root = f"{base.scheme}://{base.netloc}" if is_root else None
+        self.session = self.get("session")
+        # * the option headers, overridden by the default ones like `always_merger` did
+        self.headers = {**(self.get("headers") or {}), **DEFAULT_HTTP_CONFIG["headers"]}
+        self.overrides = [(k, v) for k, v in self.items() if k not in HOOK_OPTIONS]
+        self.retrier = make_retrier(self)
+        self.flights = SingleFlight(self.base_url) if self.get("coalesce", True) else None
+
+    def with_overrides(self, options: Union[BeeRequestOptions, dict, None]) -> "RequestTemplate":
+        """
+        Returns a new template with the given options replacing the ones of this template.
+
+        Unless the retry options change, it shares the retrier, and so the retry budget, of this
+        template. Its requests are coalesced with the ones of this template, unless coalescing is
+        turned off or the base URL changes.
+        """
+        template = RequestTemplate({**self, **normalise_options(options)})
+        if all(template.get(key) == self.get(key) for key in RETRY_OPTIONS):
+            template.retrier = self.retrier
+        if template.flights is not None and template.base_url == self.base_url:
+            template.flights = self.flights
+
+        return template
+
+    def join_url(self, url: str) -> str:
+        """Returns `urljoin(base_url, url)`, skipping `urljoin` for plain relative URLs."""
+        if (
+            self.url_root
+            and isinstance(url, str)
+            and url.isprintable()
+            and url[:1] not in ("", " ", ".")
+            and not any(part in url for part in (":", "//", "/.", "\\", "?", "#", ";"))
+        ):
+            return f"{self.url_root}/{url.lstrip('/')}"
+
+        return urljoin(self.base_url, url)
+
+    def build(self, config: dict, sanitise: Optional[bool] = True) -> dict:  # noqa: FBT002
+        """
+        Builds the keyword arguments of `requests.request` for a call.
+
+        The result is the same as merging the options into the config in `http()` and running
+        the onRequest hook, which must be enabled, and `sanitise_config` on it.
+        """
+        request_config = dict(config)
+
+        for key, value in self.overrides:
+            current = request_config.get(key)
+            if (isinstance(current, dict) and isinstance(value, dict)) or (
+                isinstance(current, list) and isinstance(value, list)
+            ):
+                request_config[key] = always_merger.merge(current, value)
+            else:
+                request_config[key] = value
+
+        config_headers = config.get("headers")
+        request_config["headers"] = {**config_headers, **self.headers} if config_headers else dict(self.headers)
+        request_config["url"] = self.join_url(request_config.get("url", ""))
+        request_config["params"] = request_config.get("params") or {}
+
+        if sanitise:
+            if request_config["params"]:
+                return sanitise_config(request_config)  # type: ignore[return-value]
+            for bad_key in BAD_CONFIGS:
+                request_config.pop(bad_key, None)
+
+        return request_config
+
+
+def make_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_connections_per_host: Optional[int] = None,
+    keep_alive: bool = True,  # noqa: FBT001, FBT002
+) -> requests.Session:
+    """
+    Creates a `requests.Session` keeping up to `pool_size` connections open per host.
+
+    Pass it as `session` in the request options to reuse its connections across calls. The
+    connection pools are thread-safe, so one session can be shared by many threads.
+
+    Args:
+        pool_size: Maximum number of connections kept alive per host.
+        max_connections_per_host: When set, requests wait for a free connection instead of
+            opening more than this many connections to one host.
+        keep_alive: Whether connections are kept open between requests.
+
+    Returns:
+        The session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=max_connections_per_host or pool_size,
+        pool_block=max_connections_per_host is not None,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def make_session_from_options(options: Optional[dict]) -> requests.Session:
+    """
+    Returns the session passed in the Bee options or a new one configured by them.
+
+    Args:
+        options: The dumped `BeeOptions`.
+
+    Returns:
+        The session.
+    """
+    options = options or {}
+    if options.get("session"):
+        return options["session"]
+
+    return make_session(
+        options.get("pool_size", DEFAULT_POOL_SIZE),
+        options.get("max_connections_per_host"),
+        options.get("keep_alive", True),
+    )
+
+
+@contextmanager
+def session_for_call(request_options: dict, pool_size: int) -> Iterator[requests.Session]:
+    """
+    Yields the session passed in the request options, or a new one closed on exit.
+
+    Args:
+        request_options: The request options of the call.
+        pool_size: Maximum number of connections kept alive per host by a new session.
+    """
+    if request_options.get("session"):
+        yield request_options["session"]
+        return
+
+    with make_session(pool_size) as session:
+        yield session
+
+
+def with_session(request_options: dict, session: requests.Session) -> dict:
+    """Returns the request options sending their calls through the given session."""
+    if request_options.get("session") is session:
+        return request_options
+    if isinstance(request_options, RequestTemplate):
+        return request_options.with_overrides({"session": session})
+
+    return {**request_options, "session": session}
+
 
 def sanitise_config(options: Union[BeeRequestOptions, dict]) -> Union[BeeRequestOptions, dict]:
-    bad_configs = ["address", "signer", "Type", "limit", "offset"]
+    bad_configs = BAD_CONFIGS
     if isinstance(options, BeeRequestOptions):
         options = options.model_dump()
 
@@ -56,19 +249,20 @@ def http(
       A requests.Response object.
     """
 
+    if isinstance(options, RequestTemplate) and options.on_request:
+        request_config = options.build(config, sanitise)
+        if "http" not in request_config["url"]:
+            msg = f"Invalid URL: {request_config['url']}"
+            raise TypeError(msg)
+        session = options.session or requests
+        if options.flights is not None and options.flights.is_coalesced(request_config):
+            return options.flights.do(
+                get_request_key(request_config), lambda: send_request(options.retrier, session, request_config)
+            )
+        return send_request(options.retrier, session, request_config)
+
     # * convert the bee request options to a dictionary
-    if isinstance(options, BeeRequestOptions):
-        tmp_options = options.model_dump()
-        # * Dictionary to map old keys to new keys
-        key_mapping = {"base_url": "baseURL", "on_request": "onRequest"}
-
-        # * Replace keys
-        options = {key_mapping.get(k, k): v for k, v in tmp_options.items()}
-    else:  # noqa: PLR5501
-        if options:
-            tmp_options = options
-            key_mapping = {"base_url": "baseURL", "on_request": "onRequest"}
-            options = {key_mapping.get(k, k): v for k, v in tmp_options.items()}
+    options = normalise_options(options)
 
     try:
         intermediate_dict = always_merger.merge(config, options)
@@ -81,12 +275,21 @@ def http(
         if "http" not in request_config["url"]:
             msg = f"Invalid URL: {request_config['url']}"
             raise TypeError(msg)
-        response = requests.request(**request_config)
-        return response
+        # * a requests.Session passed in the options lets the calls reuse its connection pool
+        session = request_config.pop("session", None) or requests
+        return send_request(make_retrier(options), session, request_config)
     except Exception as e:
         raise e
 
 
+def send_request(retrier: Optional[Retrier], session, request_config: dict) -> requests.Response:
+    """Sends a request with the session, through the retrier if there is one."""
+    if retrier:
+        return retrier.send(session, request_config)
+
+    return session.request(**request_config)
+
+
 def maybe_run_on_request_hook(options: dict, request_config: dict) -> dict:
     """Runs the onRequest hook if it is defined.
 
@@ -114,6 +317,9 @@ def maybe_run_on_request_hook(options: dict, request_config: dict) -> dict:
             new_request_config.pop("baseURL", None)
             new_request_config.pop("onRequest", None)
             new_request_config.pop("retry", None)
+            new_request_config.pop("retry_policy", None)
+            new_request_config.pop("hedge", None)
+            new_request_config.pop("coalesce", None)
         return new_request_config
 
     return request_config
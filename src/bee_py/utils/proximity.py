@@ -0,0 +1,71 @@
+from collections.abc import Sequence
+from typing import Union
+
+from bee_py.utils.hex import hex_to_bytes
+
+# * maximum proximity order of two addresses, as in Bee
+MAX_PO = 31
+
+Address = Union[bytes, str]
+
+
+def _to_bytes(address: Address) -> bytes:
+    return hex_to_bytes(address) if isinstance(address, str) else bytes(address)
+
+
+def proximity(one: Address, other: Address, max_po: int = MAX_PO) -> int:
+    """
+    Returns the proximity order of two addresses, the number of leading bits they have in common.
+
+    It is the Kademlia bin one address falls into from the point of view of the other. Like in
+    Bee, it is at most `max_po`.
+
+    Args:
+        one: An overlay or chunk address, as bytes or hex.
+        other: Another overlay or chunk address, as bytes or hex.
+        max_po: The maximum proximity order.
+
+    Returns:
+        The proximity order.
+    """
+    one, other = _to_bytes(one), _to_bytes(other)
+
+    for index in range(min(max_po // 8 + 1, len(one), len(other))):
+        difference = one[index] ^ other[index]
+        if difference:
+            return min(index * 8 + 8 - difference.bit_length(), max_po)
+
+    return max_po
+
+
+def xor_distance(one: Address, other: Address) -> int:
+    """Returns the Kademlia distance of two addresses of the same length, their XOR as an integer."""
+    return int.from_bytes(_to_bytes(one), "big") ^ int.from_bytes(_to_bytes(other), "big")
+
+
+class ProximityRouter:
+    """
+    Ranks overlay addresses by their XOR distance to chunk addresses.
+
+    The overlays are converted to integers once, so ranking them for a chunk only takes one XOR
+    per overlay.
+    """
+
+    def __init__(self, overlays: Sequence[Address]):
+        self.overlays = [_to_bytes(overlay) for overlay in overlays]
+        self._overlay_numbers = [int.from_bytes(overlay, "big") for overlay in self.overlays]
+
+    def __len__(self) -> int:
+        return len(self.overlays)
+
+    def rank(self, address: Address) -> list[int]:
+        """Returns the indexes of the overlays from the closest to the address to the farthest."""
+        number = int.from_bytes(_to_bytes(address), "big")
+
+        return sorted(range(len(self._overlay_numbers)), key=lambda index: self._overlay_numbers[index] ^ number)
+
+    def closest(self, address: Address) -> int:
+        """Returns the index of the overlay closest to the address."""
+        number = int.from_bytes(_to_bytes(address), "big")
+
+        return min(range(len(self._overlay_numbers)), key=lambda index: self._overlay_numbers[index] ^ number)
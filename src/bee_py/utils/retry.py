@@ -0,0 +1,297 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Optional
+
+import requests
+
+from bee_py.types.type import HedgePolicy, RetryPolicy
+from bee_py.utils.urls import get_endpoint
+
+# * methods which can be repeated without changing the state of the node
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+# * writes which can be repeated, as the method and the endpoint. Stamp purchases, top-ups and
+# * dilutions, uploads and transactions are never retried
+IDEMPOTENT_WRITES = (("DELETE", "pins"), ("DELETE", "tags"), ("DELETE", "peers"), ("PUT", "stewardship"))
+# * endpoints whose GET requests are hedged
+HEDGED_ENDPOINTS = ("chunks", "feeds")
+# * number of latencies the hedging delay is computed from
+LATENCY_WINDOW = 256
+# * threads sending the hedged requests of a client
+HEDGE_WORKERS = 64
+
+
+class RetryBudget:
+    """
+    Thread-safe token bucket bounding the retries of a client.
+
+    Every request deposits `ratio` tokens and every retry takes one, so while a node keeps
+    failing the retries add at most `ratio` requests per request instead of multiplying the load.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class LatencyTracker:
+    """Thread-safe window of the latest request latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return None
+
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+
+def _close_response(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class Retrier:
+    """
+    Sends requests with the retries of a `RetryPolicy` and the hedging of a `HedgePolicy`.
+
+    One instance is shared by all the calls of a client, so they spend the same retry budget and
+    hedge after the same observed latencies.
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, hedge: Optional[HedgePolicy] = None, base_url: str = ""):
+        self.policy = policy or RetryPolicy(retries=0)
+        self.hedge = hedge
+        self.base_url = (base_url or "").rstrip("/")
+        self.budget = RetryBudget(self.policy.budget_ratio, self.policy.budget_max)
+        self.latencies = LatencyTracker()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def endpoint(self, url: str) -> str:
+        """Returns the first segment of the path of a request URL below the base URL, e.g. `chunks`."""
+        return get_endpoint(url, self.base_url)
+
+    def is_retryable(self, request_config: dict) -> bool:
+        method = request_config.get("method", "GET").upper()
+
+        return method in IDEMPOTENT_METHODS or (method, self.endpoint(request_config["url"])) in IDEMPOTENT_WRITES
+
+    def is_hedged(self, request_config: dict) -> bool:
+        return (
+            self.hedge is not None
+            and request_config.get("method", "GET").upper() == "GET"
+            and self.endpoint(request_config["url"]) in HEDGED_ENDPOINTS
+        )
+
+    def backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Returns the seconds to wait before a retry, honouring a `Retry-After` header in seconds."""
+        delay = min(self.policy.max_backoff, self.policy.backoff * 2**attempt)
+        if self.policy.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.policy.max_backoff))
+
+        return delay
+
+    def hedge_delay(self) -> Optional[float]:
+        """Returns the seconds to wait before hedging a request, `None` if it is not hedged yet."""
+        if self.hedge is None:
+            return None
+        if self.hedge.delay is not None:
+            return self.hedge.delay
+        if len(self.latencies) < self.hedge.min_samples:
+            return None
+
+        return max(self.hedge.min_delay, self.latencies.percentile(self.hedge.percentile))  # type: ignore[arg-type]
+
+    def send(self, session: Any, request_config: dict) -> requests.Response:
+        """
+        Sends a request, retrying it on timeouts, connection errors and retryable statuses.
+
+        Only idempotent requests are retried. The response of the last attempt is returned, or
+        its error raised, when the retries or the retry budget run out.
+
+        Args:
+            session: The `requests.Session`, or the `requests` module, sending the request.
+            request_config: The keyword arguments of `requests.request`.
+
+        Returns:
+            The response.
+        """
+        send = self._send_hedged if self.is_hedged(request_config) else self._send
+        retries = self.policy.retries if self.is_retryable(request_config) else 0
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = send(session, request_config)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= retries or not self.budget.withdraw():
+                    raise
+            else:
+                if response.status_code not in self.policy.statuses or attempt >= retries:
+                    return response
+                if not self.budget.withdraw():
+                    return response
+                response.close()
+
+            time.sleep(self.backoff_delay(attempt, response))
+            attempt += 1
+
+    async def send_async(
+        self, send: Callable[[dict], Awaitable[requests.Response]], request_config: dict
+    ) -> requests.Response:
+        """
+        The asyncio counterpart of `send`, with the same retries and retry budget but no hedging.
+
+        Args:
+            send: Sends one attempt of the request, raising the `requests` errors on timeouts
+                and connection errors.
+            request_config: The keyword arguments of `requests.request`.
+
+        Returns:
+            The response.
+        """
+        retries = self.policy.retries if self.is_retryable(request_config) else 0
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = await send(request_config)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= retries or not self.budget.withdraw():
+                    raise
+            else:
+                if response.status_code not in self.policy.statuses or attempt >= retries:
+                    return response
+                if not self.budget.withdraw():
+                    return response
+                response.close()
+
+            await asyncio.sleep(self.backoff_delay(attempt, response))
+            attempt += 1
+
+    def _send(self, session: Any, request_config: dict) -> requests.Response:
+        return session.request(**request_config)
+
+    def _send_timed(self, session: Any, request_config: dict) -> requests.Response:
+        start = time.perf_counter()
+        response = session.request(**request_config)
+        if response.status_code not in self.policy.statuses:
+            self.latencies.record(time.perf_counter() - start)
+
+        return response
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(HEDGE_WORKERS, thread_name_prefix="bee-hedge")
+            return self._executor
+
+    def _send_hedged(self, session: Any, request_config: dict) -> requests.Response:
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._send_timed(session, request_config)
+
+        executor = self._get_executor()
+        first = executor.submit(self._send_timed, session, request_config)
+        if wait([first], timeout=delay).done:
+            return first.result()
+
+        futures = [first, executor.submit(self._send_timed, session, request_config)]
+        fallback: Optional[requests.Response] = None
+        error: Optional[BaseException] = None
+
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                continue
+
+            if response.status_code in self.policy.statuses:
+                # * the first retryable response is kept in case the other attempt fails too
+                if fallback is None:
+                    fallback = response
+                else:
+                    response.close()
+                continue
+
+            if fallback is not None:
+                fallback.close()
+            else:
+                # * the response of the slower attempt is dropped once it arrives
+                for other in futures:
+                    if other is not future:
+                        other.add_done_callback(_close_response)
+            return response
+
+        if fallback is not None:
+            return fallback
+        raise error  # type: ignore[misc]
+
+
+def make_retrier(options: Optional[dict]) -> Optional[Retrier]:
+    """
+    Returns the retrier for the `retry`, `retry_policy` and `hedge` request options.
+
+    Args:
+        options: The normalised request options.
+
+    Returns:
+        The retrier, `None` if the requests are neither retried nor hedged.
+    """
+    options = options or {}
+    policy, hedge = options.get("retry_policy"), options.get("hedge")
+
+    if policy is not None:
+        policy = RetryPolicy.model_validate(policy)
+    elif isinstance(options.get("retry"), int) and options["retry"] > 0:
+        # * `assert_request_options` reports invalid counts
+        policy = RetryPolicy(retries=options["retry"])
+    if hedge is not None:
+        hedge = HedgePolicy.model_validate(hedge)
+
+    if (policy is None or policy.retries == 0) and hedge is None:
+        return None
+
+    return Retrier(policy, hedge, options.get("baseURL", ""))
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+from bee_py.utils.urls import get_endpoint
+
+T = TypeVar("T")
+
+# * endpoints whose concurrent identical GET requests share one request: chunks and data by
+# * `download_chunk` and `download_data`, feed lookups and postage batches
+COALESCED_ENDPOINTS = ("bytes", "chunks", "feeds", "stamps")
+# * request arguments with a body or a response body read by the caller, never shared
+UNSHARED_ARGUMENTS = ("data", "json", "files", "stream")
+
+RequestKey = tuple[str, str, tuple, tuple]
+
+
+def get_request_key(request_config: dict) -> RequestKey:
+    """
+    Returns what identifies a request: its method, URL, query parameters and headers.
+
+    The parameters and headers are compared in their order, which is the same for the calls
+    made by the same code, and header names are compared as they are. Requests only differing
+    in those are sent separately. Values that can not be hashed, like lists, are compared by
+    their `repr`.
+    """
+    params = request_config.get("params")
+    headers = request_config.get("headers")
+    key = (
+        request_config.get("method", "GET").upper(),
+        request_config["url"],
+        tuple(params.items()) if params else (),
+        tuple(headers.items()) if headers else (),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return (
+            key[0],
+            key[1],
+            tuple((name, repr(value)) for name, value in key[2]),
+            tuple((name, repr(value)) for name, value in key[3]),
+        )
+
+    return key
+
+
+class SingleFlight:
+    """
+    Thread-safe group collapsing concurrent identical GET requests into one.
+
+    While a request is in flight, the identical requests of other threads wait for it instead of
+    being sent and get the same response, or the same exception. One instance is shared by all
+    the calls of a client, like its `Retrier`.
+
+    The waiters share the `requests.Response` object, so it must be treated as read-only. Only
+    requests whose response body is read into memory are collapsed, see `is_coalesced`.
+    """
+
+    def __init__(self, base_url: str = ""):
+        self.base_url = base_url or ""
+        # * the URLs of the coalesced endpoints below the base URL, recognised without parsing
+        base = self.base_url.rstrip("/")
+        self._url_prefixes = tuple(f"{base}/{endpoint}/" for endpoint in COALESCED_ENDPOINTS) if base else ()
+        # * the future of a flight is only created once another request waits for it
+        self._flights: dict[RequestKey, Optional[Future]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def is_coalesced(self, request_config: dict) -> bool:
+        if request_config.get("method", "GET").upper() != "GET":
+            return False
+        url = request_config["url"]
+        if not url.startswith(self._url_prefixes) and get_endpoint(url, self.base_url) not in COALESCED_ENDPOINTS:
+            return False
+
+        return not any(request_config.get(argument) for argument in UNSHARED_ARGUMENTS)
+
+    def do(self, key: RequestKey, send: Callable[[], T]) -> T:
+        """
+        Returns the result of `send`, or of the call of `send` in flight for the same key.
+
+        Args:
+            key: The key of the request, see `get_request_key`.
+            send: Sends the request.
+
+        Returns:
+            The result of the only call of `send` for the key while it is in flight.
+        """
+        with self._lock:
+            is_leader = key not in self._flights
+            if is_leader:
+                self._flights[key] = None
+            else:
+                flight = self._flights[key]
+                if flight is None:
+                    flight = self._flights[key] = Future()
+
+        if not is_leader:
+            return flight.result()
+
+        try:
+            result = send()
+        except BaseException as e:
+            flight = self._land(key)
+            if flight is not None:
+                flight.set_exception(e)
+            raise
+
+        flight = self._land(key)
+        if flight is not None:
+            flight.set_result(result)
+        return result
+
+    def _land(self, key: RequestKey) -> Optional[Future]:
+        # * removed before the waiters are woken, so later requests are sent again
+        with self._lock:
+            return self._flights.pop(key)
@@ -1,5 +1,5 @@
 import os
-from typing import IO, Any, Union
+from typing import Any, Union
 
 from ens.utils import is_valid_ens_name  # type: ignore
 from swarm_cid import ReferenceType, decode_cid, encode_reference
@@ -7,10 +7,12 @@ from swarm_cid import ReferenceType, decode_cid, encode_reference
 from bee_py.types.type import (
     ADDRESS_HEX_LENGTH,
     BATCH_ID_HEX_LENGTH,
+    CHUNK_SIZE,
     ENCRYPTED_REFERENCE_HEX_LENGTH,
     PSS_TARGET_HEX_LENGTH_MAX,
     PUBKEY_HEX_LENGTH,
     REFERENCE_HEX_LENGTH,
+    SPAN_SIZE,
     AllTagsOptions,
     BeeRequestOptions,
     CollectionUploadOptions,
@@ -28,6 +30,7 @@ from bee_py.types.type import (
     UploadResult,
     UploadResultWithCid,
 )
+from bee_py.utils.data import is_upload_data
 from bee_py.utils.error import BeeArgumentError, BeeError
 from bee_py.utils.hex import assert_hex_string, is_hex_string, is_prefixed_hex_string
 from bee_py.utils.logging import logger
@@ -241,6 +244,30 @@ def assert_request_options(options: Any, name: str = "RequestOptions") -> None:
         logger.warning(f"Options set is of type {type(options)} not BeeRequestOptions")
 
 
+def assert_chunk_data(value: Any) -> None:
+    """
+    Asserts that a value is the data of a chunk: its span and a payload of at most `CHUNK_SIZE` bytes.
+
+    Args:
+        value (Any): The value to check.
+
+    Raises:
+        TypeError: If the value is not a bytes-like object.
+        BeeArgumentError: If the value is shorter than the span or longer than a chunk.
+    """
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        msg = "Data must be a bytes-like object!"
+        raise TypeError(msg)
+
+    if len(value) < SPAN_SIZE:
+        msg = f"Chunk must have a minimum size of {SPAN_SIZE} bytes. Received chunk size: {len(value)}"
+        raise BeeArgumentError(msg, value)
+
+    if len(value) > CHUNK_SIZE + SPAN_SIZE:
+        msg = f"Chunk must have a maximum size of {CHUNK_SIZE} bytes. Received chunk size: {len(value)}"
+        raise BeeArgumentError(msg, value)
+
+
 def assert_upload_options(value: Any, name: str = "UploadOptions") -> None:
     """
     Asserts that a value is a valid BeeRequestOptions object.
@@ -544,19 +571,19 @@ def assert_batch_id(value: Any) -> None:
     assert_hex_string(value, BATCH_ID_HEX_LENGTH)
 
 
-def assert_file_data(value: Union[str, bytes, IO]) -> None:
+def assert_file_data(value: Any) -> None:
     """
     Check whether the given parameter is a correct file representation for file upload.
     Raises TypeError if not valid.
 
     Args:
-        value (Union[str, ByteString, IO, File]): The value to check.
+        value (Any): The value to check.
 
     Raises:
         TypeError: If the value is not a valid file representation.
     """
-    if not isinstance(value, (str, bytes, IO)):
-        msg = "Data must be either str, bytes, IO, or File!"
+    if not is_upload_data(value):
+        msg = "Data must be either str, bytes, path, IO, or iterator of bytes!"
         raise TypeError(msg)
 
 
@@ -586,5 +613,11 @@ def assert_data(value: Any) -> None:
         raise TypeError(msg)
 
 
+def assert_upload_data(value: Any) -> None:
+    if not is_upload_data(value):
+        msg = "Data must be either string, bytes, path, file-like object or iterator of bytes"
+        raise TypeError(msg)
+
+
 def assert_address(value: Any) -> None:
     assert_hex_string(value, ADDRESS_HEX_LENGTH)
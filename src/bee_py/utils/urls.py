@@ -58,3 +58,19 @@ def strip_last_slash(url: str) -> str:
         return url[:-1]
     else:
         return url
+
+
+def get_endpoint(url: str, base_url: str = "") -> str:
+    """Returns the first segment of the path of a request URL below the base URL, e.g. `chunks`.
+
+    Args:
+      url: The URL of the request.
+      base_url: The URL of the Bee API the request is sent to.
+
+    Returns:
+      The endpoint of the request.
+    """
+    base_url = (base_url or "").rstrip("/")
+    path = url[len(base_url) :] if base_url and url.startswith(base_url) else urllib.parse.urlsplit(url).path
+
+    return urllib.parse.urlsplit(path).path.lstrip("/").split("/", 1)[0]
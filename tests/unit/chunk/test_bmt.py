@@ -1,6 +1,25 @@
+import random
+
+import pytest
 from eth_pydantic_types import HexBytes
 
-from bee_py.chunk.bmt import bmt_hash, bmt_root_hash
+from bee_py.chunk.bmt import (
+    BMT_DEPTH,
+    SEGMENT_COUNT,
+    BMTEngine,
+    PythonBMTEngine,
+    bmt_address_from_proof,
+    bmt_hash,
+    bmt_hash_many,
+    bmt_root_hash,
+    get_bmt_engine,
+    make_bmt_engine,
+    make_bmt_proof,
+    make_zero_hashes,
+    set_bmt_engine,
+    verify_bmt_proof,
+)
+from bee_py.chunk.span import make_span
 
 
 def test_bmt_root_hash_empty_payload():
@@ -37,3 +56,106 @@ def test_bmt_hash():
     _bmt_hash = bmt_hash(chunk_content)
     expected_hash = "ca6357a08e317d15ec560fef34e4c45f8f19f01c372aa70f1da72bfa7f1a4338"
     assert _bmt_hash == HexBytes(expected_hash)
+
+
+@pytest.mark.parametrize("payload_size", [0, 1, 31, 32, 33, 40, 64, 1000, 4095, 4096])
+def test_bmt_engines_are_byte_identical(payload_size):
+    payload = bytes(random.Random(payload_size).randrange(256) for _ in range(payload_size))
+    expected = PythonBMTEngine().root_hash(payload)
+
+    for name in ("python", "buffered"):
+        assert make_bmt_engine(name).root_hash(payload) == expected
+
+
+def test_bmt_engine_requires_root_hash():
+    class IncompleteEngine(BMTEngine):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteEngine()
+
+
+def test_set_bmt_engine():
+    default_engine = get_bmt_engine()
+    try:
+        set_bmt_engine("python")
+        assert isinstance(get_bmt_engine(), PythonBMTEngine)
+        assert bmt_hash(bytes([3, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3])) == HexBytes(
+            "ca6357a08e317d15ec560fef34e4c45f8f19f01c372aa70f1da72bfa7f1a4338"
+        )
+    finally:
+        set_bmt_engine(default_engine)
+
+    with pytest.raises(ValueError):
+        set_bmt_engine("unknown")
+    with pytest.raises(TypeError):
+        set_bmt_engine(1)
+
+
+def test_zero_hashes():
+    engine = make_bmt_engine("buffered")
+    zero_hashes = make_zero_hashes(engine.hasher)
+
+    assert len(zero_hashes) == BMT_DEPTH + 1
+    assert zero_hashes[0] == bytes(32)
+    assert zero_hashes[-1] == bmt_root_hash(b"")
+    assert engine.zero_hashes == zero_hashes
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_bmt_hash_many(max_workers):
+    rng = random.Random(max_workers)
+    chunks = [make_span(size) + rng.randbytes(size) for size in (1, 40, 4096, 300, 4000, 32, 77)]
+
+    hashes = bmt_hash_many(iter(chunks), batch_size=2, max_workers=max_workers)
+
+    assert list(hashes) == [bmt_hash(chunk) for chunk in chunks]
+
+
+def test_bmt_hash_many_empty_input():
+    assert list(bmt_hash_many([])) == []
+
+    with pytest.raises(ValueError):
+        list(bmt_hash_many([b""], batch_size=0))
+
+
+@pytest.mark.parametrize("size", [0, 1, 32, 33, 100, 2048, 4000, 4096])
+def test_bmt_proof_every_segment(size):
+    chunk = make_span(max(size, 1)) + random.Random(size).randbytes(size)
+    address = bmt_hash(chunk)
+    # * leave stale nodes of a full chunk in the level buffer
+    bmt_hash(make_span(4096) + bytes(range(256)) * 16)
+
+    for index in range(SEGMENT_COUNT):
+        proof = make_bmt_proof(chunk, index)
+
+        assert len(proof.sisters) == BMT_DEPTH
+        assert proof.segment == (chunk[8:] + bytes(4096))[index * 32 : (index + 1) * 32]
+        assert verify_bmt_proof(proof, address)
+
+
+def test_bmt_proof_with_python_engine():
+    chunk = make_span(100) + bytes(range(100))
+    set_bmt_engine("python")
+    try:
+        proof = make_bmt_proof(chunk, 2)
+    finally:
+        set_bmt_engine("buffered")
+
+    assert bmt_address_from_proof(proof) == bmt_hash(chunk)
+
+
+def test_bmt_proof_tampered():
+    chunk = make_span(4096) + bytes(range(256)) * 16
+    address = bmt_hash(chunk)
+    proof = make_bmt_proof(chunk, 5)
+
+    assert not verify_bmt_proof(proof.model_copy(update={"segment": bytes(32)}), address)
+    assert not verify_bmt_proof(proof.model_copy(update={"segment_index": 4}), address)
+    assert not verify_bmt_proof(proof.model_copy(update={"sisters": proof.sisters[:-1]}), address)
+
+
+@pytest.mark.parametrize("index", [-1, SEGMENT_COUNT])
+def test_bmt_proof_invalid_index(index):
+    with pytest.raises(ValueError):
+        make_bmt_proof(make_span(1) + b"a", index)
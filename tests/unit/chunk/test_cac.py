@@ -1,6 +1,12 @@
 import pytest
 
-from bee_py.chunk.cac import assert_valid_chunk_data, make_content_addressed_chunk
+from bee_py.chunk.cac import (
+    RawChunk,
+    assert_valid_chunk_data,
+    is_valid_chunk_data,
+    make_content_addressed_chunk,
+    make_content_addressed_chunks,
+)
 from bee_py.chunk.serialize import serialize_bytes
 from bee_py.chunk.span import make_span
 from bee_py.utils.hex import assert_bytes, hex_to_bytes
@@ -24,3 +30,47 @@ def test_content_address_chunk_verification(payload, content_hash, invalid_addre
         assert_valid_chunk_data(data, invalid_address)
 
     assert_valid_chunk_data(data, valid_address)
+
+
+def test_make_content_addressed_chunks(payload):
+    payloads = [payload, b"hello", bytes(4096)]
+
+    chunks = list(make_content_addressed_chunks(iter(payloads), batch_size=1, max_workers=2))
+
+    assert [chunk.payload for chunk in chunks] == payloads
+    assert [chunk.address for chunk in chunks] == [make_content_addressed_chunk(p).address for p in payloads]
+
+
+def test_raw_chunk_shares_buffer(payload):
+    data = serialize_bytes(make_span(len(payload)), payload)
+    chunk = RawChunk(data)
+
+    assert chunk.span.obj is data
+    assert chunk.payload.obj is data
+    assert chunk.span == make_span(len(payload))
+    assert chunk.payload == payload
+
+
+def test_raw_chunk_lazy_address(payload):
+    chunk = RawChunk(serialize_bytes(make_span(len(payload)), payload))
+
+    assert chunk._address is None
+    assert chunk.address == make_content_addressed_chunk(payload).address
+    assert RawChunk(chunk.data, b"known").address == b"known"
+
+
+def test_raw_chunk_to_chunk(payload):
+    chunk = RawChunk(serialize_bytes(make_span(len(payload)), payload)).to_chunk()
+
+    assert chunk == make_content_addressed_chunk(payload)
+
+
+def test_is_valid_chunk_data_buffers_and_sizes(payload, content_hash):
+    data = serialize_bytes(make_span(len(payload)), payload)
+    address = hex_to_bytes(content_hash)
+
+    assert is_valid_chunk_data(memoryview(data), address)
+    assert is_valid_chunk_data(bytearray(data), address)
+    assert not is_valid_chunk_data(data[:4], address)
+    assert not is_valid_chunk_data(data + bytes(4096), address)
+    assert not is_valid_chunk_data(data.hex(), address)
@@ -0,0 +1,148 @@
+import io
+import re
+
+import pytest
+
+from bee_py.chunk.joiner import (
+    ChunkCache,
+    child_span_capacity,
+    download_data_parallel,
+    iter_data_parallel,
+    read_range,
+)
+from bee_py.chunk.splitter import compute_reference, split_data
+from bee_py.types.type import BRANCHES, CHUNK_SIZE
+from bee_py.utils.error import BeeArgumentError, BeeError
+from bee_py.utils.hex import bytes_to_hex
+
+MOCK_SERVER_URL = "http://localhost:12345/"
+REQUEST_OPTIONS = {"baseURL": MOCK_SERVER_URL, "timeout": 300, "onRequest": True}
+
+
+def serve_chunks(requests_mock, data):
+    store = {bytes_to_hex(chunk.address): chunk.data for chunk in split_data(data)}
+
+    def chunk_data(request, context):  # noqa: ARG001
+        return store[request.path.rsplit("/", 1)[-1]]
+
+    requests_mock.get(re.compile(f"{MOCK_SERVER_URL}chunks/"), content=chunk_data)
+
+    return store
+
+
+@pytest.mark.parametrize(
+    "span_length, expected",
+    [
+        (CHUNK_SIZE + 1, CHUNK_SIZE),
+        (CHUNK_SIZE * BRANCHES, CHUNK_SIZE),
+        (CHUNK_SIZE * BRANCHES + 1, CHUNK_SIZE * BRANCHES),
+    ],
+)
+def test_child_span_capacity(span_length, expected):
+    assert child_span_capacity(span_length) == expected
+
+
+@pytest.mark.parametrize("size", [1, CHUNK_SIZE, CHUNK_SIZE * 3 + 5, CHUNK_SIZE * BRANCHES + 1])
+def test_download_data_parallel(requests_mock, size):
+    data = bytes(i % 251 for i in range(size))
+    store = serve_chunks(requests_mock, data)
+    sink = io.BytesIO()
+
+    written = download_data_parallel(REQUEST_OPTIONS, compute_reference(data), sink, max_concurrency=4)
+
+    assert written == size
+    assert sink.getvalue() == data
+    assert requests_mock.call_count == len(store)
+
+
+def test_download_data_parallel_callable_sink(requests_mock):
+    data = b"hello world" * 1000
+    serve_chunks(requests_mock, data)
+    pieces = []
+
+    download_data_parallel(REQUEST_OPTIONS, str(compute_reference(data)), pieces.append)
+
+    assert b"".join(pieces) == data
+    assert len(pieces) == 3
+
+
+def test_iter_data_parallel_invalid_chunk(requests_mock):
+    data = b"hello world" * 1000
+    store = serve_chunks(requests_mock, data)
+    leaf = next(address for address, chunk in store.items() if len(chunk) == CHUNK_SIZE + 8)
+    store[leaf] = store[leaf][:-1] + b"\x00"
+
+    with pytest.raises(BeeError, match="does not match its address"):
+        list(iter_data_parallel(REQUEST_OPTIONS, compute_reference(data)))
+
+
+def test_iter_data_parallel_encrypted_reference():
+    with pytest.raises(BeeArgumentError):
+        list(iter_data_parallel(REQUEST_OPTIONS, bytes(64)))
+
+
+@pytest.mark.parametrize(
+    "offset, length",
+    [
+        (0, 10),
+        (CHUNK_SIZE - 5, 10),
+        (CHUNK_SIZE * 5, CHUNK_SIZE * 2),
+        (CHUNK_SIZE * BRANCHES - 3, 6),
+        (CHUNK_SIZE * BRANCHES + 50, 100),
+        (100, 0),
+    ],
+)
+def test_read_range(requests_mock, offset, length):
+    data = bytes(i % 251 for i in range(CHUNK_SIZE * BRANCHES + 100))
+    serve_chunks(requests_mock, data)
+
+    assert read_range(REQUEST_OPTIONS, compute_reference(data), offset, length) == data[offset : offset + length]
+
+
+def test_read_range_fetches_only_covering_chunks(requests_mock):
+    data = bytes(i % 251 for i in range(CHUNK_SIZE * 10))
+    serve_chunks(requests_mock, data)
+
+    read_range(REQUEST_OPTIONS, compute_reference(data), CHUNK_SIZE * 3 + 10, CHUNK_SIZE)
+
+    # * the root chunk and the two data chunks covering the range
+    assert requests_mock.call_count == 3
+
+
+def test_read_range_past_end(requests_mock):
+    data = b"hello world" * 1000
+    serve_chunks(requests_mock, data)
+
+    assert read_range(REQUEST_OPTIONS, compute_reference(data), len(data) - 5, 100) == data[-5:]
+    assert read_range(REQUEST_OPTIONS, compute_reference(data), len(data) + 5, 100) == b""
+
+
+def test_read_range_caches_intermediate_chunks(requests_mock):
+    data = bytes(i % 251 for i in range(CHUNK_SIZE * BRANCHES + 100))
+    serve_chunks(requests_mock, data)
+    reference = compute_reference(data)
+    cache = ChunkCache()
+
+    read_range(REQUEST_OPTIONS, reference, 10, 10, cache=cache)
+    assert requests_mock.call_count == 3
+    assert len(cache) == 2
+
+    assert read_range(REQUEST_OPTIONS, reference, 20, 10, cache=cache) == data[20:30]
+    assert requests_mock.call_count == 4
+
+
+def test_read_range_negative_offset():
+    with pytest.raises(BeeArgumentError):
+        read_range(REQUEST_OPTIONS, bytes(32), -1, 10)
+
+
+def test_chunk_cache_evicts_least_recently_used():
+    cache = ChunkCache(max_chunks=2)
+    cache.put(b"a", b"1")
+    cache.put(b"b", b"2")
+    cache.get(b"a")
+    cache.put(b"c", b"3")
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"1"
+    assert len(cache) == 2
@@ -1,10 +1,22 @@
+import os
+
 import eth_utils
 import pytest
 from eth_account.messages import encode_defunct
 from eth_pydantic_types import HexBytes
 from eth_utils import is_same_address
 
-from bee_py.chunk.signer import public_key_to_address, sign
+from bee_py.chunk import signer as signer_module
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.chunk.signer import (
+    PrivateKeySigner,
+    make_private_key_signer,
+    public_key_to_address,
+    recover_address,
+    sign,
+)
+from bee_py.chunk.soc import make_single_owner_chunk
+from bee_py.feed.feed import make_feed_writer
 
 expected_signature_hex = "1bf05d437c1146b84b2cd410a25b70d300abdd54f4df17256472b2402849c07b5c240387a4ab5dfdc49c150997f435a7e66d0d001ba59b87600423a583f50ed0d0"  # noqa: E501
 
@@ -47,3 +59,82 @@ def test_fail_public_key_to_address(pub_key):
     else:
         with pytest.raises(ValueError):
             public_key_to_address(pub_key)
+
+
+@pytest.fixture
+def private_key_signer(signer):
+    return make_private_key_signer(signer.private_key)
+
+
+@pytest.mark.parametrize("use_coincurve", [True, False])
+def test_private_key_signer_matches_ape_signatures(signer, private_key_signer, use_coincurve):
+    if not use_coincurve:
+        private_key_signer._signing_key = None
+    elif private_key_signer._signing_key is None:
+        pytest.skip("coincurve is not installed")
+
+    for _ in range(20):
+        digest = os.urandom(32)
+        assert private_key_signer.sign_digest(digest) == sign(data=digest, account=signer).encode_rsv()  # type: ignore
+
+    assert private_key_signer.address == signer.address
+    signature = sign(data="Hi from bee_py", account=private_key_signer)
+    assert signature.encode_vrs().hex() == expected_signature_hex  # type: ignore[union-attr]
+
+
+def test_private_key_signer_signs_single_owner_chunks(signer, private_key_signer):
+    chunk = make_content_addressed_chunk(b"hello world")
+    identifier = os.urandom(32)
+
+    soc = make_single_owner_chunk(chunk, identifier, private_key_signer)
+
+    assert soc == make_single_owner_chunk(chunk, identifier, signer)
+    assert isinstance(make_feed_writer({}, "sequence", "00" * 32, private_key_signer).signer, PrivateKeySigner)
+
+
+@pytest.mark.parametrize("private_key", ["0x1234", b"\x01" * 31, bytes(32)])
+def test_private_key_signer_invalid_keys(private_key):
+    with pytest.raises((ValueError, eth_utils.exceptions.ValidationError)):
+        make_private_key_signer(private_key)
+
+
+def test_private_key_signer_does_not_sign_transactions(private_key_signer):
+    with pytest.raises(TypeError, match="does not sign transactions"):
+        private_key_signer.sign_transaction({"nonce": 0})
+
+
+@pytest.mark.parametrize("use_coincurve", [True, False])
+def test_recover_address(monkeypatch, private_key_signer, use_coincurve):
+    if not use_coincurve:
+        monkeypatch.setattr(signer_module, "_recover_public_key", signer_module._eth_keys_recover_public_key)
+    elif signer_module.coincurve is None:
+        pytest.skip("coincurve is not installed")
+    signer_module._recover_address.cache_clear()
+
+    signatures = [(private_key_signer.sign_digest(digest), digest) for digest in (os.urandom(32) for _ in range(20))]
+
+    # * both recovery ids are recovered
+    assert {signature[64] for signature, _ in signatures} == {27, 28}
+    for signature, digest in signatures:
+        assert recover_address(signature, digest) == private_key_signer.address
+        assert (
+            recover_address(memoryview(signature[:64] + bytes((signature[64] - 27,))), digest)
+            == private_key_signer.address
+        )
+
+
+def test_recover_address_cache(private_key_signer):
+    signer_module._recover_address.cache_clear()
+    digest = os.urandom(32)
+    signature = private_key_signer.sign_digest(digest)
+
+    for _ in range(3):
+        recover_address(signature, digest)
+
+    assert signer_module._recover_address.cache_info().hits == 2
+
+
+@pytest.mark.parametrize("signature", [bytes(64), bytes(64) + b"\x1d", bytes(65)])
+def test_recover_address_invalid_signatures(signature):
+    with pytest.raises(ValueError):
+        recover_address(signature, os.urandom(32))
@@ -1,5 +1,15 @@
+import pytest
+
 from bee_py.chunk.cac import make_content_addressed_chunk
-from bee_py.chunk.soc import make_single_owner_chunk
+from bee_py.chunk.signer import make_private_key_signer
+from bee_py.chunk.soc import (
+    make_single_owner_chunk,
+    make_single_owner_chunk_from_data,
+    make_single_owner_chunks,
+    upload_single_owner_chunk,
+    verify_single_owner_chunks,
+)
+from bee_py.utils.error import BeeError
 from bee_py.utils.hex import bytes_to_hex
 
 
@@ -17,3 +27,84 @@ def test_single_owner_chunk_creation(signer):
 
     assert soc_address == soc_hash
     assert owner == signer.address
+
+
+def soc_items(count: int) -> list[tuple[bytes, bytes]]:
+    return [(index.to_bytes(32, "big"), bytes([index % 256]) * (index % 4096 + 1)) for index in range(count)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_make_single_owner_chunks(signer, max_workers):
+    private_key_signer = make_private_key_signer(signer.private_key)
+    items = soc_items(5)
+
+    chunks = list(make_single_owner_chunks(iter(items), private_key_signer, batch_size=2, max_workers=max_workers))
+
+    assert len(chunks) == len(items)
+    for chunk, (identifier, payload) in zip(chunks, items):
+        expected = make_single_owner_chunk(make_content_addressed_chunk(payload), identifier, private_key_signer)
+        assert chunk.data == expected.data
+        assert chunk.address == expected.address
+        assert chunk.owner == signer.address
+        assert bytes(chunk.identifier) == identifier
+        assert bytes(chunk.payload) == payload
+        assert chunk.to_chunk() == expected
+
+
+def test_make_single_owner_chunks_ape_account(signer):
+    items = soc_items(3)
+
+    chunks = list(make_single_owner_chunks(items, signer, batch_size=2, max_workers=2))
+
+    assert [chunk.data for chunk in chunks] == [
+        make_single_owner_chunk(make_content_addressed_chunk(payload), identifier, signer).data
+        for identifier, payload in items
+    ]
+
+
+@pytest.mark.parametrize("item", [(bytes(31), b"a"), (bytes(32), b""), (bytes(32), bytes(4097))])
+def test_make_single_owner_chunks_invalid_items(signer, item):
+    with pytest.raises(ValueError):
+        list(make_single_owner_chunks([item], signer))
+
+
+def test_upload_raw_single_owner_chunk(signer, requests_mock, bee_ky_options, bee_url):
+    chunk = next(make_single_owner_chunks(soc_items(1), signer))
+    owner = signer.address[2:]
+    identifier = bytes_to_hex(bytes(chunk.identifier))
+    reference = bytes_to_hex(chunk.address)
+    url = f"{bee_url}/soc/{owner}/{identifier}"
+    requests_mock.post(url, json={"reference": reference}, status_code=201)
+
+    result = upload_single_owner_chunk(bee_ky_options, chunk, "0" * 64)
+
+    assert result.value == reference
+    assert requests_mock.last_request.body == bytes(chunk.content)
+    assert requests_mock.last_request.qs["sig"] == [bytes_to_hex(bytes(chunk.signature))]
+
+
+def test_make_single_owner_chunk_from_data(signer):
+    chunk = next(make_single_owner_chunks(soc_items(1), signer))
+
+    soc = make_single_owner_chunk_from_data(chunk.data, bytes_to_hex(chunk.address))
+
+    assert soc == chunk.to_chunk()
+    with pytest.raises(BeeError):
+        make_single_owner_chunk_from_data(chunk.data, bytes(32))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_verify_single_owner_chunks(signer, max_workers):
+    chunks = list(make_single_owner_chunks(soc_items(5), make_private_key_signer(signer.private_key)))
+    tampered = bytearray(chunks[1].data)
+    tampered[-1] ^= 1
+    items = [(chunk.data, chunk.address) for chunk in chunks]
+    items[1] = (bytes(tampered), chunks[1].address)
+    items[3] = (chunks[3].data, chunks[4].address)
+    items.append((chunks[0].data[:100], chunks[0].address))
+
+    results = list(verify_single_owner_chunks(iter(items), batch_size=2, max_workers=max_workers))
+
+    assert [result is not None for result in results] == [True, False, True, False, True, False]
+    assert all(result.owner == signer.address for result in results if result is not None)
+    assert results[4].data == chunks[4].data  # type: ignore[union-attr]
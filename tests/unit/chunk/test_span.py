@@ -1,6 +1,6 @@
 import pytest
 
-from bee_py.chunk.span import make_span
+from bee_py.chunk.span import get_span_value, make_span
 from bee_py.utils.error import BeeArgumentError
 
 
@@ -33,3 +33,13 @@ def test_make_span_zero_length():
 def test_make_span_too_big_length():
     with pytest.raises(BeeArgumentError):
         make_span(2**32)
+
+
+@pytest.mark.parametrize("length", [0, 1, 4096, 2**32 - 1, 2**40])
+def test_get_span_value(length):
+    assert get_span_value(length.to_bytes(8, "little")) == length
+
+
+def test_get_span_value_invalid_size():
+    with pytest.raises(BeeArgumentError):
+        get_span_value(b"\x01\x00")
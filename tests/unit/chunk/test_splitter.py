@@ -0,0 +1,80 @@
+import io
+import struct
+
+import pytest
+
+from bee_py.chunk.bmt import bmt_hash
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.chunk.splitter import assert_expected_reference, compute_reference, split_data, unique_chunks
+from bee_py.types.type import BRANCHES, CHUNK_SIZE, UploadResult
+from bee_py.utils.error import BeeError
+from bee_py.utils.hex import bytes_to_hex
+
+# * reference of an empty upload to `/bytes`
+EMPTY_DATA_REFERENCE = "b34ca8c22b9e982354f9c7f50b470d66db428d880c8a904d5fe4ec9713171526"
+
+
+def test_compute_reference_single_chunk(payload):
+    assert str(compute_reference(payload)) == bytes_to_hex(make_content_addressed_chunk(payload).address)
+
+
+def test_compute_reference_empty_data():
+    assert str(compute_reference(b"")) == EMPTY_DATA_REFERENCE
+
+
+def test_split_data_two_levels():
+    data = bytes(range(256)) * 20
+
+    chunks = list(split_data(data))
+
+    assert len(chunks) == 3
+    root = chunks[-1]
+    assert root.span == struct.pack("<Q", len(data))
+    assert root.payload == chunks[0].address + chunks[1].address
+    assert root.address == bmt_hash(root.data)
+
+
+def test_split_data_carries_orphan_reference():
+    data = bytes(CHUNK_SIZE * BRANCHES + 1)
+
+    chunks = list(split_data(data))
+    intermediate, orphan, root = chunks[BRANCHES:]
+
+    assert len(chunks) == BRANCHES + 3
+    assert intermediate.payload == b"".join(chunk.address for chunk in chunks[:BRANCHES])
+    assert intermediate.span == struct.pack("<Q", CHUNK_SIZE * BRANCHES)
+    # * the last data chunk is not wrapped, the root references it directly
+    assert orphan.payload == bytes(1)
+    assert root.payload == intermediate.address + orphan.address
+    assert root.span == struct.pack("<Q", len(data))
+
+
+@pytest.mark.parametrize(
+    "make_input",
+    [
+        lambda data: data,
+        lambda data: io.BytesIO(data),
+        lambda data: iter([data[:100], data[100:5000], data[5000:]]),
+    ],
+)
+def test_split_data_input_types(make_input):
+    data = bytes(range(256)) * 50
+
+    assert compute_reference(make_input(data)) == compute_reference(data)
+
+
+def test_unique_chunks():
+    data = bytes(range(256)) * 16 * 3
+
+    chunks = list(split_data(data))
+
+    assert len(chunks) == 4
+    assert len(list(unique_chunks(chunks))) == 2
+
+
+def test_assert_expected_reference(test_chunk_hash_str):
+    assert_expected_reference(test_chunk_hash_str, UploadResult(reference={"value": test_chunk_hash_str}))
+    assert_expected_reference(bytes.fromhex(test_chunk_hash_str), test_chunk_hash_str.upper())
+
+    with pytest.raises(BeeError):
+        assert_expected_reference(test_chunk_hash_str, EMPTY_DATA_REFERENCE)
@@ -0,0 +1,130 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from bee_py.feed import feed
+from bee_py.feed.cursor import FeedIndexCursor
+from bee_py.feed.feed import make_feed_writer
+from bee_py.feed.identifiers import make_feed_identifier
+from bee_py.utils.hash import keccak256_hash
+from bee_py.utils.hex import bytes_to_hex, hex_to_bytes
+
+TOPIC = "ab" * 32
+REFERENCE = "ca6357a08e317d15ec560fef34e4c45f8f19f01c372aa70f1da72bfa7f1a4338"
+
+
+def feed_identifier(index: int) -> str:
+    return bytes_to_hex(make_feed_identifier(TOPIC, f"{index:016x}"))
+
+
+def soc_reference(request, context):
+    owner, identifier = request.path.split("/")[-2:]
+    context.status_code = 201
+    return {"reference": bytes_to_hex(keccak256_hash(hex_to_bytes(identifier), hex_to_bytes(owner)))}
+
+
+def uploaded_identifiers(requests_mock) -> list[str]:
+    return [request.path.rsplit("/", 1)[-1] for request in requests_mock.request_history if request.method == "POST"]
+
+
+@pytest.fixture
+def feed_mock(requests_mock, bee_url):
+    requests_mock.get(re.compile(f"{bee_url}/feeds/"), status_code=404, json={"message": "Not Found"})
+    requests_mock.post(re.compile(f"{bee_url}/soc/"), json=soc_reference)
+    return requests_mock
+
+
+def test_writer_looks_the_index_up_once(feed_mock, bee_ky_options, signer, test_batch_id):
+    writer = make_feed_writer(bee_ky_options, "sequence", TOPIC, signer)
+
+    for _ in range(3):
+        writer.upload(test_batch_id, REFERENCE)
+
+    assert [request.method for request in feed_mock.request_history] == ["GET", "POST", "POST", "POST"]
+    assert feed_mock.request_history[0].qs["type"] == ["sequence"]
+    assert uploaded_identifiers(feed_mock) == [feed_identifier(index) for index in range(3)]
+
+
+def test_writer_looks_the_index_up_after_a_conflict(feed_mock, bee_url, bee_ky_options, signer, test_batch_id):
+    cursor = FeedIndexCursor()
+    cursor.put(signer.address, TOPIC, 1)
+    feed_mock.post(re.compile(f"{bee_url}/soc/.*/{feed_identifier(1)}"), status_code=409, json={"message": "Conflict"})
+    feed_mock.get(
+        re.compile(f"{bee_url}/feeds/"),
+        json={"reference": REFERENCE},
+        headers={"swarm-feed-index": "0000000000000004", "swarm-feed-index-next": "0000000000000005"},
+    )
+
+    make_feed_writer(bee_ky_options, "sequence", TOPIC, signer, cursor).upload(test_batch_id, REFERENCE)
+
+    assert uploaded_identifiers(feed_mock) == [feed_identifier(1), feed_identifier(5)]
+    assert cursor.get(signer.address, TOPIC) == 6
+
+
+def test_writer_forwards_the_update_options_to_the_lookup(
+    feed_mock, monkeypatch, bee_ky_options, signer, test_batch_id
+):
+    lookups = []
+    original_find_next_index = feed.find_next_index
+
+    def find_next_index(request_options, owner, topic, options):
+        lookups.append(dict(options))
+        return original_find_next_index(request_options, owner, topic, options)
+
+    monkeypatch.setattr("bee_py.feed.feed.find_next_index", find_next_index)
+    make_feed_writer(bee_ky_options, "sequence", TOPIC, signer).upload(test_batch_id, REFERENCE, {"at": 1234})
+
+    assert lookups[0]["at"] == 1234
+    assert lookups[0]["type"] == "sequence"
+    assert feed_mock.request_history[0].qs["type"] == ["sequence"]
+
+
+def test_concurrent_writers_reserve_distinct_indexes(feed_mock, bee_ky_options, signer, test_batch_id):
+    writer = make_feed_writer(bee_ky_options, "sequence", TOPIC, signer)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: writer.upload(test_batch_id, REFERENCE), range(16)))
+
+    assert sorted(uploaded_identifiers(feed_mock)) == sorted(feed_identifier(index) for index in range(16))
+
+
+def test_failed_upload_resets_the_cursor(feed_mock, bee_url, bee_ky_options, signer, test_batch_id):
+    cursor = FeedIndexCursor()
+    cursor.put(signer.address, TOPIC, 3)
+    feed_mock.post(re.compile(f"{bee_url}/soc/"), status_code=500, json={"message": "Internal Server Error"})
+
+    with pytest.raises(requests.HTTPError):
+        make_feed_writer(bee_ky_options, "sequence", TOPIC, signer, cursor).upload(test_batch_id, REFERENCE)
+
+    assert cursor.get(signer.address, TOPIC) is None
+
+
+def test_writer_without_cursor(feed_mock, bee_ky_options, signer, test_batch_id):
+    writer = make_feed_writer(bee_ky_options, "sequence", TOPIC, signer, cursor=False)
+
+    for _ in range(2):
+        writer.upload(test_batch_id, REFERENCE)
+
+    assert [request.method for request in feed_mock.request_history] == ["GET", "POST", "GET", "POST"]
+
+
+def test_persisted_cursor(tmp_path, signer):
+    path = tmp_path / "feeds" / "indexes.json"
+    FeedIndexCursor(path).put(signer.address, TOPIC.upper(), 7)
+
+    cursor = FeedIndexCursor(path)
+    assert cursor.get(signer.address.lower(), f"0x{TOPIC}") == 7
+
+    assert cursor.take(signer.address, TOPIC) == 7
+    assert FeedIndexCursor(path).get(signer.address, TOPIC) == 8
+
+    cursor.reset(signer.address, TOPIC)
+    assert FeedIndexCursor(path).get(signer.address, TOPIC) is None
+    assert cursor.take(signer.address, TOPIC) is None
+    assert cursor.take(signer.address, TOPIC, 2) == 2
+    assert cursor.get(signer.address, TOPIC) == 3
+
+    path.write_text("{not json")
+    assert FeedIndexCursor(path).get(signer.address, TOPIC) is None
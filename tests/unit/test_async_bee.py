@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bee_py.async_bee import AsyncBee, AsyncBeeDebug
+from bee_py.bee import Bee
+from bee_py.bee_debug import BeeDebug
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.utils.error import BeeArgumentError
+from bee_py.utils.hex import bytes_to_hex
+
+MOCK_SERVER_URL = "http://localhost:12345/"
+HEALTH_RESPONSE = {"status": "ok", "version": "1.17.0", "apiVersion": "4.0.0", "debugApiVersion": "4.0.0"}
+
+
+@pytest.mark.parametrize("async_class, sync_class", [(AsyncBee, Bee), (AsyncBeeDebug, BeeDebug)])
+def test_same_method_surface(async_class, sync_class):
+    for name, method in vars(sync_class).items():
+        if not name.startswith("_") and inspect.isfunction(method):
+            assert inspect.iscoroutinefunction(getattr(async_class, name))
+            assert getattr(async_class, name).__doc__ == method.__doc__
+
+
+async def serve(routes: list) -> TestServer:
+    app = web.Application()
+    app.add_routes(routes)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+@pytest.mark.asyncio
+async def test_download_chunks_natively():
+    chunk = make_content_addressed_chunk(b"hello world")
+    reference = bytes_to_hex(chunk.address)
+    in_flight, most_in_flight = 0, 0
+
+    async def chunk_data(request):  # noqa: ARG001
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.Response(body=chunk.data)
+
+    server = await serve([web.get(f"/chunks/{reference}", chunk_data)])
+    async with AsyncBee(str(server.make_url("/")), max_concurrency=4) as bee:
+        results = await asyncio.gather(*(bee.download_chunk(reference) for _ in range(20)))
+        # * no request went through the thread pool
+        assert not bee._executor._threads
+    await server.close()
+
+    assert [result.data for result in results] == [chunk.data] * 20
+    assert 1 < most_in_flight <= 4
+
+
+@pytest.mark.asyncio
+async def test_upload_chunk_and_download_data_natively(test_batch_id):
+    chunk = make_content_addressed_chunk(b"hello world")
+    reference = bytes_to_hex(chunk.address)
+    uploaded = []
+
+    async def upload_chunk(request):
+        uploaded.append((await request.read(), request.headers["swarm-postage-batch-id"]))
+        return web.json_response({"reference": reference})
+
+    server = await serve(
+        [web.post("/chunks", upload_chunk), web.get(f"/bytes/{reference}", lambda _: web.Response(body=b"data"))]
+    )
+    async with AsyncBee(str(server.make_url("/"))) as bee:
+        result = await bee.upload_chunk(test_batch_id, chunk.data)
+        data = await bee.download_data(reference)
+    await server.close()
+
+    assert str(result) == reference
+    assert uploaded == [(chunk.data, test_batch_id)]
+    assert data.data == b"data"
+
+
+@pytest.mark.asyncio
+async def test_native_calls_are_retried():
+    reference = "ab" * 32
+    attempts = []
+
+    async def flaky(request):
+        attempts.append(request)
+        return web.Response(status=503) if len(attempts) == 1 else web.Response(body=b"chunk")
+
+    server = await serve([web.get(f"/chunks/{reference}", flaky)])
+    async with AsyncBee(str(server.make_url("/")), {"retry_policy": {"retries": 1, "backoff": 0}}) as bee:
+        result = await bee.download_chunk(reference)
+    await server.close()
+
+    assert result.data == b"chunk"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_bee_shares_sync_attributes():
+    async with AsyncBee(MOCK_SERVER_URL, {"timeout": 10}, max_concurrency=4) as bee:
+        assert bee.url == MOCK_SERVER_URL.rstrip("/")
+        assert bee.session.get_adapter(MOCK_SERVER_URL)._pool_maxsize == 4
+        assert bee.request_options.timeout == 10
+
+
+class ClosedSession(requests.Session):
+    closed = False
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+@pytest.mark.asyncio
+async def test_closes_only_the_sessions_it_created(monkeypatch):
+    session = ClosedSession()
+    async with AsyncBee(MOCK_SERVER_URL, {"session": session}):
+        pass
+    assert not session.closed
+
+    monkeypatch.setattr(requests, "Session", ClosedSession)
+    async with AsyncBee(MOCK_SERVER_URL) as bee:
+        own_session = bee.session
+    assert own_session.closed
+
+
+@pytest.mark.asyncio
+async def test_async_bee_validation_errors():
+    async with AsyncBee(MOCK_SERVER_URL) as bee:
+        with pytest.raises(TypeError):
+            await bee.download_chunk(reference=1)
+        with pytest.raises(BeeArgumentError):
+            await bee.upload_chunk("ab" * 32, b"span")
+
+
+@pytest.mark.asyncio
+async def test_async_bee_debug(requests_mock):
+    requests_mock.get(f"{MOCK_SERVER_URL}health", json=HEALTH_RESPONSE)
+
+    async with AsyncBeeDebug(MOCK_SERVER_URL) as bee_debug:
+        health = await bee_debug.get_health()
+
+    assert health.version == "1.17.0"
+
+
+def test_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncBee(MOCK_SERVER_URL, max_concurrency=0)
@@ -1,12 +1,22 @@
+import io
 import json
+import re
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pydantic
 import pytest
+import requests
 
 from bee_py.bee import Bee
+from bee_py.chunk.bmt import bmt_hash
+from bee_py.chunk.splitter import compute_reference, split_data
 from bee_py.feed.topic import make_topic_from_string
+from bee_py.types.type import Reference
 from bee_py.utils.error import BeeArgumentError, BeeError
+from bee_py.utils.hash import keccak256_hash
+from bee_py.utils.hex import bytes_to_hex, hex_to_bytes
 
 TOPIC = "some=very%nice#topic"
 HASHED_TOPIC = make_topic_from_string(TOPIC)
@@ -1045,3 +1055,296 @@ def test_create_postage_batch(input_value, expected_error_type):
     with pytest.raises(expected_error_type):
         bee = Bee(MOCK_SERVER_URL, input_value)
         bee.create_postage_batch("10", 17, input_value)
+
+
+def test_upload_data_parallel(requests_mock, test_batch_id):
+    data = bytes(range(256)) * 16 * 3 + b"tail"
+
+    def chunk_reference(request, context):
+        context.status_code = 201
+        return {"reference": bmt_hash(request.body).hex().replace("0x", "")}
+
+    requests_mock.post(f"{MOCK_SERVER_URL}chunks", json=chunk_reference)
+    uploaded = []
+
+    bee = Bee(MOCK_SERVER_URL)
+    result = bee.upload_data_parallel(
+        test_batch_id, data, max_concurrency=2, on_chunk_uploaded=lambda _, ref: uploaded.append(ref)
+    )
+
+    assert result.reference == compute_reference(data)
+    # * the three identical data chunks are uploaded once
+    assert len(uploaded) == requests_mock.call_count == 3
+    assert all(request.headers["swarm-postage-batch-id"] == test_batch_id for request in requests_mock.request_history)
+
+
+def test_upload_data_parallel_retries_failed_chunks(requests_mock, test_batch_id):
+    data = b"hello world"
+    reference = str(compute_reference(data))
+    requests_mock.post(
+        f"{MOCK_SERVER_URL}chunks",
+        [{"status_code": 500, "json": {"message": "busy"}}, {"status_code": 201, "json": {"reference": reference}}],
+    )
+
+    result = Bee(MOCK_SERVER_URL).upload_data_parallel(test_batch_id, data)
+
+    assert str(result.reference) == reference
+    assert requests_mock.call_count == 2
+
+
+def test_upload_data_parallel_unexpected_reference(requests_mock, test_batch_id, test_chunk_hash_str):
+    requests_mock.post(f"{MOCK_SERVER_URL}chunks", status_code=201, json={"reference": test_chunk_hash_str})
+
+    with pytest.raises(BeeError):
+        Bee(MOCK_SERVER_URL).upload_data_parallel(test_batch_id, b"hello world")
+
+
+def soc_reference(request, context):
+    # * the address of a SOC is the hash of its identifier and owner
+    owner, identifier = request.path.split("/")[-2:]
+    context.status_code = 201
+    return {"reference": bytes_to_hex(keccak256_hash(bytes.fromhex(identifier), bytes.fromhex(owner)))}
+
+
+class SOCSession:
+    """Answers SOC uploads with their address after a delay, counting the uploads in flight."""
+
+    def __init__(self):
+        self.in_flight = self.most_in_flight = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def request(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+
+        owner, identifier = kwargs["url"].split("/")[-2:]
+        response = requests.Response()
+        response.status_code = 201
+        response._content = json.dumps(
+            {"reference": bytes_to_hex(keccak256_hash(bytes.fromhex(identifier), bytes.fromhex(owner)))}
+        ).encode()
+        return response
+
+
+def test_pipelined_soc_writer(test_batch_id, signer):
+    session = SOCSession()
+    items = [(index.to_bytes(32, "big"), b"update %d" % index) for index in range(8)]
+    bee = Bee(MOCK_SERVER_URL, {"signer": signer, "session": session})
+
+    with bee.make_pipelined_soc_writer(test_batch_id, window=2) as writer:
+        futures = [writer.write(*items[0]), *writer.write_many(items[1:])]
+
+    owner = hex_to_bytes(signer.address)
+    assert [future.result().value for future in futures] == [
+        bytes_to_hex(keccak256_hash(identifier, owner)) for identifier, _ in items
+    ]
+    assert writer.errors == []
+    # * the uploads overlap, but never more than the window
+    assert session.most_in_flight == 2
+    assert all(call["params"]["sig"] for call in session.calls)
+
+
+def test_pipelined_soc_writer_reports_failed_chunks(requests_mock, test_batch_id, signer):
+    failing = (1).to_bytes(32, "big")
+    requests_mock.post(re.compile(f"{MOCK_SERVER_URL}soc/"), json=soc_reference)
+    requests_mock.post(
+        re.compile(f"{MOCK_SERVER_URL}soc/.*/{failing.hex()}"), status_code=400, json={"message": "Bad Request"}
+    )
+
+    with Bee(MOCK_SERVER_URL, {"signer": signer}).make_pipelined_soc_writer(test_batch_id) as writer:
+        futures = writer.write_many((index.to_bytes(32, "big"), b"data") for index in range(3))
+
+    assert isinstance(futures[1].exception(), requests.HTTPError)
+    assert futures[0].result() and futures[2].result()
+    assert [bytes(chunk.identifier) for chunk, _ in writer.errors] == [failing]
+
+
+def test_download_data_parallel(requests_mock):
+    data = bytes(range(256)) * 16 * 3 + b"tail"
+    store = {bytes_to_hex(chunk.address): chunk.data for chunk in split_data(data)}
+    requests_mock.get(
+        re.compile(f"{MOCK_SERVER_URL}chunks/"), content=lambda request, _: store[request.path.rsplit("/", 1)[-1]]
+    )
+    sink = io.BytesIO()
+
+    written = Bee(MOCK_SERVER_URL).download_data_parallel(compute_reference(data), sink, max_concurrency=2)
+
+    assert written == len(data)
+    assert sink.getvalue() == data
+
+
+def test_read_range(requests_mock):
+    # * leaf chunks with distinct content, the concurrent downloads of identical ones are coalesced
+    data = bytes(i % 251 for i in range(4096 * 3)) + b"tail"
+    store = {bytes_to_hex(chunk.address): chunk.data for chunk in split_data(data)}
+    requests_mock.get(
+        re.compile(f"{MOCK_SERVER_URL}chunks/"), content=lambda request, _: store[request.path.rsplit("/", 1)[-1]]
+    )
+    bee = Bee(MOCK_SERVER_URL)
+
+    assert bee.read_range(compute_reference(data), 4090, 20).data == data[4090:4110]
+    assert bee.read_range(compute_reference(data), len(data) - 4, 4).text() == "tail"
+    # * the root chunk is fetched once and then served from the cache
+    assert requests_mock.call_count == 4
+
+
+def test_calls_share_pooled_session(requests_mock, test_chunk_hash_str):
+    requests_mock.get(f"{MOCK_SERVER_URL}bytes/{test_chunk_hash_str}", content=b"hello")
+    session = requests.Session()
+    sent = []
+    session.hooks["response"].append(lambda response, **_: sent.append(response))
+    bee = Bee(MOCK_SERVER_URL, {"session": session})
+
+    bee.download_data(test_chunk_hash_str)
+    bee.download_data(test_chunk_hash_str, {"timeout": 10})
+
+    assert bee.session is session
+    assert len(sent) == 2
+
+
+def record_streamed_upload(requests_mock, endpoint: str, uploads: list):
+    def reference(request, context):
+        body = request.body
+        if hasattr(body, "read"):
+            body = body.read()
+        elif not isinstance(body, (bytes, bytearray, memoryview)):
+            body = b"".join(body)
+        uploads.append((request.headers, bytes(body)))
+        context.status_code = 201
+        return {"reference": "e032d8ddc7227d0d6c4d0f87db16027924216afd0c00012884ba7af835b4a7c7"}
+
+    requests_mock.post(f"{MOCK_SERVER_URL}{endpoint}", json=reference)
+
+
+def test_upload_data_streams_paths_files_and_iterators(requests_mock, test_batch_id, tmp_path):
+    uploads: list = []
+    record_streamed_upload(requests_mock, "bytes", uploads)
+    data = bytes(range(256)) * 100
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    bee = Bee(MOCK_SERVER_URL)
+    bee.upload_data(test_batch_id, path)
+    with open(path, "rb") as file:
+        bee.upload_data(test_batch_id, file)
+    bee.upload_data(test_batch_id, iter([data[:1000], data[1000:]]))
+
+    assert [body for _, body in uploads] == [data] * 3
+    assert uploads[0][0]["Content-Length"] == uploads[1][0]["Content-Length"] == str(len(data))
+    assert uploads[2][0]["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in uploads[2][0]
+
+
+def test_upload_file_streams_with_known_size(requests_mock, test_batch_id, tmp_path):
+    uploads: list = []
+    record_streamed_upload(requests_mock, "bzz", uploads)
+    path = tmp_path / "nice.txt"
+    path.write_bytes(b"hello world")
+
+    bee = Bee(MOCK_SERVER_URL)
+    bee.upload_file(test_batch_id, path)
+    bee.upload_file(test_batch_id, iter([b"hello", b" world"]), "nice.txt", {"size": 11})
+
+    assert [body for _, body in uploads] == [b"hello world"] * 2
+    assert all(headers["Content-Length"] == "11" for headers, _ in uploads)
+    assert all("Transfer-Encoding" not in headers for headers, _ in uploads)
+    assert requests_mock.request_history[0].qs["name"] == ["nice.txt"]
+
+
+def test_upload_chunk_accepts_memoryview(requests_mock, test_batch_id):
+    uploads: list = []
+    record_streamed_upload(requests_mock, "chunks", uploads)
+    data = memoryview(bytearray(b"\x0b" + bytes(7) + b"hello world"))
+
+    Bee(MOCK_SERVER_URL).upload_chunk(test_batch_id, data)
+
+    assert uploads[0][1] == bytes(data)
+
+
+def test_download_readable_data_streams(requests_mock, test_chunk_hash_str, tmp_path):
+    data = bytes(range(256)) * 40
+    requests_mock.get(f"{MOCK_SERVER_URL}bytes/{test_chunk_hash_str}", content=data, headers={"x-test": "1"})
+    bee = Bee(MOCK_SERVER_URL)
+
+    stream = bee.download_readable_data(test_chunk_hash_str, read_size=4096)
+
+    assert requests_mock.last_request.stream
+    assert stream.headers["x-test"] == "1"
+    assert [len(piece) for piece in stream] == [4096, 4096, 2048]
+    assert stream.closed
+
+    path = tmp_path / "data.bin"
+    assert bee.download_readable_data(test_chunk_hash_str).save(path) == len(data)
+    assert path.read_bytes() == data
+
+    with open(tmp_path / "fd.bin", "wb") as file:
+        bee.download_readable_data(test_chunk_hash_str, read_size=1000).save(file.fileno())
+    assert (tmp_path / "fd.bin").read_bytes() == data
+
+    with bee.download_readable_data(test_chunk_hash_str) as stream:
+        assert stream.read(10) == data[:10]
+    assert stream.closed
+
+
+def test_download_readable_file_streams(requests_mock, test_chunk_hash_str):
+    requests_mock.get(
+        f"{MOCK_SERVER_URL}bzz/{test_chunk_hash_str}/",
+        content=b"hello world",
+        headers={"Content-Disposition": 'attachment; filename="nice.txt"', "Content-Type": "text/plain"},
+    )
+
+    file = Bee(MOCK_SERVER_URL).download_readable_file(test_chunk_hash_str)
+
+    assert file.headers.name == "nice.txt"
+    assert file.data.read() == b"hello world"
+
+
+FILE_HEADERS = {"Content-Disposition": 'attachment; filename="hello.txt"', "Content-Type": "text/plain"}
+
+
+def test_content_cache_serves_repeated_downloads(requests_mock, tmp_path):
+    data = b"hello world"
+    chunk = next(iter(split_data(data)))
+    reference = str(compute_reference(data))
+    requests_mock.get(f"{MOCK_SERVER_URL}bytes/{reference}", content=data)
+    requests_mock.get(f"{MOCK_SERVER_URL}chunks/{reference}", content=bytes(chunk.data))
+    requests_mock.get(f"{MOCK_SERVER_URL}bzz/{reference}/", content=data, headers=FILE_HEADERS)
+    bee = Bee(MOCK_SERVER_URL, {"cache_size": 1024, "cache_dir": str(tmp_path)})
+
+    for _ in range(2):
+        assert bee.download_data(reference).data == data
+        assert bee.download_chunk(reference.upper()).data == bytes(chunk.data)
+        assert bee.download_file(reference).data == data
+    assert requests_mock.call_count == 3
+
+    restarted = Bee(MOCK_SERVER_URL, {"cache_dir": str(tmp_path)})
+    assert restarted.download_data(reference).data == data
+    assert restarted.download_chunk(Reference(value=reference)).data == bytes(chunk.data)
+    assert requests_mock.call_count == 3
+    # * files are only kept in memory
+    assert restarted.download_file(reference).headers.content_type == "text/plain"
+    assert requests_mock.call_count == 4
+
+
+def test_content_cache_skips_mutable_downloads(requests_mock, test_chunk_hash_str):
+    data = b"hello world"
+    reference = str(compute_reference(data))
+    requests_mock.get(
+        f"{MOCK_SERVER_URL}bzz/{reference}/", content=data, headers={**FILE_HEADERS, "swarm-feed-index": "00"}
+    )
+    requests_mock.get(f"{MOCK_SERVER_URL}bytes/{test_chunk_hash_str}", content=data)
+    bee = Bee(MOCK_SERVER_URL, {"cache_size": 1024})
+
+    for _ in range(2):
+        bee.download_file(reference)
+        # * the data does not match the reference
+        bee.download_data(test_chunk_hash_str)
+
+    assert requests_mock.call_count == 4
+    assert Bee(MOCK_SERVER_URL).content_cache is None
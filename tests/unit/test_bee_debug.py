@@ -106,6 +106,19 @@ def test_default_headers_and_use_them_if_specified(requests_mock):
     assert bee.deposit_tokens("10") == TRANSACTION_HASH
 
 
+def test_calls_share_pooled_session(requests_mock):
+    requests_mock.post("http://localhost:12345/chequebook/deposit?amount=10", json=CASHOUT_RESPONSE)
+    bee = BeeDebug(MOCK_SERVER_URL, {"max_connections_per_host": 4})
+    sent = []
+    bee.session.hooks["response"].append(lambda response, **_: sent.append(response))
+
+    bee.deposit_tokens("10")
+    bee.deposit_tokens("10", options={"timeout": 10})
+
+    assert len(sent) == 2
+    assert bee.session.get_adapter(MOCK_SERVER_URL)._pool_maxsize == 4
+
+
 @pytest.mark.parametrize("input_value, expected_error_type", request_options_assertions)
 def test_remove_peer(input_value, expected_error_type, test_chunk_hash_str):
     bee = BeeDebug(MOCK_SERVER_URL)
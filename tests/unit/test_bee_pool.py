@@ -0,0 +1,208 @@
+import inspect
+
+import pytest
+import requests
+
+from bee_py.bee import Bee
+from bee_py.bee_pool import EWMA, BeePool, get_issued_keys, get_routed_address, get_sticky_keys
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.types.type import Reference, Tag, UploadResult
+from bee_py.utils.hex import bytes_to_hex
+
+NODE_URLS = ["http://node-a:1633", "http://node-b:1633", "http://node-c:1633"]
+DEBUG_URLS = ["http://node-a:1635", "http://node-b:1635", "http://node-c:1635"]
+HEALTH_RESPONSE = {"status": "ok", "version": "1.17.0", "apiVersion": "4.0.0", "debugApiVersion": "4.0.0"}
+TAG_RESPONSE = {"uid": 7, "startedAt": "2024-01-01T00:00:00Z"}
+CHUNK = make_content_addressed_chunk(b"hello world")
+REFERENCE = bytes_to_hex(CHUNK.address)
+
+
+def mock_chunk(requests_mock, url, **kwargs):
+    return requests_mock.get(f"{url}/chunks/{REFERENCE}", **({"content": CHUNK.data} if not kwargs else kwargs))
+
+
+def called_hosts(requests_mock) -> list[str]:
+    return [request.netloc.split(":")[0] for request in requests_mock.request_history]
+
+
+def test_same_method_surface():
+    for name, method in vars(Bee).items():
+        if not name.startswith("_") and inspect.isfunction(method):
+            assert getattr(BeePool, name).__doc__ == method.__doc__
+
+
+def test_spreads_calls_over_the_nodes(requests_mock):
+    for url in NODE_URLS:
+        mock_chunk(requests_mock, url)
+    pool = BeePool(NODE_URLS)
+
+    results = [pool.download_chunk(REFERENCE) for _ in range(6)]
+
+    assert all(result.data == CHUNK.data for result in results)
+    assert sorted(called_hosts(requests_mock)) == ["node-a", "node-a", "node-b", "node-b", "node-c", "node-c"]
+    assert all(node.outstanding == 0 and node.latency is not None for node in pool.nodes)
+
+
+def test_ewma_prefers_the_fastest_node(requests_mock):
+    for url in NODE_URLS:
+        mock_chunk(requests_mock, url)
+    pool = BeePool(NODE_URLS, strategy=EWMA)
+    for node, latency in zip(pool.nodes, (0.5, 0.01, 0.2)):
+        node.latency = latency
+
+    for _ in range(3):
+        pool.download_chunk(REFERENCE)
+
+    assert set(called_hosts(requests_mock)) == {"node-b"}
+
+
+def test_ejects_failing_nodes(requests_mock):
+    mock_chunk(requests_mock, NODE_URLS[0], exc=requests.ConnectionError)
+    mock_chunk(requests_mock, NODE_URLS[1], status_code=500, json={"message": "Internal Server Error"})
+    mock_chunk(requests_mock, NODE_URLS[2])
+    pool = BeePool(NODE_URLS, max_failures=1)
+
+    for _ in range(3):
+        try:
+            pool.download_chunk(REFERENCE)
+        except requests.RequestException:
+            pass
+    requests_mock.reset_mock()
+
+    for _ in range(3):
+        pool.download_chunk(REFERENCE)
+
+    assert [node.url for node in pool.available_nodes] == [NODE_URLS[2]]
+    assert set(called_hosts(requests_mock)) == {"node-c"}
+
+
+def test_not_found_is_not_a_node_failure(requests_mock):
+    mock_chunk(requests_mock, NODE_URLS[0], status_code=404, json={"message": "Not Found"})
+    pool = BeePool(NODE_URLS[:1], max_failures=1)
+
+    with pytest.raises(requests.HTTPError):
+        pool.download_chunk(REFERENCE)
+
+    assert pool.available_nodes == pool.nodes
+
+
+def test_uses_every_node_when_all_are_ejected(requests_mock):
+    mock_chunk(requests_mock, NODE_URLS[0])
+    pool = BeePool(NODE_URLS[:1])
+    pool.nodes[0].ejected_until = float("inf")
+
+    assert pool.download_chunk(REFERENCE).data == CHUNK.data
+
+
+def test_check_health(requests_mock):
+    for url in NODE_URLS:
+        requests_mock.get(f"{url}/", text="Ethereum Swarm Bee")
+    requests_mock.get(f"{DEBUG_URLS[0]}/health", json=HEALTH_RESPONSE)
+    requests_mock.get(f"{DEBUG_URLS[1]}/health", json={**HEALTH_RESPONSE, "status": "nok"})
+    requests_mock.get(f"{DEBUG_URLS[2]}/health", exc=requests.ConnectTimeout)
+    pool = BeePool(NODE_URLS, debug_urls=DEBUG_URLS)
+
+    assert pool.check_health() == {NODE_URLS[0]: True, NODE_URLS[1]: False, NODE_URLS[2]: False}
+    assert [node.url for node in pool.available_nodes] == NODE_URLS[:1]
+
+    requests_mock.get(f"{DEBUG_URLS[1]}/health", json=HEALTH_RESPONSE)
+    pool.check_health()
+    assert [node.url for node in pool.available_nodes] == NODE_URLS[:2]
+
+
+def test_tags_stick_to_the_node_which_issued_them(requests_mock):
+    requests_mock.post(f"{NODE_URLS[1]}/tags", json=TAG_RESPONSE, status_code=201)
+    for url in NODE_URLS:
+        requests_mock.get(f"{url}/tags/7", json=TAG_RESPONSE)
+    pool = BeePool(NODE_URLS)
+    pool.nodes[0].outstanding = pool.nodes[2].outstanding = 1
+
+    tag = pool.create_tag()
+    pool.nodes[0].outstanding = pool.nodes[2].outstanding = 0
+    # * even when ejected
+    pool.nodes[1].ejected_until = float("inf")
+    for _ in range(3):
+        pool.retrieve_tag(tag)
+        pool.retrieve_tag(tag.uid)
+
+    assert set(called_hosts(requests_mock)) == {"node-b"}
+
+
+def test_stick_batch(requests_mock, test_batch_id):
+    for url in NODE_URLS:
+        requests_mock.post(f"{url}/bytes", json={"reference": REFERENCE}, status_code=201)
+    pool = BeePool(NODE_URLS)
+
+    pool.stick_batch(test_batch_id.upper(), f"{NODE_URLS[2]}/")
+    for _ in range(3):
+        pool.upload_data(test_batch_id, b"hello world")
+
+    assert set(called_hosts(requests_mock)) == {"node-c"}
+    with pytest.raises(ValueError):
+        pool.stick_batch(test_batch_id, "http://elsewhere:1633")
+
+
+def test_sticky_keys():
+    tag = Tag.model_validate(TAG_RESPONSE)
+
+    assert get_sticky_keys({"tag_uid": tag}) == [("tag", 7)]
+    assert get_sticky_keys({"postage_batch_id": "AB", "options": {"tag": 3}}) == [("tag", 3), ("batch", "ab")]
+    assert get_sticky_keys({"reference": REFERENCE, "options": None}) == []
+    assert get_issued_keys("upload_data", UploadResult(reference=Reference(value=REFERENCE), tagUid=5)) == [("tag", 5)]
+    assert get_issued_keys("create_postage_batch", "AB") == [("batch", "ab")]
+    assert get_issued_keys("get_all_tags", [tag]) == [("tag", 7)]
+
+
+def overlay_near_chunk(proximity_order: int) -> str:
+    """Returns an overlay sharing exactly `proximity_order` leading bits with the chunk address."""
+    number = int.from_bytes(CHUNK.address, "big") ^ (1 << (255 - proximity_order))
+    return number.to_bytes(32, "big").hex()
+
+
+def test_routes_chunk_retrievals_to_the_closest_node(requests_mock):
+    for url in NODE_URLS:
+        mock_chunk(requests_mock, url)
+    pool = BeePool(NODE_URLS, overlays=[overlay_near_chunk(po) for po in (0, 20, 8)])
+
+    for _ in range(3):
+        pool.download_chunk(REFERENCE)
+    pool.nodes[1].ejected_until = float("inf")
+    pool.download_chunk(REFERENCE)
+
+    assert called_hosts(requests_mock) == ["node-b", "node-b", "node-b", "node-c"]
+
+
+def test_discover_overlays(requests_mock):
+    overlays = [overlay_near_chunk(po) for po in (3, 1, 9)]
+    for url, debug_url, overlay in zip(NODE_URLS, DEBUG_URLS, overlays):
+        mock_chunk(requests_mock, url)
+        requests_mock.get(
+            f"{debug_url}/addresses",
+            json={"overlay": overlay, "underlay": [], "ethereum": "", "publicKey": "", "pssPublicKey": ""},
+        )
+    pool = BeePool(NODE_URLS, debug_urls=DEBUG_URLS)
+
+    assert pool.discover_overlays() == overlays
+    pool.download_chunk(REFERENCE)
+
+    assert called_hosts(requests_mock)[-1] == "node-c"
+    assert pool.nodes[2].overlay == bytes.fromhex(overlays[2])
+    with pytest.raises(ValueError):
+        BeePool(NODE_URLS).discover_overlays()
+
+
+def test_routed_address():
+    assert get_routed_address("download_chunk", {"reference": REFERENCE}) == CHUNK.address
+    assert get_routed_address("download_chunk", {"reference": "swarm.eth"}) is None
+    assert get_routed_address("download_data", {"reference": REFERENCE}) is None
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        BeePool([])
+    with pytest.raises(ValueError):
+        BeePool(NODE_URLS, debug_urls=DEBUG_URLS[:1])
+    with pytest.raises(ValueError):
+        BeePool(NODE_URLS, strategy="random")
+    with pytest.raises(ValueError):
+        BeePool(NODE_URLS, overlays=[REFERENCE])
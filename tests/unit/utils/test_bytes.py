@@ -1,6 +1,7 @@
 import pytest
 
 from bee_py.types.type import BrandedString, Data, FlavoredType, HexString
+from bee_py.utils.bytes import bytes_equal
 
 
 def test_wrap_bytes_with_helpers_text(wrapped_bytes):
@@ -49,3 +50,19 @@ def test_data_hex():
 def test_data_str_json_output():
     data = Data(data="hello world")
     assert data.to_json() == {"hello": "world"}
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (b"\x01\x02", b"\x01\x02", True),
+        (b"\x01\x02", b"\x01\x03", False),
+        (b"\x01\x02", b"\x01", False),
+        (b"\x01\x02", memoryview(b"\x00\x01\x02")[1:], True),
+        (bytearray(b"\x01"), b"\x01", True),
+        ([1, 2], b"\x01\x02", True),
+        ("0102", b"0102", False),
+    ],
+)
+def test_bytes_equal(a, b, expected):
+    assert bytes_equal(a, b) is expected
@@ -0,0 +1,99 @@
+import pytest
+
+from bee_py.chunk.cac import make_content_addressed_chunk
+from bee_py.chunk.splitter import compute_reference
+from bee_py.utils.cache import ContentCache, is_cacheable_reference, make_content_cache_from_options
+from bee_py.utils.hex import bytes_to_hex
+
+DATA = b"hello swarm" * 1000
+
+
+@pytest.fixture
+def chunk():
+    chunk = make_content_addressed_chunk(b"hello swarm")
+    return bytes_to_hex(chunk.address), bytes(chunk.data)
+
+
+def test_is_cacheable_reference():
+    assert is_cacheable_reference("ab" * 32)
+    assert not is_cacheable_reference("ab" * 64)
+    assert not is_cacheable_reference("swarm.eth")
+    assert not is_cacheable_reference(b"\xab" * 32)
+
+
+def test_put_verifies_chunks_and_data(chunk):
+    address, data = chunk
+    reference = str(compute_reference(DATA))
+    cache = ContentCache()
+
+    assert not cache.put_chunk(address, data[:-1] + b"!")
+    assert not cache.put_data(reference, DATA + b"!")
+    assert len(cache) == 0
+
+    assert cache.put_chunk(address, data)
+    assert cache.put_data(reference, DATA)
+    assert cache.get_chunk(address) == data
+    assert cache.get_data(reference) == DATA
+    assert cache.get_data(address) is None
+
+
+def test_put_skips_what_can_not_be_stored(chunk, monkeypatch):
+    address, data = chunk
+    cache = ContentCache(max_bytes=len(DATA) - 1)
+
+    def fail_compute_reference(data):  # noqa: ARG001
+        msg = "hashed data which can not be stored"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("bee_py.utils.cache.compute_reference", fail_compute_reference)
+
+    assert not cache.put_data("ab" * 32, DATA)
+    cache.put_file("ab" * 32, "big", DATA, {})
+    assert cache.put_chunk(address, data)
+    assert len(cache) == 1
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = ContentCache(max_bytes=10)
+    cache.put_file("ab" * 32, "a", b"1234", {})
+    cache.put_file("ab" * 32, "b", b"5678", {})
+    cache.get_file("ab" * 32, "a")
+    cache.put_file("ab" * 32, "c", b"901", {})
+
+    assert cache.get_file("ab" * 32, "a") is not None
+    assert cache.get_file("ab" * 32, "b") is None
+    assert cache.size == 7
+
+    cache.put_file("ab" * 32, "big", bytes(11), {})
+    assert cache.get_file("ab" * 32, "big") is None
+    assert cache.size == 7
+
+
+def test_directory_outlives_the_cache_and_is_verified(chunk, tmp_path):
+    address, data = chunk
+    cache = ContentCache(directory=tmp_path)
+    cache.put_chunk(address, data)
+    cache.put_file(address, "index.html", b"<html>", {"name": "index.html"})
+
+    assert cache.get_file(address, "index.html") == (b"<html>", {"name": "index.html"})
+
+    restarted = ContentCache(directory=tmp_path)
+    assert restarted.get_chunk(address) == data
+    # * files can not be verified, they are only kept in memory
+    assert restarted.get_file(address, "index.html") is None
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+
+    for path in tmp_path.glob("*.bin"):
+        path.write_bytes(path.read_bytes() + b"tampered")
+
+    tampered = ContentCache(directory=tmp_path)
+    assert tampered.get_chunk(address) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_make_content_cache_from_options(tmp_path):
+    assert make_content_cache_from_options(None) is None
+    assert make_content_cache_from_options({"pool_size": 10}) is None
+    assert make_content_cache_from_options({"cache_size": 100}).max_bytes == 100  # type: ignore[union-attr]
+    cache = make_content_cache_from_options({"cache_dir": str(tmp_path)})
+    assert cache.directory == tmp_path  # type: ignore[union-attr]
@@ -0,0 +1,77 @@
+import io
+import os
+
+import pytest
+
+from bee_py.utils.data import SizedStream, get_upload_size, is_upload_data, open_download_sink, open_upload_body
+
+
+def test_is_upload_data(tmp_path):
+    assert all(
+        is_upload_data(value)
+        for value in ("text", b"bytes", bytearray(1), memoryview(b"1"), tmp_path, io.BytesIO(), iter([b""]))
+    )
+    assert not any(is_upload_data(value) for value in (1, None, [], {}, [b"list"], lambda: b""))
+
+
+def test_get_upload_size(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(100))
+
+    assert get_upload_size("ü") == 2
+    assert get_upload_size(memoryview(bytes(8)).cast("Q")) == 8
+    assert get_upload_size(path) == 100
+    with open(path, "rb") as file:
+        file.seek(40)
+        assert get_upload_size(file) == 60
+    assert get_upload_size(iter([b"data"])) is None
+
+    read_end, write_end = os.pipe()
+    with os.fdopen(read_end, "rb") as pipe:
+        assert get_upload_size(pipe) is None
+    os.close(write_end)
+
+
+def test_open_upload_body(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"data")
+
+    with open_upload_body(path) as body:
+        assert body.read() == b"data"
+    assert body.closed
+
+    with open_upload_body("data") as body:
+        assert body == b"data"
+
+    pieces = iter([b"da", b"ta"])
+    with open_upload_body(pieces) as body:
+        assert body is pieces
+
+    with open_upload_body(iter([b"da", b"ta"]), 4) as body:
+        assert isinstance(body, SizedStream)
+        assert len(body) == 4
+        assert b"".join(body) == b"data"
+
+    with pytest.raises(TypeError), open_upload_body([b"data"]):
+        pass
+
+
+def test_open_download_sink(tmp_path):
+    with open_download_sink(tmp_path / "path.bin") as write:
+        write(memoryview(b"path"))
+    assert (tmp_path / "path.bin").read_bytes() == b"path"
+
+    sink = io.BytesIO()
+    with open_download_sink(sink) as write:
+        write(memoryview(b"file"))
+    assert sink.getvalue() == b"file"
+
+    read_end, write_end = os.pipe()
+    with open_download_sink(write_end) as write:
+        write(memoryview(b"fd"))
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as pipe:
+        assert pipe.read() == b"fd"
+
+    with pytest.raises(TypeError), open_download_sink(None):  # type: ignore[arg-type]
+        pass
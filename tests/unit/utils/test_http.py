@@ -1,4 +1,17 @@
-from bee_py.utils.http import http
+import copy
+from urllib.parse import urljoin
+
+import pytest
+import requests
+
+from bee_py.utils.http import (
+    RequestTemplate,
+    http,
+    make_session,
+    make_session_from_options,
+    session_for_call,
+    with_session,
+)
 
 BEE_API_URL = "http://localhost:12345/"
 
@@ -22,3 +35,110 @@ def test_handle_non_json_response_for_404(requests_mock, ky_options):
     response = http(ky_options, config)
 
     assert response.status_code == 404
+
+
+def test_http_uses_session_from_options(requests_mock, ky_options):
+    requests_mock.get("http://localhost:12345/endpoint", text="ok")
+    session = make_session()
+    sent = []
+    session.hooks["response"].append(lambda response, **_: sent.append(response))
+
+    http({**ky_options, "session": session}, {"url": BEE_API_URL + "endpoint", "method": "get"})
+
+    assert len(sent) == 1
+
+
+def test_make_session_pool_settings():
+    session = make_session(4)
+    adapter = session.get_adapter(BEE_API_URL)
+
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block is False
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_make_session_max_connections_per_host_and_keep_alive():
+    session = make_session(4, max_connections_per_host=2, keep_alive=False)
+    adapter = session.get_adapter(BEE_API_URL)
+
+    assert adapter._pool_maxsize == 2
+    assert adapter._pool_block is True
+    assert session.headers["Connection"] == "close"
+
+
+def test_make_session_from_options():
+    session = requests.Session()
+
+    assert make_session_from_options({"session": session}) is session
+    assert make_session_from_options({"pool_size": 3}).get_adapter(BEE_API_URL)._pool_maxsize == 3
+    assert isinstance(make_session_from_options(None), requests.Session)
+
+
+def test_session_for_call():
+    session = requests.Session()
+
+    with session_for_call({"session": session}, 2) as call_session:
+        assert call_session is session
+
+    with session_for_call({}, 2) as call_session:
+        assert call_session.get_adapter(BEE_API_URL)._pool_maxsize == 2
+
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"url": "chunks/abc", "method": "GET"},
+        {"url": "/bytes", "method": "POST", "data": b"data", "headers": {"content-type": "application/octet-stream"}},
+        {"url": "tags", "method": "GET", "params": {"type": "x", "limit": 10}, "limit": 10, "offset": 2},
+        {"url": "feeds", "method": "GET", "headers": {"accept": "text/plain", "swarm-tag": "1"}},
+    ],
+)
+@pytest.mark.parametrize("sanitise", [True, False])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"baseURL": BEE_API_URL, "onRequest": True},
+        {"baseURL": BEE_API_URL, "timeout": 10, "retry": 2, "headers": {"x-custom": "1"}, "onRequest": True},
+        {"base_url": BEE_API_URL, "on_request": True, "params": {"extra": 1}},
+    ],
+)
+def test_request_template_matches_merged_config(config, sanitise, options):
+    merged_session, template_session = RecordingSession(), RecordingSession()
+
+    http({**options, "session": merged_session}, copy.deepcopy(config), sanitise)
+    http(RequestTemplate({**options, "session": template_session}), copy.deepcopy(config), sanitise)
+
+    assert template_session.calls == merged_session.calls
+
+
+def test_request_template_with_overrides():
+    session = requests.Session()
+    template = RequestTemplate({"baseURL": BEE_API_URL, "timeout": 10, "onRequest": True, "session": session})
+
+    overridden = template.with_overrides({"timeout": 20, "headers": {"x-custom": "1"}})
+
+    assert overridden["timeout"] == 20
+    assert overridden.session is session
+    assert overridden.headers["x-custom"] == "1"
+    assert template["timeout"] == 10
+    assert with_session(template, session) is template
+    assert with_session(template, requests.Session()).session is not session
+
+
+@pytest.mark.parametrize("base_url", ["http://localhost:1633", "http://localhost:1633/", "http://localhost:1633/api/"])
+@pytest.mark.parametrize(
+    "url", ["chunks/abc", "/chunks/abc", "", "bytes?x=1", "a/../b", "./a", "//other/x", "http://x/y", "a;p", "#f"]
+)
+def test_request_template_join_url_matches_urljoin(base_url, url):
+    assert RequestTemplate({"baseURL": base_url}).join_url(url) == urljoin(base_url, url)
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from bee_py.utils.proximity import MAX_PO, ProximityRouter, proximity, xor_distance
+
+ZERO = bytes(32)
+
+
+def with_first_bytes(*first: int) -> bytes:
+    return bytes(first) + bytes(32 - len(first))
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (with_first_bytes(0x80), 0),
+        (with_first_bytes(0x40), 1),
+        (with_first_bytes(0x01), 7),
+        (with_first_bytes(0, 0, 0x01), 23),
+        (with_first_bytes(0, 0, 0, 0x01), MAX_PO),
+        (with_first_bytes(0, 0, 0, 0, 0xFF), MAX_PO),
+        (ZERO, MAX_PO),
+    ],
+)
+def test_proximity(other, expected):
+    assert proximity(ZERO, other) == expected
+    assert proximity(other.hex(), ZERO.hex()) == expected
+
+
+def test_proximity_counts_the_leading_bits_in_common():
+    for _ in range(200):
+        one, other = os.urandom(32), os.urandom(32)
+        bits = f"{int.from_bytes(one, 'big') ^ int.from_bytes(other, 'big'):0256b}"
+
+        assert proximity(one, other) == min(len(bits) - len(bits.lstrip("0")), MAX_PO)
+
+
+def test_xor_distance():
+    assert xor_distance(ZERO, ZERO) == 0
+    assert xor_distance(with_first_bytes(0x80), ZERO) == 2**255
+    assert xor_distance("0x" + with_first_bytes(0x01).hex(), with_first_bytes(0x03)) == 2**249
+
+
+def test_router_ranks_by_xor_distance():
+    overlays = [with_first_bytes(0xF0), "0x" + with_first_bytes(0x10).hex(), with_first_bytes(0x80)]
+    router = ProximityRouter(overlays)
+
+    assert len(router) == 3
+    assert router.rank(with_first_bytes(0x12)) == [1, 2, 0]
+    assert router.rank(with_first_bytes(0xE0)) == [0, 2, 1]
+    assert router.closest(with_first_bytes(0x90)) == 2
+
+    for _ in range(50):
+        address = os.urandom(32)
+        assert router.rank(address) == sorted(range(3), key=lambda index: xor_distance(overlays[index], address))
@@ -0,0 +1,245 @@
+import io
+import threading
+import time
+from typing import Optional
+
+import pytest
+import requests
+
+from bee_py.bee import Bee
+from bee_py.types.type import HedgePolicy, RetryPolicy
+from bee_py.utils.http import RequestTemplate, http
+from bee_py.utils.retry import Retrier, RetryBudget, make_retrier
+
+BEE_API_URL = "http://localhost:12345"
+
+
+def make_response(status_code: int, headers: Optional[dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(b"")
+    response.headers.update(headers or {})
+    return response
+
+
+class ScriptedSession:
+    """Answers the requests with the given statuses or exceptions, repeating the last one."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.responses = []
+        self._lock = threading.Lock()
+
+    def request(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            outcome = self.outcomes[min(len(self.calls), len(self.outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = outcome() if callable(outcome) else make_response(outcome)
+        with self._lock:
+            self.responses.append(response)
+        return response
+
+
+def make_options(session, **options) -> RequestTemplate:
+    return RequestTemplate({"baseURL": BEE_API_URL, "onRequest": True, "session": session, **options})
+
+
+NO_BACKOFF = RetryPolicy(retries=3, backoff=0)
+
+
+def test_retries_idempotent_requests_on_retryable_statuses():
+    session = ScriptedSession(503, 502, 200)
+
+    response = http(make_options(session, retry_policy=NO_BACKOFF), {"url": "chunks/abc", "method": "GET"})
+
+    assert response.status_code == 200
+    assert len(session.calls) == 3
+
+
+def test_returns_the_last_response_when_retries_run_out():
+    session = ScriptedSession(503)
+
+    response = http(make_options(session, retry_policy=NO_BACKOFF), {"url": "chunks/abc", "method": "GET"})
+
+    assert response.status_code == 503
+    assert len(session.calls) == 4
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"url": "stamps/1000/17", "method": "POST"},
+        {"url": "stamps/topup/abc/1000", "method": "PATCH"},
+        {"url": "chunks", "method": "POST", "data": b"data"},
+    ],
+)
+def test_does_not_retry_non_idempotent_requests(config):
+    session = ScriptedSession(503)
+
+    response = http(make_options(session, retry_policy=NO_BACKOFF), config)
+
+    assert response.status_code == 503
+    assert len(session.calls) == 1
+
+
+def test_retries_idempotent_writes():
+    session = ScriptedSession(500, 200)
+
+    http(make_options(session, retry_policy=NO_BACKOFF), {"url": "pins/abc", "method": "DELETE"})
+
+    assert len(session.calls) == 2
+
+
+def test_retries_connection_errors_and_raises_the_last_one():
+    session = ScriptedSession(requests.ConnectionError("refused"), requests.ReadTimeout("slow"))
+
+    with pytest.raises(requests.ReadTimeout):
+        http(make_options(session, retry_policy=NO_BACKOFF), {"url": "chunks/abc", "method": "GET"})
+
+    assert len(session.calls) == 4
+
+
+def test_retry_count_option_uses_the_default_policy(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+    session = ScriptedSession(503, 200)
+
+    response = http({"baseURL": BEE_API_URL, "onRequest": True, "retry": 1, "session": session}, {"url": "chunks/abc"})
+
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+
+
+def test_retry_budget_bounds_retries_across_calls():
+    session = ScriptedSession(503)
+    options = make_options(session, retry_policy=RetryPolicy(retries=3, backoff=0, budget_ratio=0, budget_max=2))
+
+    for _ in range(3):
+        http(options, {"url": "chunks/abc", "method": "GET"})
+
+    # * one request per call and the two retries of the budget
+    assert len(session.calls) == 5
+
+
+def test_retry_budget():
+    budget = RetryBudget(0.5, 2)
+
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+
+    assert budget.withdraw()
+    assert budget.tokens == 0
+
+
+def test_backoff_delay():
+    retrier = Retrier(RetryPolicy(backoff=0.5, max_backoff=3, jitter=False))
+
+    assert [retrier.backoff_delay(attempt) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+    assert retrier.backoff_delay(0, make_response(429, {"Retry-After": "2"})) == 2
+
+    jittered = Retrier(RetryPolicy(backoff=0.5))
+
+    assert all(0 <= jittered.backoff_delay(1) <= 1 for _ in range(100))
+
+
+def test_make_retrier():
+    assert make_retrier({"baseURL": BEE_API_URL}) is None
+    assert make_retrier({"retry": 0, "retry_policy": None, "hedge": None}) is None
+    assert make_retrier({"retry": 2}).policy.retries == 2  # type: ignore[union-attr]
+    assert make_retrier({"retry": 2, "retry_policy": {"retries": 5}}).policy.retries == 5  # type: ignore[union-attr]
+    assert make_retrier({"hedge": {"delay": 0.1}}).hedge.delay == 0.1  # type: ignore[union-attr]
+
+
+def test_request_template_shares_retrier_between_calls():
+    template = make_options(None, retry_policy=NO_BACKOFF)
+
+    assert template.with_overrides({"timeout": 10}).retrier is template.retrier
+    assert template.with_overrides({"retry_policy": RetryPolicy(retries=1)}).retrier is not template.retrier
+
+
+def test_bee_passes_retry_options():
+    bee = Bee(BEE_API_URL, {"retry": 2, "hedge": {"delay": 0.2}})
+
+    assert bee.request_template.retrier.policy.retries == 2  # type: ignore[union-attr]
+    assert bee.request_template.retrier.hedge.delay == 0.2  # type: ignore[union-attr]
+    assert Bee(BEE_API_URL).request_template.retrier is None
+
+
+def slow_response(seconds: float, status_code: int = 200):
+    def respond():
+        time.sleep(seconds)
+        return make_response(status_code)
+
+    return respond
+
+
+def test_hedges_slow_chunk_downloads():
+    session = ScriptedSession(slow_response(1), 200)
+    options = make_options(session, hedge=HedgePolicy(delay=0.01))
+
+    start = time.perf_counter()
+    response = http(options, {"url": "chunks/abc", "method": "GET"})
+
+    assert response.status_code == 200
+    assert time.perf_counter() - start < 0.5
+    assert len(session.calls) == 2
+
+
+def test_does_not_hedge_fast_responses_and_other_endpoints():
+    session = ScriptedSession(200)
+    options = make_options(session, hedge=HedgePolicy(delay=0.5))
+
+    http(options, {"url": "feeds/owner/topic", "method": "GET"})
+    assert len(session.calls) == 1
+
+    slow_session = ScriptedSession(slow_response(0.05))
+    options = make_options(slow_session, hedge=HedgePolicy(delay=0.01))
+
+    http(options, {"url": "stamps", "method": "GET"})
+    http(options, {"url": "chunks", "method": "POST", "data": b"data"})
+    assert len(slow_session.calls) == 2
+
+
+def test_closes_the_dropped_hedged_responses():
+    session = ScriptedSession(slow_response(0.1, 503), slow_response(0.2, 503))
+    options = make_options(session, hedge=HedgePolicy(delay=0.01))
+
+    response = http(options, {"url": "chunks/abc", "method": "GET"})
+
+    assert response.status_code == 503
+    assert [r.raw.closed for r in session.responses] == [False, True]
+
+
+def test_hedge_delay_follows_observed_latencies():
+    retrier = Retrier(hedge=HedgePolicy(percentile=0.9, min_delay=0.05, min_samples=10))
+
+    for latency in range(1, 10):
+        retrier.latencies.record(latency / 10)
+    assert retrier.hedge_delay() is None
+
+    retrier.latencies.record(1.0)
+    assert retrier.hedge_delay() == 1.0
+
+    retrier.latencies = type(retrier.latencies)()
+    for _ in range(10):
+        retrier.latencies.record(0.001)
+    assert retrier.hedge_delay() == 0.05
+
+
+@pytest.mark.asyncio
+async def test_async_retries_close_the_released_responses():
+    session = ScriptedSession(503, 200)
+
+    async def send(config):
+        return session.request(**config)
+
+    response = await Retrier(NO_BACKOFF).send_async(send, {"url": "chunks/abc", "method": "GET"})
+
+    assert response.status_code == 200
+    assert [r.raw.closed for r in session.responses] == [True, False]
@@ -0,0 +1,144 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+import requests
+
+from bee_py.bee import Bee
+from bee_py.utils.http import RequestTemplate, http
+from bee_py.utils.singleflight import SingleFlight, get_request_key
+
+BEE_API_URL = "http://localhost:12345"
+REFERENCE = "ca6357a08e317d15ec560fef34e4c45f8f19f01c372aa70f1da72bfa7f1a4338"
+
+
+class BlockingSession:
+    """Holds every request until it is released, answering with its content or error."""
+
+    def __init__(self, content: bytes = b"data", error: Optional[Exception] = None):
+        self.content = content
+        self.error = error
+        self.calls = []
+        self.released = threading.Event()
+        self._lock = threading.Lock()
+
+    def request(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+        self.released.wait(5)
+        if self.error:
+            raise self.error
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.content
+        return response
+
+
+def send_concurrently(session, sends):
+    started = threading.Barrier(len(sends) + 1)
+
+    def start_and_send(send):
+        started.wait()
+        return send()
+
+    with ThreadPoolExecutor(len(sends)) as executor:
+        futures = [executor.submit(start_and_send, send) for send in sends]
+        started.wait()
+        # * lets the started requests reach the session or the flight they wait for
+        time.sleep(0.1)
+        session.released.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def make_template(session, **options) -> RequestTemplate:
+    return RequestTemplate({"baseURL": BEE_API_URL, "onRequest": True, "session": session, **options})
+
+
+def test_collapses_concurrent_identical_gets():
+    session = BlockingSession()
+    template = make_template(session)
+
+    responses = send_concurrently(
+        session, [lambda: http(template, {"url": f"chunks/{REFERENCE}", "method": "GET"})] * 8
+    )
+
+    assert len(session.calls) == 1
+    assert all(response is responses[0] for response in responses)
+    assert len(template.flights) == 0  # type: ignore[arg-type]
+
+    http(template, {"url": f"chunks/{REFERENCE}", "method": "GET"})
+    assert len(session.calls) == 2
+
+
+def test_shares_the_error_of_the_request():
+    session = BlockingSession(error=requests.ConnectionError("refused"))
+    template = make_template(session)
+
+    errors = send_concurrently(session, [lambda: http(template, {"url": "feeds/owner/topic", "method": "GET"})] * 8)
+
+    assert len(session.calls) == 1
+    assert all(isinstance(error, requests.ConnectionError) for error in errors)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"url": "bzz/abc/", "method": "GET"},
+        {"url": f"bytes/{REFERENCE}", "method": "GET", "stream": True},
+        {"url": "stamps/1000/17", "method": "POST"},
+    ],
+)
+def test_does_not_collapse_other_requests(config):
+    session = BlockingSession()
+
+    send_concurrently(session, [lambda: http(make_template(session), config)] * 3)
+
+    assert len(session.calls) == 3
+
+
+def test_can_be_turned_off():
+    session = BlockingSession()
+    template = make_template(session, coalesce=False)
+
+    send_concurrently(session, [lambda: http(template, {"url": f"chunks/{REFERENCE}", "method": "GET"})] * 3)
+
+    assert template.flights is None
+    assert len(session.calls) == 3
+
+
+def test_request_key():
+    config = {"url": f"{BEE_API_URL}/feeds/a/b", "params": {"type": "sequence"}, "headers": {"Accept": "*/*"}}
+
+    assert get_request_key(config) == get_request_key({**config, "method": "get", "headers": {"Accept": "*/*"}})
+    assert get_request_key(config) != get_request_key({**config, "params": {"type": "sequence", "at": 1}})
+    assert get_request_key(config) != get_request_key({**config, "params": {"type": "epoch"}})
+    assert get_request_key(config) != get_request_key({**config, "headers": {"swarm-cache": "false"}})
+    # * values that can not be hashed are compared by their repr
+    assert get_request_key({**config, "params": {"tags": [1]}}) != get_request_key({**config, "params": {"tags": [2]}})
+
+
+def test_is_coalesced():
+    flights = SingleFlight(BEE_API_URL)
+
+    assert flights.is_coalesced({"url": f"{BEE_API_URL}/stamps/{REFERENCE}"})
+    assert flights.is_coalesced({"url": f"{BEE_API_URL}/bytes/{REFERENCE}", "method": "GET"})
+    assert not flights.is_coalesced({"url": f"{BEE_API_URL}/chunks", "method": "POST", "data": b"data"})
+    assert not flights.is_coalesced({"url": f"{BEE_API_URL}/tags/1"})
+    assert flights.is_coalesced({"url": f"{BEE_API_URL}/chunks?x=1"})
+    assert not flights.is_coalesced({"url": f"{BEE_API_URL}/chunks/{REFERENCE}", "stream": True})
+
+
+def test_bee_calls_share_the_flights():
+    session = BlockingSession(b"chunk")
+    bee = Bee(BEE_API_URL, {"session": session})
+
+    # * calls with their own options are collapsed with the ones without
+    calls = [lambda: bee.download_chunk(REFERENCE), lambda: bee.download_chunk(REFERENCE, {"timeout": 10})]
+    results = send_concurrently(session, calls * 4)
+
+    assert len(session.calls) == 1
+    assert all(result.data == b"chunk" for result in results)
+    assert bee.request_template.with_overrides({"timeout": 10}).flights is bee.request_template.flights
+    assert Bee(BEE_API_URL, {"coalesce": False}).request_template.flights is None